@@ -6,9 +6,9 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
-from .database import get_db, engine, Base
+from .database import get_db, engine, Base, SessionLocal
 from .models import User, Challenge, ChallengeParticipant, WeeklyRanking, ChatMessage, Task
 from .schemas import (
     UserCreate, UserResponse, ChallengeCreate, ChallengeResponse,
@@ -17,8 +17,15 @@ from .schemas import (
 )
 from .services import (
     ChallengeService, UserService, RankingService, 
-    ChatService, TaskService, ContractService
+    ChatService, TaskService, ContractService, MerkleService
 )
+from .services.algod_client import close_algod_client
+from .services.params_cache import get_params_cache
+from .services.completion_batcher import get_completion_batcher
+from .services.outbox_service import OutboxRelay
+from .services.confirmation_tracker import get_confirmation_tracker
+from .services.chain_indexer import ChainIndexer
+from .services.event_indexer import EventIndexer
 from .websocket_manager import WebSocketManager
 from .mock_data import (
     get_mock_users, get_mock_challenges, get_mock_participants,
@@ -53,6 +60,10 @@ ranking_service = RankingService()
 chat_service = ChatService()
 task_service = TaskService()
 contract_service = ContractService()
+merkle_service = MerkleService()
+outbox_relay = OutboxRelay()
+chain_indexer = ChainIndexer(contract_service.app_id)
+event_indexer = EventIndexer(contract_service.app_id)
 
 security = HTTPBearer()
 
@@ -197,6 +208,31 @@ async def get_weekly_rankings(
     """Get weekly rankings for a challenge."""
     return await ranking_service.get_weekly_rankings(challenge_id, db)
 
+@app.get("/challenges/{challenge_id}/leaderboard")
+async def get_leaderboard_summary(
+    challenge_id: str,
+    db: Session = Depends(get_db)
+):
+    """Get leaderboard totals for a challenge from the contract."""
+    summary = await ranking_service.get_leaderboard_summary(challenge_id, db)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Challenge not found")
+    return summary
+
+@app.get("/challenges/{challenge_id}/events")
+async def get_challenge_events(
+    challenge_id: str,
+    after_round: int = 0,
+    name: Optional[str] = None,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """Get contract events of a challenge (joins, completions, messages, eliminations, payouts)."""
+    challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+    if not challenge:
+        raise HTTPException(status_code=404, detail="Challenge not found")
+    return event_indexer.list_events(db, challenge.contract_id, after_round, name, limit)
+
 @app.post("/challenges/{challenge_id}/process-elimination")
 async def process_weekly_elimination(
     challenge_id: str,
@@ -255,6 +291,43 @@ async def complete_task(
     """Mark a task as completed."""
     return await task_service.complete_task(task_id, current_user, db)
 
+# Health data endpoints
+@app.post("/challenges/{challenge_id}/health-roots")
+async def commit_health_roots(
+    challenge_id: str,
+    day: date,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Commit the daily health data Merkle roots of a challenge on chain (admin only)."""
+    challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+    if not challenge:
+        raise HTTPException(status_code=404, detail="Challenge not found")
+
+    # Check if user is the creator (admin check)
+    if challenge.creator_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Only challenge creator can commit health roots")
+
+    try:
+        roots = await merkle_service.commit_day(challenge_id, day, db)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return [
+        {"user_id": r.user_id, "day": r.day, "root": r.root, "sample_count": r.sample_count}
+        for r in roots
+    ]
+
+@app.get("/health-data/{sample_id}/proof")
+async def get_health_data_proof(sample_id: str, db: Session = Depends(get_db)):
+    """Prove that a health sample is included in its committed daily root."""
+    try:
+        proof = await merkle_service.get_proof(sample_id, db)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if not proof:
+        raise HTTPException(status_code=404, detail="Health sample not found")
+    return proof
+
 # Health check
 @app.get("/health")
 async def health_check():
@@ -266,18 +339,52 @@ async def health_check():
 async def startup_event():
     """Start background tasks on startup."""
     asyncio.create_task(process_weekly_eliminations())
+    asyncio.create_task(commit_daily_health_roots())
+    await get_params_cache().start()
+    await get_confirmation_tracker().start()
+    await outbox_relay.start()
+    if contract_service.app_id:
+        await chain_indexer.start()
+        await event_indexer.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled Algorand connections on shutdown."""
+    await event_indexer.stop()
+    await chain_indexer.stop()
+    await outbox_relay.stop()
+    await get_completion_batcher().flush_all()
+    await get_confirmation_tracker().stop()
+    await get_params_cache().stop()
+    await close_algod_client()
 
 async def process_weekly_eliminations():
     """Background task to process weekly eliminations."""
     while True:
+        db = SessionLocal()
         try:
-            # Check for challenges that need weekly processing
-            # This would be implemented in the ranking service
-            await ranking_service.process_due_eliminations()
-            await asyncio.sleep(3600)  # Check every hour
+            # Due challenges go to the contract as one outbox event per call group
+            await ranking_service.process_due_eliminations(db)
         except Exception as e:
             print(f"Error processing eliminations: {e}")
-            await asyncio.sleep(3600)
+        finally:
+            db.close()
+        await asyncio.sleep(3600)  # Check every hour
+
+async def commit_daily_health_roots():
+    """Background task committing yesterday's health data roots of active challenges."""
+    while True:
+        db = SessionLocal()
+        try:
+            yesterday = datetime.utcnow().date() - timedelta(days=1)
+            for challenge in db.query(Challenge).filter(Challenge.status == "active").all():
+                # Unchanged roots are skipped, so re-running is cheap
+                await merkle_service.commit_day(challenge.id, yesterday, db)
+        except Exception as e:
+            print(f"Error committing health roots: {e}")
+        finally:
+            db.close()
+        await asyncio.sleep(3600)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,5 +1,5 @@
 # SQLAlchemy models for challenge platform
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, Boolean, Text, ForeignKey, Float, LargeBinary
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -126,6 +126,8 @@ class Task(Base):
     title = Column(String, nullable=False)
     description = Column(Text)
     points = Column(Integer, default=1)
+    required_value = Column(Integer)  # e.g. 10000 steps, mirrors on-chain Task
+    data_type = Column(String)  # "steps", "calories", "workout_duration"
     due_date = Column(DateTime)
     is_completed = Column(Boolean, default=False)
     completed_by = Column(String, ForeignKey("users.id"))
@@ -148,3 +150,81 @@ class TaskCompletion(Base):
     # Relationships
     task = relationship("Task")
     user = relationship("User", back_populates="task_completions")
+
+class HealthData(Base):
+    __tablename__ = "health_data"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    challenge_id = Column(String, ForeignKey("challenges.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    data_type = Column(String, nullable=False)  # "steps", "calories", "heart_rate", etc.
+    value = Column(Integer, nullable=False)
+    recorded_at = Column(DateTime, nullable=False, index=True)
+    source = Column(String)  # "google_fit", "apple_health", "manual"
+    verification_hash = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # Relationships
+    challenge = relationship("Challenge")
+    user = relationship("User")
+
+class HealthRoot(Base):
+    __tablename__ = "health_roots"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    challenge_id = Column(String, ForeignKey("challenges.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    day = Column(Integer, nullable=False)  # days since the unix epoch (UTC)
+    root = Column(String, nullable=False)  # hex encoded Merkle root committed on chain
+    sample_count = Column(Integer, nullable=False)  # leading samples of the day covered by the root
+    committed_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class OutboxEvent(Base):
+    __tablename__ = "contract_outbox"
+    
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    idempotency_key = Column(String, unique=True, nullable=False)
+    method = Column(String, nullable=False)  # contract method, e.g. "complete_task"
+    app_id = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)  # JSON encoded ContractService arguments
+    status = Column(String, nullable=False, default="pending", index=True)  # pending, in_flight, confirmed, failed
+    attempts = Column(Integer, default=0)
+    claimed_at = Column(DateTime)  # when a relay last took the event in flight
+    transaction_id = Column(String)  # last submitted transaction(s), comma separated
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    processed_at = Column(DateTime)
+
+class ChainBox(Base):
+    __tablename__ = "chain_boxes"
+    
+    # Raw contract box contents mirrored by the chain indexer
+    app_id = Column(BigInteger, primary_key=True)
+    name = Column(LargeBinary, primary_key=True)
+    # BoxMap key prefix, one of INDEXED_BOX_MAPS in services/chain_indexer.py:
+    # challenge_metadata, challenge_states, participants, elimination_trackers,
+    # completion_buckets, weekly_rankings or deposited
+    box_map = Column(String, nullable=False)
+    value = Column(LargeBinary, nullable=False)
+    round = Column(BigInteger, nullable=False)
+
+class ChainEvent(Base):
+    __tablename__ = "chain_events"
+    
+    # Append-only ARC-28 events logged by the platform contract
+    app_id = Column(BigInteger, primary_key=True)
+    round = Column(BigInteger, primary_key=True)
+    position = Column(Integer, primary_key=True)  # top-level transaction index in the block
+    log_index = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, index=True)  # e.g. ParticipantJoined, PoolPaid
+    challenge_id = Column(BigInteger, nullable=False, index=True)  # on-chain challenge id
+    payload = Column(Text, nullable=False)  # JSON encoded event fields
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class ChainCursor(Base):
+    __tablename__ = "chain_cursors"
+    
+    name = Column(String, primary_key=True)  # e.g. "box_indexer:<app_id>", "event_indexer:<app_id>"
+    round = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
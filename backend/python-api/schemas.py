@@ -121,6 +121,8 @@ class TaskBase(BaseModel):
     title: str
     description: Optional[str] = None
     points: int = 1
+    required_value: Optional[int] = None
+    data_type: Optional[str] = None
     due_date: Optional[datetime] = None
 
 class TaskCreate(TaskBase):
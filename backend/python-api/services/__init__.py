@@ -5,6 +5,9 @@ from .user_service import UserService
 from .ranking_service import RankingService
 from .chat_service import ChatService
 from .task_service import TaskService
+from .health_evaluation_service import HealthEvaluationService
+from .outbox_service import OutboxService
+from .merkle_service import MerkleService
 
 __all__ = [
     "ChallengeService",
@@ -12,5 +15,8 @@ __all__ = [
     "UserService",
     "RankingService",
     "ChatService",
-    "TaskService"
+    "TaskService",
+    "HealthEvaluationService",
+    "OutboxService",
+    "MerkleService"
 ]
@@ -0,0 +1,199 @@
+# Shared async Algorand client with connection pooling and bounded concurrency
+from algosdk import encoding
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.models import SimulateRequest
+from algosdk.v2client import algod
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import base64
+import os
+
+import httpx
+
+# Algod configuration from environment
+ALGOD_ADDRESS = os.getenv("ALGORAND_API_URL", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+ALGOD_MAX_CONNECTIONS = int(os.getenv("ALGOD_MAX_CONNECTIONS", "20"))
+ALGOD_MAX_CONCURRENCY = int(os.getenv("ALGOD_MAX_CONCURRENCY", "16"))
+ALGOD_TIMEOUT = float(os.getenv("ALGOD_TIMEOUT", "10"))
+
+class AlgodHTTPError(Exception):
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+class AsyncAlgodClient:
+    def __init__(
+        self,
+        algod_address: str = ALGOD_ADDRESS,
+        algod_token: str = ALGOD_TOKEN,
+        max_connections: int = ALGOD_MAX_CONNECTIONS,
+        max_concurrency: int = ALGOD_MAX_CONCURRENCY,
+        timeout: float = ALGOD_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.algod_address = algod_address.rstrip("/")
+        self.timeout = timeout
+
+        # Synchronous algosdk client for calls that have no async equivalent
+        self.sync_client = algod.AlgodClient(algod_token, algod_address)
+
+        # One keep-alive connection pool shared by every request
+        self._http = httpx.AsyncClient(
+            base_url=self.algod_address,
+            headers={"X-Algo-API-Token": algod_token} if algod_token else {},
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            transport=transport
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+        content_type: str = "application/x-binary"
+    ) -> Dict[str, Any]:
+        """Perform an algod REST request through the shared pool."""
+
+        headers = {"Content-Type": content_type} if content is not None else None
+
+        async with self._semaphore:
+            response = await asyncio.wait_for(
+                self._http.request(method, path, params=params, content=content, headers=headers),
+                timeout or self.timeout
+            )
+
+        if response.status_code >= 400:
+            raise AlgodHTTPError(
+                response.status_code,
+                f"algod {method} {path} failed ({response.status_code}): {response.text}"
+            )
+
+        return response.json()
+
+    async def run_sync(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Run a blocking algosdk call in a worker thread with the same limits."""
+
+        async with self._semaphore:
+            return await asyncio.wait_for(
+                asyncio.to_thread(func, *args, **kwargs),
+                timeout or self.timeout
+            )
+
+    async def status(self) -> Dict[str, Any]:
+        """Get the current node status."""
+
+        return await self.request("GET", "/v2/status")
+
+    async def status_after_block(self, round_num: int, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Wait for the round after ``round_num`` and return the node status."""
+
+        # algod holds this request open for up to a minute
+        return await self.request(
+            "GET", f"/v2/status/wait-for-block-after/{round_num}", timeout=timeout or 60.0
+        )
+
+    async def suggested_params(self) -> SuggestedParams:
+        """Get suggested parameters for building transactions."""
+
+        params = await self.request("GET", "/v2/transactions/params")
+
+        return SuggestedParams(
+            fee=params["min-fee"],
+            first=params["last-round"],
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=True,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"]
+        )
+
+    async def send_transactions(self, signed_txns: List[Any]) -> str:
+        """Submit a signed transaction group and return the first transaction ID."""
+
+        payload = b"".join(
+            base64.b64decode(encoding.msgpack_encode(txn)) for txn in signed_txns
+        )
+        response = await self.request("POST", "/v2/transactions", content=payload)
+        return response["txId"]
+
+    async def simulate(self, request: SimulateRequest) -> Dict[str, Any]:
+        """Simulate transaction groups without submitting them."""
+
+        payload = base64.b64decode(encoding.msgpack_encode(request))
+        return await self.request(
+            "POST", "/v2/transactions/simulate", content=payload, content_type="application/msgpack"
+        )
+
+    async def pending_transaction_info(self, txid: str) -> Dict[str, Any]:
+        """Get pending or recently confirmed transaction information."""
+
+        return await self.request("GET", f"/v2/transactions/pending/{txid}")
+
+    async def block_txids(self, round_num: int) -> List[str]:
+        """Get the top-level transaction IDs confirmed in a round."""
+
+        response = await self.request("GET", f"/v2/blocks/{round_num}/txids")
+        return response["blockTxids"]
+
+    async def block(self, round_num: int) -> Dict[str, Any]:
+        """Get a block with its transactions."""
+
+        return await self.request("GET", f"/v2/blocks/{round_num}", params={"format": "json"})
+
+    async def application_info(self, app_id: int) -> Dict[str, Any]:
+        """Get application parameters and global state."""
+
+        return await self.request("GET", f"/v2/applications/{app_id}")
+
+    async def application_boxes(self, app_id: int) -> Dict[str, Any]:
+        """List the box names of an application."""
+
+        return await self.request("GET", f"/v2/applications/{app_id}/boxes")
+
+    async def application_box_by_name(self, app_id: int, box_name: bytes) -> Dict[str, Any]:
+        """Get a single application box by name."""
+
+        encoded_name = "b64:" + base64.b64encode(box_name).decode()
+        return await self.request(
+            "GET", f"/v2/applications/{app_id}/box", params={"name": encoded_name}
+        )
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+
+        await self._http.aclose()
+
+# Process-wide client shared by every service
+_shared_client: Optional[AsyncAlgodClient] = None
+
+def get_algod_client() -> AsyncAlgodClient:
+    """Get the shared async Algorand client, creating it on first use."""
+    global _shared_client
+
+    if _shared_client is None:
+        _shared_client = AsyncAlgodClient()
+
+    return _shared_client
+
+async def close_algod_client() -> None:
+    """Close the shared async Algorand client."""
+    global _shared_client
+
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
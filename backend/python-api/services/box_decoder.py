@@ -0,0 +1,261 @@
+# Fast decoders for ChallengePlatform ARC-4 box contents
+#
+# Fixed-width structs (Participant, WeeklyRanking) are decoded as NumPy
+# structured arrays laid directly over the box bytes, so a whole
+# DynamicArray box decodes in one zero-copy call. Structs holding strings
+# (Challenge, ChatMessage) read their fixed head with one unpack and slice
+# strings out at the ARC-4 offsets.
+from algosdk import encoding
+from typing import Any, Dict, List, Tuple, Union
+import struct
+
+import numpy as np
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# ARC-4 length prefix of a DynamicArray / String
+LENGTH_PREFIX = 2
+
+# Participant: Address, UInt64, UInt64, Bool, UInt64, UInt64 (65 bytes, unaligned)
+PARTICIPANT_DTYPE = np.dtype([
+    ("address", "V32"),
+    ("stake_amount", ">u8"),
+    ("joined_at", ">u8"),
+    ("is_active", "u1"),
+    ("tasks_completed", ">u8"),
+    ("current_rank", ">u8"),
+])
+
+# WeeklyRanking: UInt64, Address, UInt64 (48 bytes)
+WEEKLY_RANKING_DTYPE = np.dtype([
+    ("week", ">u8"),
+    ("eliminated_participant", "V32"),
+    ("timestamp", ">u8"),
+])
+
+# ChallengeMetadata head: name offset, description offset, stake_amount,
+# max_participants, creator, start_time, end_time
+CHALLENGE_METADATA_HEAD = struct.Struct(">HHQQ32sQQ")
+
+# ChallengeState: total_staked, current_week, is_active (17 bytes)
+CHALLENGE_STATE = struct.Struct(">QQB")
+
+# Challenge head (get_challenge_info return value): challenge_id, name offset, description offset, stake_amount,
+# max_participants, creator, start_time, end_time, total_staked, is_active, current_week
+CHALLENGE_HEAD = struct.Struct(">QHHQQ32sQQQBQ")
+
+# EliminationTracker: active_count, min_tasks (16 bytes)
+ELIMINATION_TRACKER = struct.Struct(">QQ")
+
+# CompletionBucket: count, next lower and next higher non-empty task count (24 bytes)
+COMPLETION_BUCKET = struct.Struct(">QQQ")
+# Bucket link without a non-empty neighbour on that side
+NO_BUCKET = 2**64 - 1
+
+# LeaderboardSummary: participant_count, active_count, min_tasks, total_staked,
+# current_week, is_active, ranking_count, task_count, message_count (65 bytes)
+LEADERBOARD_SUMMARY = struct.Struct(">QQQQQBQQQ")
+
+# ChatMessage head: message_id, sender, content offset, timestamp, is_system_message
+CHAT_MESSAGE_HEAD_DTYPE = np.dtype([
+    ("message_id", ">u8"),
+    ("sender", "V32"),
+    ("content_offset", ">u2"),
+    ("timestamp", ">u8"),
+    ("is_system_message", "u1"),
+])
+
+# ARC-4 encodes a lone Bool in the top bit of its byte
+BOOL_MASK = 0x80
+
+def _array_length(data: Buffer) -> int:
+    return int.from_bytes(bytes(data[:LENGTH_PREFIX]), "big")
+
+def decode_static_array(data: Buffer, dtype: np.dtype) -> np.ndarray:
+    """Decode a DynamicArray of fixed-width structs without copying."""
+    count = _array_length(data)
+    return np.frombuffer(data, dtype=dtype, count=count, offset=LENGTH_PREFIX)
+
+def decode_participants(data: Buffer) -> np.ndarray:
+    """Decode a DynamicArray[Participant] into a PARTICIPANT_DTYPE array."""
+    return decode_static_array(data, PARTICIPANT_DTYPE)
+
+def decode_participant(data: Buffer) -> np.void:
+    """Decode a single Participant box into a PARTICIPANT_DTYPE record."""
+    return np.frombuffer(data, dtype=PARTICIPANT_DTYPE, count=1)[0]
+
+def decode_weekly_rankings(data: Buffer) -> np.ndarray:
+    """Decode a weekly_rankings box into a WEEKLY_RANKING_DTYPE array."""
+    return decode_static_array(data, WEEKLY_RANKING_DTYPE)
+
+def decode_uint64(data: Buffer) -> int:
+    """Decode an arc4.UInt64 box value."""
+    return int.from_bytes(bytes(data[:8]), "big")
+
+def _string_at(view: memoryview, offset: int) -> str:
+    length = int.from_bytes(view[offset:offset + LENGTH_PREFIX], "big")
+    start = offset + LENGTH_PREFIX
+    return bytes(view[start:start + length]).decode("utf-8")
+
+def decode_challenge(data: Buffer) -> Dict[str, Any]:
+    """Decode a Challenge struct using its fixed head and string offsets."""
+    view = memoryview(data)
+    (
+        challenge_id, name_offset, description_offset, stake_amount,
+        max_participants, creator, start_time, end_time, total_staked,
+        is_active, current_week
+    ) = CHALLENGE_HEAD.unpack_from(view)
+
+    return {
+        "challenge_id": challenge_id,
+        "name": _string_at(view, name_offset),
+        "description": _string_at(view, description_offset),
+        "stake_amount": stake_amount,
+        "max_participants": max_participants,
+        "creator": encoding.encode_address(creator),
+        "start_time": start_time,
+        "end_time": end_time,
+        "total_staked": total_staked,
+        "is_active": bool(is_active & BOOL_MASK),
+        "current_week": current_week,
+    }
+
+def decode_challenge_metadata(data: Buffer) -> Dict[str, Any]:
+    """Decode a write-once ChallengeMetadata box."""
+    view = memoryview(data)
+    (
+        name_offset, description_offset, stake_amount, max_participants,
+        creator, start_time, end_time
+    ) = CHALLENGE_METADATA_HEAD.unpack_from(view)
+
+    return {
+        "name": _string_at(view, name_offset),
+        "description": _string_at(view, description_offset),
+        "stake_amount": stake_amount,
+        "max_participants": max_participants,
+        "creator": encoding.encode_address(creator),
+        "start_time": start_time,
+        "end_time": end_time,
+    }
+
+def decode_challenge_state(data: Buffer) -> Dict[str, Any]:
+    """Decode a fixed-width ChallengeState box."""
+    total_staked, current_week, is_active = CHALLENGE_STATE.unpack_from(data)
+    return {
+        "total_staked": total_staked,
+        "current_week": current_week,
+        "is_active": bool(is_active & BOOL_MASK),
+    }
+
+def decode_elimination_tracker(data: Buffer) -> Dict[str, Any]:
+    """Decode an EliminationTracker box."""
+    active_count, min_tasks = ELIMINATION_TRACKER.unpack_from(data)
+    return {"active_count": active_count, "min_tasks": min_tasks}
+
+def decode_completion_bucket(data: Buffer) -> Dict[str, Any]:
+    """Decode a CompletionBucket box; missing neighbours are None."""
+    count, lower, higher = COMPLETION_BUCKET.unpack_from(data)
+    return {
+        "count": count,
+        "lower": None if lower == NO_BUCKET else lower,
+        "higher": None if higher == NO_BUCKET else higher,
+    }
+
+def decode_leaderboard_summary(data: Buffer) -> Dict[str, Any]:
+    """Decode a LeaderboardSummary returned by get_leaderboard_summary."""
+    (
+        participant_count, active_count, min_tasks, total_staked, current_week,
+        is_active, ranking_count, task_count, message_count
+    ) = LEADERBOARD_SUMMARY.unpack_from(data)
+
+    return {
+        "participant_count": participant_count,
+        "active_count": active_count,
+        "eliminated_count": participant_count - active_count,
+        "min_tasks": min_tasks,
+        "total_staked": total_staked,
+        "current_week": current_week,
+        "is_active": bool(is_active & BOOL_MASK),
+        "ranking_count": ranking_count,
+        "task_count": task_count,
+        "message_count": message_count,
+    }
+
+def decode_chat_messages(data: Buffer) -> Tuple[np.ndarray, List[str]]:
+    """Decode a DynamicArray[ChatMessage] into fixed heads and message contents.
+
+    Element offsets are read as one vector, all heads are gathered in a
+    single fancy-indexing pass, and only the contents are sliced per message.
+    """
+    view = memoryview(data)
+    raw = np.frombuffer(data, dtype=np.uint8)
+    count = _array_length(data)
+
+    offsets = np.frombuffer(data, dtype=">u2", count=count, offset=LENGTH_PREFIX).astype(np.int64)
+    starts = offsets + LENGTH_PREFIX
+    head_size = CHAT_MESSAGE_HEAD_DTYPE.itemsize
+    head_bytes = raw[starts[:, np.newaxis] + np.arange(head_size)]
+    heads = head_bytes.reshape(-1).view(CHAT_MESSAGE_HEAD_DTYPE)
+
+    content_starts = starts + heads["content_offset"].astype(np.int64)
+    contents = [_string_at(view, int(start)) for start in content_starts]
+
+    return heads, contents
+
+def is_true(flags: np.ndarray) -> np.ndarray:
+    """Convert raw ARC-4 Bool bytes into a boolean array."""
+    return (flags & BOOL_MASK) != 0
+
+def participants_to_dicts(participants: np.ndarray) -> List[Dict[str, Any]]:
+    """Convert a participant array into API-friendly dicts."""
+    return [
+        {
+            "address": encoding.encode_address(bytes(p["address"])),
+            "stake_amount": int(p["stake_amount"]),
+            "joined_at": int(p["joined_at"]),
+            "is_active": bool(p["is_active"] & BOOL_MASK),
+            "tasks_completed": int(p["tasks_completed"]),
+            "current_rank": int(p["current_rank"]),
+        }
+        for p in participants
+    ]
+
+def weekly_rankings_to_dicts(rankings: np.ndarray) -> List[Dict[str, Any]]:
+    """Convert a weekly ranking array into API-friendly dicts."""
+    return [
+        {
+            "week": int(r["week"]),
+            "eliminated_participant": encoding.encode_address(bytes(r["eliminated_participant"])),
+            "timestamp": int(r["timestamp"]),
+        }
+        for r in rankings
+    ]
+
+def _benchmark(participant_count: int = 30, iterations: int = 2000) -> None:
+    """Compare decoding a participants box against algosdk ABI decoding."""
+    import timeit
+    from algosdk import abi, account
+
+    participants_type = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)[]")
+    rows = [
+        [account.generate_account()[1], 950000, 1700000000 + i, True, i % 7, i + 1]
+        for i in range(participant_count)
+    ]
+    box = participants_type.encode(rows)
+
+    assert participants_to_dicts(decode_participants(box))[3]["tasks_completed"] == rows[3][4]
+
+    abi_time = timeit.timeit(lambda: participants_type.decode(box), number=iterations)
+    numpy_time = timeit.timeit(lambda: decode_participants(box), number=iterations)
+    column_time = timeit.timeit(
+        lambda: decode_participants(box)["tasks_completed"].min(), number=iterations
+    )
+
+    print(f"Participants box: {participant_count} entries, {len(box)} bytes")
+    print(f"algosdk ABI decode:     {abi_time / iterations * 1e6:9.2f} us/box")
+    print(f"structured array view:  {numpy_time / iterations * 1e6:9.2f} us/box")
+    print(f"view + min(tasks):      {column_time / iterations * 1e6:9.2f} us/box")
+    print(f"speedup:                {abi_time / numpy_time:9.1f}x")
+
+if __name__ == "__main__":
+    _benchmark()
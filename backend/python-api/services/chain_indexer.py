@@ -0,0 +1,266 @@
+# Chain indexer mirroring ChallengePlatform contract boxes into the database
+from sqlalchemy.orm import Session
+from algosdk import encoding
+from typing import Any, Dict, Iterable, List, Optional, Set
+import asyncio
+import base64
+
+from ..database import SessionLocal
+from ..models import ChainBox, ChainCursor
+from .algod_client import AlgodHTTPError, AsyncAlgodClient, get_algod_client
+from .box_decoder import (
+    decode_challenge_metadata, decode_challenge_state, decode_completion_bucket, decode_elimination_tracker,
+    decode_participant, decode_uint64, decode_weekly_rankings
+)
+
+# Encoded key size of each key kind; participant keys are (challenge_id, address)
+# and bucket keys (challenge_id, tasks_completed)
+KEY_SIZES = {"uint64": 8, "address": 32, "participant": 40, "bucket": 16}
+
+# Box maps with one box per participant, stored grouped by challenge id
+GROUPED_BOX_MAPS = {"participants"}
+
+# BoxMap key prefix -> (box map name, key kind)
+INDEXED_BOX_MAPS = {
+    b"challenge_metadata": ("challenge_metadata", "uint64"),
+    b"challenge_states": ("challenge_states", "uint64"),
+    b"participants": ("participants", "participant"),
+    b"elimination_trackers": ("elimination_trackers", "uint64"),
+    b"completion_buckets": ("completion_buckets", "bucket"),
+    b"weekly_rankings": ("weekly_rankings", "uint64"),
+    b"deposited": ("deposited", "address"),
+}
+
+def decode_box_key(key_kind: str, key: bytes) -> Any:
+    """Decode a BoxMap key into a challenge id, an address, or a (challenge id, address / task count) pair."""
+    if key_kind == "address":
+        return encoding.encode_address(key)
+    if key_kind == "participant":
+        return int.from_bytes(key[:8], "big"), encoding.encode_address(key[8:])
+    if key_kind == "bucket":
+        return int.from_bytes(key[:8], "big"), int.from_bytes(key[8:], "big")
+    return int.from_bytes(key, "big")
+
+def decode_box_value(box_map: str, value: bytes) -> Any:
+    """Decode raw box contents.
+
+    Participants and ranking arrays stay as structured records over the box
+    bytes; see box_decoder for converting them into dicts.
+    """
+    if box_map == "challenge_metadata":
+        return decode_challenge_metadata(value)
+    if box_map == "challenge_states":
+        return decode_challenge_state(value)
+    if box_map == "participants":
+        return decode_participant(value)
+    if box_map == "elimination_trackers":
+        return decode_elimination_tracker(value)
+    if box_map == "completion_buckets":
+        return decode_completion_bucket(value)
+    if box_map == "weekly_rankings":
+        return decode_weekly_rankings(value)
+    return decode_uint64(value)
+
+def split_box_name(name: bytes) -> Optional[tuple]:
+    """Split a box name into (box map, key kind, key bytes) for indexed maps."""
+    for prefix, (box_map, key_kind) in INDEXED_BOX_MAPS.items():
+        key = name[len(prefix):]
+        if name.startswith(prefix) and len(key) == KEY_SIZES[key_kind]:
+            return box_map, key_kind, key
+    return None
+
+class ChainStateStore:
+    def __init__(self):
+        # box map -> decoded key -> decoded value, served without any I/O
+        self._state: Dict[str, Dict[Any, Any]] = {
+            box_map: {} for box_map, _ in INDEXED_BOX_MAPS.values()
+        }
+        self.round = 0
+
+    def get(self, box_map: str, key: Any, default: Any = None) -> Any:
+        """Get the decoded value of a box from local state.
+
+        Grouped maps are looked up by challenge id and return a dict of
+        every box of that challenge keyed by address.
+        """
+        return self._state[box_map].get(key, default)
+
+    def put(self, name: bytes, value: bytes) -> None:
+        """Decode and store the latest contents of a box."""
+        parts = split_box_name(name)
+        if parts is None:
+            return
+        box_map, key_kind, key = parts
+        decoded_key = decode_box_key(key_kind, key)
+        decoded_value = decode_box_value(box_map, value)
+
+        if box_map in GROUPED_BOX_MAPS:
+            challenge_id, address = decoded_key
+            self._state[box_map].setdefault(challenge_id, {})[address] = decoded_value
+        else:
+            self._state[box_map][decoded_key] = decoded_value
+
+    def delete(self, name: bytes) -> None:
+        """Forget a box that no longer exists on chain."""
+        parts = split_box_name(name)
+        if parts is None:
+            return
+        box_map, key_kind, key = parts
+        decoded_key = decode_box_key(key_kind, key)
+
+        if box_map in GROUPED_BOX_MAPS:
+            challenge_id, address = decoded_key
+            self._state[box_map].get(challenge_id, {}).pop(address, None)
+        else:
+            self._state[box_map].pop(decoded_key, None)
+
+    def load(self, app_id: int, db: Session) -> None:
+        """Load all mirrored boxes of an app from the database."""
+        for box in db.query(ChainBox).filter(ChainBox.app_id == app_id).all():
+            self.put(box.name, box.value)
+
+class ChainIndexer:
+    def __init__(
+        self,
+        app_id: int,
+        store: Optional["ChainStateStore"] = None,
+        client: Optional[AsyncAlgodClient] = None
+    ):
+        self.app_id = app_id
+        self.store = store or get_chain_state()
+        self.client = client or get_algod_client()
+        self.cursor_name = f"box_indexer:{app_id}"
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Load local state and start following rounds in the background."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop following rounds."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def bootstrap(self, db: Session) -> int:
+        """Return the checkpointed round, doing a full box scan on first run."""
+
+        cursor = db.query(ChainCursor).filter(ChainCursor.name == self.cursor_name).first()
+        if cursor is not None:
+            self.store.load(self.app_id, db)
+            return cursor.round
+
+        # First run: mirror every indexed box at the current round
+        round_num = (await self.client.status())["last-round"]
+        boxes = await self.client.application_boxes(self.app_id)
+        names = [base64.b64decode(box["name"]) for box in boxes.get("boxes", [])]
+        await self._refresh_boxes(db, names, round_num)
+
+        db.add(ChainCursor(name=self.cursor_name, round=round_num))
+        db.commit()
+        return round_num
+
+    async def index_round(self, db: Session, round_num: int) -> int:
+        """Refresh the boxes referenced by this app's calls in a round."""
+
+        block = await self.client.block(round_num)
+        names = self._referenced_boxes(block.get("block", {}).get("txns", []))
+        await self._refresh_boxes(db, names, round_num)
+
+        db.query(ChainCursor).filter(ChainCursor.name == self.cursor_name).update(
+            {ChainCursor.round: round_num}
+        )
+        # Box contents and cursor move together, so a restart resumes cleanly
+        db.commit()
+        return len(names)
+
+    def _referenced_boxes(self, txns: Iterable[Dict[str, Any]]) -> Set[bytes]:
+        # Every box write needs a box reference, so referenced boxes are a
+        # superset of the boxes that changed in the round
+        names: Set[bytes] = set()
+
+        for signed in txns:
+            txn = signed.get("txn", {})
+            if txn.get("type") != "appl":
+                continue
+
+            foreign_apps = txn.get("apfa", [])
+            app_id = txn.get("apid", 0)
+            for ref in txn.get("apbx", []):
+                index = ref.get("i", 0)
+                ref_app = app_id if index == 0 else foreign_apps[index - 1]
+                name = base64.b64decode(ref.get("n", ""))
+                if ref_app == self.app_id and split_box_name(name) is not None:
+                    names.add(name)
+
+        return names
+
+    async def _refresh_boxes(self, db: Session, names: Iterable[bytes], round_num: int) -> None:
+        names = [name for name in names if split_box_name(name) is not None]
+
+        values = await asyncio.gather(*[self._read_box(name) for name in names])
+        for name, value in zip(names, values):
+            if value is None:
+                db.query(ChainBox).filter(
+                    ChainBox.app_id == self.app_id, ChainBox.name == name
+                ).delete()
+                self.store.delete(name)
+                continue
+
+            box_map = split_box_name(name)[0]
+            db.merge(ChainBox(
+                app_id=self.app_id, name=name, box_map=box_map, value=value, round=round_num
+            ))
+            self.store.put(name, value)
+
+        self.store.round = round_num
+
+    async def _read_box(self, name: bytes) -> Optional[bytes]:
+        try:
+            box = await self.client.application_box_by_name(self.app_id, name)
+        except AlgodHTTPError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return base64.b64decode(box["value"])
+
+    async def _run(self) -> None:
+        db = SessionLocal()
+        last_round = None
+        try:
+            while True:
+                try:
+                    if last_round is None:
+                        last_round = await self.bootstrap(db)
+
+                    status = await self.client.status_after_block(last_round)
+                    for round_num in range(last_round + 1, status["last-round"] + 1):
+                        await self.index_round(db, round_num)
+                        last_round = round_num
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    db.rollback()
+                    print(f"Error indexing chain state: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            db.close()
+
+# Process-wide local chain state read by ContractService
+_shared_store: Optional[ChainStateStore] = None
+
+def get_chain_state() -> ChainStateStore:
+    """Get the shared local chain state, creating it on first use."""
+    global _shared_store
+
+    if _shared_store is None:
+        _shared_store = ChainStateStore()
+
+    return _shared_store
@@ -152,20 +152,10 @@ class ChallengeService:
         if challenge.status == "upcoming" and challenge.current_participants >= 2:
             challenge.status = "active"
         
+        # Nothing is queued for the contract: join_challenge stakes from
+        # Txn.sender, so the participant signs it from their own wallet
         db.commit()
         
-        # Call smart contract to join
-        try:
-            await self.contract_service.join_challenge(
-                contract_address=challenge.contract_address,
-                participant_address=user.address,
-                stake_amount=challenge.stake_amount
-            )
-        except Exception as e:
-            # Rollback database changes if contract call fails
-            db.rollback()
-            raise Exception(f"Failed to join challenge on smart contract: {str(e)}")
-        
         return {
             "message": "Successfully joined challenge",
             "participant_id": participant.id,
@@ -203,19 +193,10 @@ class ChallengeService:
         # Update challenge participant count
         challenge.current_participants -= 1
         
+        # Nothing is queued for the contract: leave_challenge acts on
+        # Txn.sender, so the participant signs it from their own wallet
         db.commit()
         
-        # Call smart contract to leave
-        try:
-            await self.contract_service.leave_challenge(
-                contract_address=challenge.contract_address,
-                participant_address=user.address
-            )
-        except Exception as e:
-            # Rollback database changes if contract call fails
-            db.rollback()
-            raise Exception(f"Failed to leave challenge on smart contract: {str(e)}")
-        
         return {
             "message": "Successfully left challenge",
             "stake_forfeited": participant.stake_amount
@@ -293,11 +274,11 @@ class ChallengeService:
         
         # Distribute based on ranking
         distributions = []
+        total_multiplier = len(participants) * (len(participants) + 1) // 2
         for i, participant in enumerate(participants):
             rank = i + 1
             # Higher rank gets larger share
             rank_multiplier = len(participants) - i
-            total_multiplier = sum(range(1, len(participants) + 1))
             
             share = int((distribution_pool * rank_multiplier) / total_multiplier)
             
@@ -314,9 +295,10 @@ class ChallengeService:
         
         # Call smart contract to distribute
         try:
+            # Winners are ranked from the indexed chain state, which the contract verifies
             await self.contract_service.distribute_pool(
-                contract_address=challenge.contract_address,
-                distributions=distributions
+                challenge_id=challenge.contract_id,
+                idempotency_key=f"distribute_pool:{challenge_id}"
             )
         except Exception as e:
             raise Exception(f"Failed to distribute pool on smart contract: {str(e)}")
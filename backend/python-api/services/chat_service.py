@@ -3,8 +3,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
 from typing import List, Optional
 from datetime import datetime
+import json
 
-from ..models import ChatMessage, ChallengeParticipant
+from ..models import ChatMessage, ChallengeParticipant, User
 from ..schemas import ChatMessageCreate, ChatMessageResponse
 from .websocket_manager import WebSocketManager
 
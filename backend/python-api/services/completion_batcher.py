@@ -0,0 +1,132 @@
+# Batcher grouping task completions into atomic contract call groups
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import os
+
+from .contract_service import ContractService, MAX_GROUP_SIZE
+
+# Longest a completion waits for its group to fill before being submitted
+FLUSH_DEADLINE = float(os.getenv("COMPLETION_FLUSH_DEADLINE", "0.5"))
+
+class CompletionRejected(Exception):
+    """A task completion failed on chain."""
+
+    def __init__(self, task_id: int, error: str, transaction_id: Optional[str] = None):
+        super().__init__(f"complete_task {task_id} rejected: {error}")
+        self.task_id = task_id
+        self.error = error
+        # Set when the call was sent but not seen confirmed
+        self.transaction_id = transaction_id
+
+class CompletionBatcher:
+    def __init__(
+        self,
+        contract_service: Optional[ContractService] = None,
+        max_group_size: int = MAX_GROUP_SIZE,
+        flush_deadline: float = FLUSH_DEADLINE
+    ):
+        self.contract_service = contract_service or ContractService()
+        self.max_group_size = min(max_group_size, MAX_GROUP_SIZE)
+        self.flush_deadline = flush_deadline
+
+        # app_id -> pending (completion, future) pairs
+        self._pending: Dict[int, List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        # app_id -> deadline flush scheduled for the current batch
+        self._deadlines: Dict[int, asyncio.TimerHandle] = {}
+        self._in_flight: set = set()
+
+    async def submit(
+        self,
+        app_id: int,
+        challenge_id: int,
+        task_id: int,
+        participant_address: str,
+        proof_data: str,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Queue a task completion and wait for the result of its group."""
+
+        future = asyncio.get_running_loop().create_future()
+        self.enqueue(app_id, {
+            "challenge_id": challenge_id,
+            "task_id": task_id,
+            "participant_address": participant_address,
+            "proof_data": proof_data,
+            "idempotency_key": idempotency_key
+        }, future)
+
+        return await future
+
+    def enqueue(self, app_id: int, completion: Dict[str, Any], future: asyncio.Future) -> None:
+        """Add a completion to the pending batch of its app."""
+
+        batch = self._pending.setdefault(app_id, [])
+        batch.append((completion, future))
+
+        if len(batch) >= self.max_group_size:
+            self._flush(app_id)
+        elif app_id not in self._deadlines:
+            self._deadlines[app_id] = asyncio.get_running_loop().call_later(
+                self.flush_deadline, self._flush, app_id
+            )
+
+    async def flush_all(self) -> None:
+        """Submit every pending batch and wait for all groups to finish."""
+
+        for app_id in list(self._pending):
+            self._flush(app_id)
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _flush(self, app_id: int) -> None:
+        deadline = self._deadlines.pop(app_id, None)
+        if deadline is not None:
+            deadline.cancel()
+
+        batch = self._pending.pop(app_id, [])
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._submit_group(app_id, batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _submit_group(
+        self,
+        app_id: int,
+        batch: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        try:
+            results = await self.contract_service.complete_tasks_batch(
+                app_id, [completion for completion, _ in batch]
+            )
+        except Exception as e:
+            # Submitting the group failed as a whole, every caller gets its own copy
+            for completion, future in batch:
+                if not future.done():
+                    future.set_exception(CompletionRejected(completion["task_id"], str(e)))
+            return
+
+        for (completion, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if result["success"]:
+                future.set_result(result)
+            else:
+                # Each rejected or unconfirmed call fails on its own
+                future.set_exception(CompletionRejected(
+                    completion["task_id"], result["error"], result.get("transaction_id")
+                ))
+
+# Process-wide batcher so completions from all requests share groups
+_shared_batcher: Optional[CompletionBatcher] = None
+
+def get_completion_batcher() -> CompletionBatcher:
+    """Get the shared completion batcher, creating it on first use."""
+    global _shared_batcher
+
+    if _shared_batcher is None:
+        _shared_batcher = CompletionBatcher()
+
+    return _shared_batcher
@@ -0,0 +1,143 @@
+# Confirmation tracker resolving many pending transactions from one round follower
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import asyncio
+import os
+
+from .algod_client import AsyncAlgodClient, get_algod_client
+
+# Default time a caller waits for its transaction to be confirmed
+CONFIRMATION_TIMEOUT = float(os.getenv("CONFIRMATION_TIMEOUT", "30"))
+# Rounds of confirmed transaction IDs kept for waiters that register late
+RECENT_ROUNDS = 16
+
+class ConfirmationTracker:
+    def __init__(self, client: Optional[AsyncAlgodClient] = None):
+        self.client = client or get_algod_client()
+
+        # txid -> futures of every caller waiting for it
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        # round -> txids confirmed in that round, oldest first
+        self._recent: "OrderedDict[int, List[str]]" = OrderedDict()
+        self._recent_txids: Dict[str, int] = {}
+        self._last_round: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def wait(self, txid: str, timeout: float = CONFIRMATION_TIMEOUT) -> int:
+        """Wait for a transaction to be confirmed and return its round.
+
+        Raises asyncio.TimeoutError if it is not seen within ``timeout``
+        seconds, e.g. because it expired or was rejected from the pool.
+        """
+
+        if txid in self._recent_txids:
+            return self._recent_txids[txid]
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(txid, []).append(future)
+        await self.start()
+
+        try:
+            if self._last_round is None:
+                # The follower only sees rounds after the one it starts at, so
+                # a transaction that landed before then is looked up directly
+                confirmed_round = await self._pending_round(txid)
+                if confirmed_round:
+                    return confirmed_round
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._discard(txid, future)
+
+    async def wait_all(self, txids: List[str], timeout: float = CONFIRMATION_TIMEOUT) -> List[int]:
+        """Wait for several transactions and return their confirmed rounds."""
+
+        return await asyncio.gather(*[self.wait(txid, timeout) for txid in txids])
+
+    async def start(self) -> None:
+        """Start following rounds in the background."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._follow_rounds())
+
+    async def stop(self) -> None:
+        """Stop following rounds and fail any remaining waiters."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for futures in self._waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._waiters.clear()
+
+    async def _pending_round(self, txid: str) -> int:
+        try:
+            info = await self.client.pending_transaction_info(txid)
+        except Exception:
+            # Unknown to the node yet; the follower will report it
+            return 0
+        return info.get("confirmed-round", 0)
+
+    def _discard(self, txid: str, future: asyncio.Future) -> None:
+        futures = self._waiters.get(txid)
+        if futures is None:
+            return
+
+        if future in futures:
+            futures.remove(future)
+        if not futures:
+            del self._waiters[txid]
+
+    def _record_round(self, round_num: int, txids: List[str]) -> None:
+        # Resolve every waiter confirmed in this round from a single block read
+        for txid in txids:
+            for future in self._waiters.pop(txid, []):
+                if not future.done():
+                    future.set_result(round_num)
+
+        self._recent[round_num] = txids
+        for txid in txids:
+            self._recent_txids[txid] = round_num
+
+        while len(self._recent) > RECENT_ROUNDS:
+            _, expired = self._recent.popitem(last=False)
+            for txid in expired:
+                self._recent_txids.pop(txid, None)
+
+    async def _follow_rounds(self) -> None:
+        while True:
+            try:
+                if self._last_round is None:
+                    self._last_round = (await self.client.status())["last-round"]
+
+                status = await self.client.status_after_block(self._last_round)
+                latest_round = status["last-round"]
+
+                # Catch up on every round, including ones skipped between polls
+                for round_num in range(self._last_round + 1, latest_round + 1):
+                    self._record_round(round_num, await self.client.block_txids(round_num))
+                    self._last_round = round_num
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error following rounds for confirmations: {e}")
+                await asyncio.sleep(1)
+
+# Process-wide tracker shared by every service
+_shared_tracker: Optional[ConfirmationTracker] = None
+
+def get_confirmation_tracker() -> ConfirmationTracker:
+    """Get the shared confirmation tracker, creating it on first use."""
+    global _shared_tracker
+
+    if _shared_tracker is None:
+        _shared_tracker = ConfirmationTracker()
+
+    return _shared_tracker
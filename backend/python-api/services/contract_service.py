@@ -1,20 +1,119 @@
 # Smart contract service for interacting with Algorand contracts
-from algosdk import account, mnemonic
+from algosdk import account, encoding, logic, mnemonic
 from algosdk.v2client import algod
-from algosdk.transaction import ApplicationCallTxn, PaymentTxn, AssetTransferTxn
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer, TransactionWithSigner
-from algosdk.abi import Method
+from algosdk.transaction import ApplicationCallTxn, PaymentTxn, AssetTransferTxn, OnComplete, SuggestedParams
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+)
+from algosdk.abi import Contract, Method
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
 import json
 import asyncio
-from typing import Dict, List, Any
+import hashlib
+import base64
+import copy
+import math
+import os
+from typing import Callable, Dict, List, Any, Optional, Tuple
+
+from .algod_client import get_algod_client
+from .params_cache import get_params_cache
+from .confirmation_tracker import get_confirmation_tracker
+from .chain_indexer import get_chain_state
+from .resource_planner import PlannedCall, ResourcePlan, ResourcePlanner, unnamed_resources
+from .box_decoder import (
+    decode_challenge, decode_leaderboard_summary, decode_participant, decode_participants,
+    decode_uint64, decode_weekly_rankings, participants_to_dicts
+)
+import numpy as np
+
+# Platform app and signing account (contract calls are mocked when unset)
+CHALLENGE_APP_ID = int(os.getenv("CHALLENGE_APP_ID", "0"))
+PLATFORM_MNEMONIC = os.getenv("PLATFORM_MNEMONIC", "")
+
+# Maximum number of transactions in an atomic group
+MAX_GROUP_SIZE = 16
+
+# Opcode budget each application call adds to its group's pooled budget
+APP_CALL_BUDGET = 700
+
+# Winners paid per distribute_pool call (PAYOUT_PAGE_SIZE in the contract)
+PAYOUT_PAGE_SIZE = 8
+
+# Most entries a range getter returns (READ_PAGE_LIMIT in the contract)
+READ_PAGE_LIMIT = 12
+
+# Range getters of variable-size entries; they may stop a page early to fit
+# one return log and return (next offset, entries)
+BYTE_BOUNDED_RANGES = {"get_chat_messages_range", "get_tasks_range"}
+
+# Eliminations per process_due_eliminations call (ELIMINATION_BATCH_SIZE in
+# the contract); their events and return value fill one call's 1024 log bytes
+ELIMINATION_BATCH_SIZE = 13
+
+# Submission errors meaning a call of the group already took effect: the
+# exact transaction is in the ledger, or another one holding its lease is
+ALREADY_APPLIED_ERRORS = ("already in ledger", "overlapping lease")
+
+# Prefix of the log line carrying an ARC-4 method return value
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+# Fast decoders for read-only return values that mirror box layouts
+RETURN_DECODERS: Dict[str, Callable[[bytes], Any]] = {
+    "get_challenge_info": decode_challenge,
+    "get_participants_range": decode_participants,
+    "get_participant": decode_participant,
+    "get_participant_count": decode_uint64,
+    "get_leaderboard_summary": decode_leaderboard_summary,
+    "get_weekly_rankings_range": decode_weekly_rankings,
+    "get_participant_stake": decode_uint64,
+}
+
+class SubmissionUnconfirmed(Exception):
+    """A group was sent but not seen confirmed in time; it may still land."""
+
+    def __init__(self, tx_ids: List[str]):
+        super().__init__(f"Transaction {tx_ids[0]} was not confirmed in time")
+        self.tx_ids = tx_ids
+        self.transaction_id = ",".join(tx_ids)
+
+class SubmissionAlreadyApplied(Exception):
+    """algod rejected a group because one of its calls already took effect.
+
+    Either that exact transaction is in the ledger, or an earlier attempt
+    holding the same lease landed. Only the named call is applied; the
+    rest of the group was not.
+    """
+
+    def __init__(self, message: str, transaction_id: str, in_ledger: bool):
+        super().__init__(message)
+        self.transaction_id = transaction_id
+        # The named transaction itself landed, rather than another holding its lease
+        self.in_ledger = in_ledger
 
 class ContractService:
     def __init__(self):
-        # Initialize Algorand client (testnet)
-        self.algod_client = algod.AlgodClient(
-            algod_token="",
-            algod_address="https://testnet-api.algonode.cloud"
-        )
+        # Shared async Algorand client (pooled across all services)
+        self.algod = get_algod_client()
+        # Synchronous algosdk client, only call through self.algod.run_sync
+        self.algod_client = self.algod.sync_client
+        # Suggested params shared by every transaction builder
+        self.params_cache = get_params_cache()
+        # Single round follower resolving confirmations for every caller
+        self.confirmation_tracker = get_confirmation_tracker()
+        # Contract boxes mirrored locally by the chain indexer
+        self.chain_state = get_chain_state()
+        # Box and account references of each call, derived from the indexed state
+        self.resource_planner = ResourcePlanner(self.chain_state)
+        
+        # Platform account acting as oracle for task completions
+        self.app_id = CHALLENGE_APP_ID
+        self.signer = None
+        self.platform_address = None
+        if PLATFORM_MNEMONIC:
+            private_key = mnemonic.to_private_key(PLATFORM_MNEMONIC)
+            self.signer = AccountTransactionSigner(private_key)
+            self.platform_address = account.address_from_private_key(private_key)
         
         # Contract ABI (simplified - would be generated from actual contract)
         self.contract_abi = {
@@ -50,6 +149,7 @@ class ContractService:
                     "args": [
                         {"name": "challenge_id", "type": "uint64"},
                         {"name": "task_id", "type": "uint64"},
+                        {"name": "participant_address", "type": "address"},
                         {"name": "proof_data", "type": "string"}
                     ],
                     "returns": {"type": "void"}
@@ -57,19 +157,191 @@ class ContractService:
                 {
                     "name": "process_weekly_elimination",
                     "args": [
-                        {"name": "challenge_id", "type": "uint64"}
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "lowest_performer", "type": "address"}
                     ],
                     "returns": {"type": "void"}
                 },
+                {
+                    "name": "process_due_eliminations",
+                    "args": [
+                        {"name": "eliminations", "type": "(uint64,address)[]"}
+                    ],
+                    "returns": {"type": "uint64[]"}
+                },
                 {
                     "name": "distribute_pool",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "winners", "type": "address[]"}
+                    ],
+                    "returns": {"type": "void"}
+                },
+                {
+                    "name": "op_up",
+                    "args": [],
+                    "returns": {"type": "void"}
+                },
+                {
+                    "name": "get_payout_plan",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,uint64)"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_challenge_info",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"}
+                    ],
+                    "returns": {
+                        "type": "(uint64,string,string,uint64,uint64,address,uint64,uint64,uint64,bool,uint64)"
+                    },
+                    "readonly": True
+                },
+                {
+                    "name": "get_participants_range",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "offset", "type": "uint64"},
+                        {"name": "limit", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(address,uint64,uint64,bool,uint64,uint64)[]"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_participant",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "participant_address", "type": "address"}
+                    ],
+                    "returns": {"type": "(address,uint64,uint64,bool,uint64,uint64)"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_participant_count",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"}
+                    ],
+                    "returns": {"type": "uint64"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_leaderboard_summary",
                     "args": [
                         {"name": "challenge_id", "type": "uint64"}
                     ],
+                    "returns": {"type": "(uint64,uint64,uint64,uint64,uint64,bool,uint64,uint64,uint64)"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_weekly_rankings_range",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "offset", "type": "uint64"},
+                        {"name": "limit", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(uint64,address,uint64)[]"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_chat_messages",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "page_no", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(uint64,(uint64,address,string,uint64,bool)[])"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_chat_messages_range",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "offset", "type": "uint64"},
+                        {"name": "limit", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(uint64,(uint64,address,string,uint64,bool)[])"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_tasks_range",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "offset", "type": "uint64"},
+                        {"name": "limit", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(uint64,(uint64,uint64,string,string,uint64,string,uint64,bool)[])"},
+                    "readonly": True
+                },
+                {
+                    "name": "commit_health_root",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "participant_address", "type": "address"},
+                        {"name": "day", "type": "uint64"},
+                        {"name": "root", "type": "byte[32]"},
+                        {"name": "sample_count", "type": "uint64"}
+                    ],
                     "returns": {"type": "void"}
+                },
+                {
+                    "name": "get_health_root",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "participant_address", "type": "address"},
+                        {"name": "day", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(byte[32],uint64,uint64)"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_health_roots_range",
+                    "args": [
+                        {"name": "challenge_id", "type": "uint64"},
+                        {"name": "participant_address", "type": "address"},
+                        {"name": "first_day", "type": "uint64"},
+                        {"name": "limit", "type": "uint64"}
+                    ],
+                    "returns": {"type": "(byte[32],uint64,uint64)[]"},
+                    "readonly": True
+                },
+                {
+                    "name": "get_participant_stake",
+                    "args": [
+                        {"name": "participant_address", "type": "address"}
+                    ],
+                    "returns": {"type": "uint64"},
+                    "readonly": True
                 }
             ]
         }
+        self.contract = Contract.undictify(self.contract_abi)
+        # algosdk drops the ARC-4 readonly flag, so keep track of it here
+        self.readonly_methods = {
+            method["name"] for method in self.contract_abi["methods"] if method.get("readonly")
+        }
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether real contract calls can be signed and submitted."""
+        return self.signer is not None and self.app_id > 0
+
+    def get_method(self, name: str) -> Method:
+        """Get an ABI method of the platform contract by name."""
+        return self.contract.get_method_by_name(name)
+
+    @staticmethod
+    def to_chain_id(value: str) -> int:
+        """Derive the on-chain uint64 id used for a database UUID."""
+        return int(value.replace("-", "")[:8], 16)
+
+    @staticmethod
+    def lease_for(idempotency_key: Optional[str]) -> Optional[bytes]:
+        """Derive a transaction lease so the same call cannot be confirmed twice."""
+        if not idempotency_key:
+            return None
+        return hashlib.sha256(idempotency_key.encode()).digest()
 
     async def deploy_challenge_contract(
         self,
@@ -152,112 +424,878 @@ class ContractService:
             "task_id": task_id
         }
 
+    async def complete_tasks_batch(
+        self,
+        app_id: int,
+        completions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Record up to MAX_GROUP_SIZE task completions in one atomic group.
+        
+        Each completion is a dict with challenge_id, task_id,
+        participant_address, proof_data and an optional idempotency_key
+        that becomes the transaction lease. Results are returned in the
+        same order as the completions. Completions the contract would
+        reject are left out of the group and come back with success False
+        and their own error.
+        """
+        
+        if len(completions) > MAX_GROUP_SIZE:
+            raise ValueError(f"At most {MAX_GROUP_SIZE} completions fit in one group")
+        
+        if not self.is_configured:
+            # For now, return mock success per completion
+            return [
+                {
+                    "success": True,
+                    "transaction_id": f"TASK_{c['task_id']}_{c['participant_address']}",
+                    "task_id": c["task_id"]
+                }
+                for c in completions
+            ]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(completions)
+        pending = list(range(len(completions)))
+        params = await self.suggested_params()
+        
+        while True:
+            # One rejected call fails the whole group, so simulate first and
+            # drop each call that fails until the rest of the group passes.
+            # Bucket boxes follow task counts the indexer may not have caught
+            # up with, so the passing simulation also adds what the plan missed
+            while pending:
+                calls = [self._complete_task_call(completions[i]) for i in pending]
+                leases = [self.lease_for(completions[i].get("idempotency_key")) for i in pending]
+                plan = self._plan(calls)
+                probe = self._planned_group(app_id, calls, plan, params, leases, EmptySigner())
+                group = await self._simulate(probe)
+                
+                failed = self._failed_call(group, len(calls))
+                if failed is None:
+                    break
+                index = pending.pop(failed)
+                applied = self._applied_error(group["failure-message"], [probe.tx_ids[failed]])
+                if applied is not None:
+                    # An earlier attempt of this completion landed
+                    results[index] = self._applied_completion(applied, completions[index])
+                else:
+                    results[index] = {
+                        "success": False,
+                        "error": group["failure-message"],
+                        "task_id": completions[index]["task_id"]
+                    }
+            
+            if not pending:
+                return results
+            
+            plan.add(*unnamed_resources(group))
+            atc = self._planned_group(app_id, calls, plan, params, leases, self.signer)
+            try:
+                tx_ids, confirmed_round = await self._submit_group(atc)
+            except SubmissionUnconfirmed as e:
+                # Keep each call's transaction id so a retry can look it up first
+                for index, tx_id in zip(pending, e.tx_ids):
+                    results[index] = {
+                        "success": False,
+                        "error": str(e),
+                        "task_id": completions[index]["task_id"],
+                        "transaction_id": tx_id
+                    }
+                return results
+            except SubmissionAlreadyApplied as e:
+                # Only the named completion landed before; the others go again without it
+                call_tx_ids = atc.tx_ids[:len(pending)]
+                if e.transaction_id not in call_tx_ids:
+                    raise
+                index = pending.pop(call_tx_ids.index(e.transaction_id))
+                results[index] = self._applied_completion(e, completions[index])
+                continue
+            break
+        
+        for index, tx_id in zip(pending, tx_ids):
+            results[index] = {
+                "success": True,
+                "transaction_id": tx_id,
+                "task_id": completions[index]["task_id"],
+                "confirmed_round": confirmed_round
+            }
+        return results
+
+    @staticmethod
+    def _applied_completion(error: SubmissionAlreadyApplied, completion: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "transaction_id": error.transaction_id if error.in_ledger else None,
+            "task_id": completion["task_id"]
+        }
+
+    @staticmethod
+    def _complete_task_call(completion: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        return (
+            "complete_task",
+            [
+                completion["challenge_id"],
+                completion["task_id"],
+                completion["participant_address"],
+                completion["proof_data"]
+            ]
+        )
+
+    async def commit_health_root(
+        self,
+        challenge_id: int,
+        participant_address: str,
+        day: int,
+        root: str,
+        sample_count: int,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Commit the Merkle root of a participant's health samples for one day."""
+        
+        if not self.is_configured:
+            # For now, return mock success
+            return {
+                "success": True,
+                "transaction_id": f"HEALTH_{challenge_id}_{participant_address}_{day}",
+                "root": root
+            }
+        
+        # Every box key comes from the arguments, so the plan is exact
+        calls = [
+            ("commit_health_root", [challenge_id, participant_address, day, bytes.fromhex(root), sample_count])
+        ]
+        atc = self._planned_group(
+            self.app_id, calls, self._plan(calls), await self.suggested_params(),
+            [self.lease_for(idempotency_key)], self.signer
+        )
+        tx_ids, confirmed_round = await self._submit_group(atc)
+        
+        return {
+            "success": True,
+            "transaction_id": tx_ids[0],
+            "root": root,
+            "confirmed_round": confirmed_round
+        }
+
     async def process_weekly_elimination(
         self,
-        contract_address: str
+        challenge_id: int,
+        lowest_performer: str,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Process weekly elimination on the smart contract."""
+        """Process weekly elimination on the smart contract.
         
-        # In a real implementation, this would:
-        # 1. Create application call transaction
-        # 2. Submit transaction
+        The contract checks that no active participant has fewer completed
+        tasks than lowest_performer instead of scanning all participants.
+        """
+        
+        if not self.is_configured:
+            # For now, return mock success
+            return {
+                "success": True,
+                "transaction_id": f"ELIMINATION_{challenge_id}",
+                "eliminated_participant": lowest_performer
+            }
+        
+        tx_id, confirmed_round = await self._call_with_budget(
+            "process_weekly_elimination",
+            [challenge_id, lowest_performer],
+            lease=self.lease_for(idempotency_key)
+        )
+        
+        return {
+            "success": True,
+            "transaction_id": tx_id,
+            "eliminated_participant": lowest_performer,
+            "confirmed_round": confirmed_round
+        }
+
+    async def process_due_eliminations(
+        self,
+        eliminations: List[Dict[str, Any]],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Process the weekly elimination of many challenges in as few groups as possible.
+        
+        Each elimination is a dict with challenge_id and lowest_performer.
+        Eliminations are packed into one process_due_eliminations call per
+        group until the call's log budget or the group's reference slots run
+        out; the contract skips challenges that are not due instead of
+        failing the group.
+        """
+        
+        if not self.is_configured:
+            # For now, return mock success
+            return {
+                "success": True,
+                "transaction_ids": [f"ELIMINATIONS_{len(eliminations)}"],
+                "challenge_ids": [e["challenge_id"] for e in eliminations]
+            }
+        
+        tx_ids = []
+        confirmed_round = None
+        for batch_no, batch in enumerate(self.elimination_batches(eliminations)):
+            tx_id, confirmed_round = await self._call_with_budget(
+                "process_due_eliminations",
+                [[(e["challenge_id"], e["lowest_performer"]) for e in batch]],
+                lease=self.lease_for(f"{idempotency_key}:{batch_no}" if idempotency_key else None)
+            )
+            # None when an earlier attempt of the batch already landed
+            if tx_id:
+                tx_ids.append(tx_id)
         
-        # For now, return mock success
         return {
             "success": True,
-            "transaction_id": f"ELIMINATION_{contract_address}",
-            "eliminated_participant": "mock_participant"
+            "transaction_ids": tx_ids,
+            "challenge_ids": [e["challenge_id"] for e in eliminations],
+            "confirmed_round": confirmed_round
         }
 
+    def elimination_batches(
+        self,
+        eliminations: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Split eliminations into batches that fit one call's logs and one group's references."""
+        
+        batches = []
+        batch, plan = [], ResourcePlan()
+        for elimination in eliminations:
+            needed = self._plan([(
+                "process_due_eliminations",
+                [[(elimination["challenge_id"], elimination["lowest_performer"])]]
+            )])
+            merged = ResourcePlan()
+            merged.add(plan.boxes + needed.boxes, plan.accounts + needed.accounts)
+            if batch and (len(batch) == ELIMINATION_BATCH_SIZE or merged.transactions_needed() > MAX_GROUP_SIZE):
+                batches.append(batch)
+                batch, merged = [], needed
+            batch.append(elimination)
+            plan = merged
+        if batch:
+            batches.append(batch)
+        return batches
+
     async def distribute_pool(
         self,
-        contract_address: str,
-        distributions: List[Dict[str, Any]]
+        challenge_id: int,
+        winners: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Distribute pool to participants on the smart contract."""
+        """Distribute pool to participants on the smart contract.
         
-        # In a real implementation, this would:
-        # 1. Create application call transaction
-        # 2. Submit transaction
+        Winners default to the indexed active participants in final ranking
+        order. Each group pays PAYOUT_PAGE_SIZE winners, and payout resumes
+        from the contract's cursor, so a retry only pays who is left.
+        """
+        
+        if winners is None:
+            winners = self.rank_winners(challenge_id)
+        
+        if not self.is_configured:
+            # For now, return mock success
+            return {
+                "success": True,
+                "transaction_id": f"DISTRIBUTE_{challenge_id}",
+                "winners": winners
+            }
+        
+        # The plan box only exists once the first page has been paid
+        try:
+            cursor = (await self.batch_read([("get_payout_plan", [challenge_id])]))[0][3]
+        except ValueError:
+            cursor = 0
+        
+        starts = list(range(cursor, len(winners), PAYOUT_PAGE_SIZE))
+        if cursor == 0 and not winners:
+            starts = [0]  # still fixes the plan and books the platform fee
+        
+        tx_ids = []
+        confirmed_round = None
+        for start in starts:
+            page = winners[start:start + PAYOUT_PAGE_SIZE]
+            tx_id, confirmed_round = await self._call_with_budget(
+                "distribute_pool",
+                [challenge_id, page],
+                inner_txns=len(page),
+                lease=self.lease_for(f"{idempotency_key}:{start}" if idempotency_key else None)
+            )
+            if tx_id:
+                tx_ids.append(tx_id)
         
-        # For now, return mock success
         return {
             "success": True,
-            "transaction_id": f"DISTRIBUTE_{contract_address}",
-            "distributions": distributions
+            "transaction_ids": tx_ids,
+            "winners": winners,
+            "confirmed_round": confirmed_round
         }
 
+    def rank_winners(self, challenge_id: int) -> List[str]:
+        """Active participants by tasks completed (descending), then join order."""
+        
+        participants = participants_to_dicts(
+            list(self.chain_state.get("participants", challenge_id, {}).values())
+        )
+        active = [p for p in participants if p["is_active"]]
+        active.sort(key=lambda p: (-p["tasks_completed"], p["current_rank"]))
+        return [p["address"] for p in active]
+
     async def get_challenge_state(
         self,
-        contract_address: str
+        challenge_id: int
     ) -> Dict[str, Any]:
-        """Get current state of the challenge contract."""
+        """Get current state of a challenge from the locally indexed contract boxes."""
         
-        # In a real implementation, this would:
-        # 1. Query application state
-        # 2. Return parsed state data
+        if not self.is_configured:
+            # For now, return mock data
+            return {
+                "challenge_id": "mock_challenge",
+                "total_staked": 1000000,  # microAlgos
+                "participants": [
+                    {
+                        "address": "mock_participant_1",
+                        "stake_amount": 500000,
+                        "is_active": True,
+                        "tasks_completed": 5
+                    }
+                ],
+                "current_week": 1,
+                "is_active": True
+            }
+        
+        # Served from memory; the chain indexer keeps it in sync with the app boxes
+        challenge = self.chain_state.get("challenge_states", challenge_id)
+        if challenge is None:
+            # Not indexed yet, read it from the contract page by page instead
+            try:
+                summary = await self.get_leaderboard_summary(challenge_id)
+            except ValueError:
+                raise ValueError("Challenge not found on chain")
+            pages = await self._read_ranges(
+                "get_participants_range", [challenge_id], 0, summary["participant_count"]
+            )
+            return {
+                "challenge_id": challenge_id,
+                "total_staked": summary["total_staked"],
+                "participants": participants_to_dicts(np.concatenate(pages)) if pages else [],
+                "current_week": summary["current_week"],
+                "is_active": summary["is_active"],
+                "round": None
+            }
         
-        # For now, return mock data
         return {
-            "challenge_id": "mock_challenge",
-            "total_staked": 1000000,  # microAlgos
-            "participants": [
-                {
-                    "address": "mock_participant_1",
-                    "stake_amount": 500000,
-                    "is_active": True,
-                    "tasks_completed": 5
-                }
-            ],
-            "current_week": 1,
-            "is_active": True
+            "challenge_id": challenge_id,
+            "total_staked": challenge["total_staked"],
+            "participants": participants_to_dicts(
+                list(self.chain_state.get("participants", challenge_id, {}).values())
+            ),
+            "current_week": challenge["current_week"],
+            "is_active": challenge["is_active"],
+            "round": self.chain_state.round
         }
 
+    async def get_leaderboard_summary(
+        self,
+        challenge_id: int
+    ) -> Dict[str, Any]:
+        """Get the leaderboard totals of a challenge in one contract read."""
+        
+        if not self.is_configured:
+            # For now, return mock data
+            return {
+                "participant_count": 3,
+                "active_count": 2,
+                "eliminated_count": 1,
+                "min_tasks": 4,
+                "total_staked": 1500000,  # microAlgos
+                "current_week": 2,
+                "is_active": True,
+                "ranking_count": 1,
+                "task_count": 5,
+                "message_count": 12
+            }
+        
+        return (await self.batch_read([("get_leaderboard_summary", [challenge_id])]))[0]
+
+    async def get_chat_messages(
+        self,
+        challenge_id: int
+    ) -> List[Dict[str, Any]]:
+        """Read every chat message of a challenge from the contract, oldest first."""
+        
+        if not self.is_configured:
+            # For now, return mock data
+            return []
+        
+        summary = await self.get_leaderboard_summary(challenge_id)
+        pages = await self._read_ranges(
+            "get_chat_messages_range", [challenge_id], 0, summary["message_count"]
+        )
+        return [
+            {
+                "message_id": message_id,
+                "sender": sender,
+                "content": content,
+                "timestamp": timestamp,
+                "is_system_message": is_system_message
+            }
+            for page in pages
+            for message_id, sender, content, timestamp, is_system_message in page
+        ]
+
+    async def get_tasks(
+        self,
+        challenge_id: int
+    ) -> List[Dict[str, Any]]:
+        """Read every task of a challenge from the contract, in task id order."""
+        
+        if not self.is_configured:
+            # For now, return mock data
+            return []
+        
+        summary = await self.get_leaderboard_summary(challenge_id)
+        pages = await self._read_ranges("get_tasks_range", [challenge_id], 0, summary["task_count"])
+        return [
+            {
+                "task_id": task_id,
+                "challenge_id": task_challenge_id,
+                "name": name,
+                "description": description,
+                "required_value": required_value,
+                "data_type": data_type,
+                "points": points,
+                "is_active": is_active
+            }
+            for page in pages
+            for (
+                task_id, task_challenge_id, name, description, required_value, data_type, points, is_active
+            ) in page
+        ]
+
+    async def get_health_roots(
+        self,
+        challenge_id: int,
+        participant_address: str,
+        first_day: int,
+        days: int
+    ) -> List[Dict[str, Any]]:
+        """Read the committed health data roots of consecutive days; uncommitted days have sample_count 0."""
+        
+        if not self.is_configured:
+            # For now, return mock data
+            return []
+        
+        pages = await self._read_ranges(
+            "get_health_roots_range", [challenge_id, participant_address], first_day, first_day + days
+        )
+        return [
+            {
+                "day": day,
+                "root": bytes(root).hex(),
+                "sample_count": sample_count,
+                "committed_at": committed_at
+            }
+            for day, (root, sample_count, committed_at) in enumerate(
+                (entry for page in pages for entry in page), start=first_day
+            )
+        ]
+
     async def get_participant_stake(
         self,
-        contract_address: str,
         participant_address: str
     ) -> int:
-        """Get participant's staked amount."""
+        """Get participant's deposited amount from the locally indexed contract boxes."""
         
-        # In a real implementation, this would query the contract state
+        if not self.is_configured:
+            # For now, return mock data
+            return 500000  # microAlgos
         
-        # For now, return mock data
-        return 500000  # microAlgos
+        return self.chain_state.get("deposited", participant_address, 0)
 
-    def _create_payment_transaction(
+    async def get_participant_stakes(
+        self,
+        participant_addresses: List[str]
+    ) -> Dict[str, int]:
+        """Get the deposited amounts of many participants in one simulate request."""
+        
+        if not self.is_configured:
+            # For now, return mock data
+            return {address: 500000 for address in participant_addresses}
+        
+        stakes = await self.batch_read(
+            [("get_participant_stake", [address]) for address in participant_addresses]
+        )
+        return dict(zip(participant_addresses, stakes))
+
+    async def batch_read(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        app_id: Optional[int] = None
+    ) -> List[Any]:
+        """Evaluate many read-only contract methods in a single simulate request.
+        
+        Each call is a (method name, args) pair. Calls are packed into
+        groups of MAX_GROUP_SIZE, all groups go out in one request, and the
+        decoded return values come back in the same order as the calls.
+        Nothing is signed or submitted.
+        """
+        
+        app_id = app_id or self.app_id
+        if app_id <= 0:
+            raise ValueError("No application configured for contract reads")
+        
+        for name, _ in calls:
+            if name not in self.readonly_methods:
+                raise ValueError(f"{name} is not a read-only method")
+        methods = [self.get_method(name) for name, _ in calls]
+        
+        # Reads are never sent, but the sender still needs funds for the fee
+        sender = self.platform_address or logic.get_application_address(app_id)
+        params = await self.suggested_params()
+        signer = EmptySigner()
+        
+        groups = []
+        for start in range(0, len(calls), MAX_GROUP_SIZE):
+            atc = AtomicTransactionComposer()
+            for (_, args), method in zip(
+                calls[start:start + MAX_GROUP_SIZE], methods[start:start + MAX_GROUP_SIZE]
+            ):
+                atc.add_method_call(
+                    app_id=app_id,
+                    method=method,
+                    sender=sender,
+                    sp=params,
+                    signer=signer,
+                    method_args=args
+                )
+            groups.append(SimulateRequestTransactionGroup(txns=atc.gather_signatures()))
+        
+        response = await self.algod.simulate(SimulateRequest(
+            txn_groups=groups,
+            allow_empty_signatures=True,
+            # Let simulate resolve the box references each read needs
+            allow_unnamed_resources=True
+        ))
+        
+        results = []
+        for group in response["txn-groups"]:
+            if group.get("failure-message"):
+                raise ValueError(f"Contract read failed: {group['failure-message']}")
+            for txn_result in group["txn-results"]:
+                results.append(self._decode_return(
+                    methods[len(results)], txn_result["txn-result"].get("logs", [])
+                ))
+        
+        return results
+
+    async def _read_ranges(
+        self,
+        method: str,
+        args: List[Any],
+        start: int,
+        end: int
+    ) -> List[Any]:
+        """Read entries [start, end) through an (offset, limit) getter, all pages in one simulate request.
+        
+        Byte-bounded getters may stop a page early; the rest of each such
+        page is read on from its next offset in a follow-up request, and
+        their pages come back as plain entry lists.
+        """
+        
+        windows = [(offset, min(offset + READ_PAGE_LIMIT, end)) for offset in range(start, end, READ_PAGE_LIMIT)]
+        if method not in BYTE_BOUNDED_RANGES:
+            if not windows:
+                return []
+            return await self.batch_read([
+                (method, args + [offset, limit_end - offset]) for offset, limit_end in windows
+            ])
+        
+        pages: Dict[int, List[Any]] = {}
+        while windows:
+            results = await self.batch_read([
+                (method, args + [offset, limit_end - offset]) for offset, limit_end in windows
+            ])
+            rest = []
+            for (offset, limit_end), (next_offset, entries) in zip(windows, results):
+                pages[offset] = entries
+                if next_offset <= offset:
+                    raise ValueError(f"{method} returned nothing at offset {offset}")
+                if next_offset < limit_end:
+                    rest.append((next_offset, limit_end))
+            windows = rest
+        return [pages[offset] for offset in sorted(pages)]
+
+    async def suggested_params(self) -> SuggestedParams:
+        """Get cached suggested params for building a transaction group."""
+        
+        return await self.params_cache.get()
+
+    async def _create_payment_transaction(
         self,
         sender: str,
         receiver: str,
         amount: int,
-        suggested_params: Dict[str, Any]
+        suggested_params: Optional[SuggestedParams] = None
     ) -> PaymentTxn:
         """Create a payment transaction."""
         
         return PaymentTxn(
             sender=sender,
-            sp=suggested_params,
+            sp=suggested_params or await self._cached_params(),
             receiver=receiver,
             amt=amount
         )
 
-    def _create_app_call_transaction(
+    async def _create_app_call_transaction(
         self,
         sender: str,
         app_id: int,
         method: Method,
         args: List[Any],
-        suggested_params: Dict[str, Any]
+        suggested_params: Optional[SuggestedParams] = None
     ) -> ApplicationCallTxn:
         """Create an application call transaction."""
         
+        # ARC-4 encoding: method selector followed by the encoded arguments
+        app_args = [method.get_selector()] + [
+            arg.type.encode(value) for arg, value in zip(method.args, args)
+        ]
+        
         return ApplicationCallTxn(
             sender=sender,
-            sp=suggested_params,
+            sp=suggested_params or await self._cached_params(),
             index=app_id,
-            method=method,
-            method_args=args
+            on_complete=OnComplete.NoOpOC,
+            app_args=app_args
+        )
+
+    def _decode_return(self, method: Method, logs: List[str]) -> Any:
+        """Decode an ARC-4 return value from the logs of a method call."""
+        
+        raw = base64.b64decode(logs[-1]) if logs else b""
+        if not raw.startswith(RETURN_PREFIX):
+            raise ValueError(f"{method.name} returned no value")
+        
+        value = raw[len(RETURN_PREFIX):]
+        decoder = RETURN_DECODERS.get(method.name)
+        return decoder(value) if decoder else method.returns.type.decode(value)
+
+    async def _cached_params(self) -> SuggestedParams:
+        """Get cached suggested params, reaching algod only before the first load."""
+        
+        params = self.params_cache.peek()
+        if params is None:
+            # Right after startup the background refresh may not have run yet
+            params = await self.params_cache.get()
+        return params
+
+    def _plan(self, calls: List[Tuple[str, List[Any]]]) -> ResourcePlan:
+        """Plan the box and account references of a group of platform calls."""
+        
+        return self.resource_planner.plan([
+            PlannedCall(self.get_method(name), args, self.platform_address) for name, args in calls
+        ])
+
+    async def _simulate(self, atc: AtomicTransactionComposer) -> Dict[str, Any]:
+        """Simulate a group, letting algod resolve references the plan missed."""
+        
+        response = await self.algod.simulate(SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=atc.gather_signatures())],
+            allow_empty_signatures=True,
+            allow_unnamed_resources=True
+        ))
+        return response["txn-groups"][0]
+
+    async def _simulate_group(self, atc: AtomicTransactionComposer, method_name: str) -> Dict[str, Any]:
+        """Simulate a group and raise if it would be rejected."""
+        
+        group = await self._simulate(atc)
+        message = group.get("failure-message")
+        if message:
+            applied = self._applied_error(message, list(atc.tx_ids))
+            if applied is not None:
+                raise applied
+            raise ValueError(f"{method_name} would fail: {message}")
+        return group
+
+    @staticmethod
+    def _applied_error(message: str, tx_ids: List[str]) -> Optional[SubmissionAlreadyApplied]:
+        """The rejection as SubmissionAlreadyApplied if it is one and names a transaction of tx_ids."""
+        
+        # algod names the one transaction that already landed or whose lease is taken
+        named = [tx_id for tx_id in tx_ids if tx_id in message]
+        if not named or not any(marker in message for marker in ALREADY_APPLIED_ERRORS):
+            return None
+        return SubmissionAlreadyApplied(message, named[0], "already in ledger" in message)
+
+    @staticmethod
+    def _applied_call(error: SubmissionAlreadyApplied, atc: AtomicTransactionComposer) -> tuple:
+        """(transaction id, confirmed round) of a single call algod reported as already applied."""
+        
+        # Applied only if algod names the call itself, not one of its op_up calls
+        if error.transaction_id != atc.tx_ids[0]:
+            raise error
+        return (error.transaction_id if error.in_ledger else None), None
+
+    @staticmethod
+    def _failed_call(group: Dict[str, Any], call_count: int) -> Optional[int]:
+        """Index of the call a simulated group failed at, None if it passed.
+        
+        Simulation stops at the first rejected transaction. A failure in
+        the op_up padding is not any one call's fault and is raised.
+        """
+        
+        if not group.get("failure-message"):
+            return None
+        failed_at = group.get("failed-at") or [call_count]
+        if failed_at[0] >= call_count:
+            raise ValueError(f"Group would fail: {group['failure-message']}")
+        return failed_at[0]
+
+    def _planned_group(
+        self,
+        app_id: int,
+        calls: List[Tuple[str, List[Any]]],
+        plan: ResourcePlan,
+        params: SuggestedParams,
+        leases: List[Optional[bytes]],
+        signer: Any
+    ) -> AtomicTransactionComposer:
+        """Build a group of calls carrying the plan's references, padded with op_up calls if needed."""
+        
+        call_refs, padding_refs = plan.pack(len(calls), MAX_GROUP_SIZE - len(calls))
+        atc = AtomicTransactionComposer()
+        for (name, args), lease, (boxes, accounts) in zip(calls, leases, call_refs):
+            atc.add_method_call(
+                app_id=app_id,
+                method=self.get_method(name),
+                sender=self.platform_address,
+                sp=params,
+                signer=signer,
+                method_args=args,
+                boxes=[(app_id, box) for box in boxes],
+                accounts=accounts,
+                lease=lease
+            )
+        for i, (boxes, accounts) in enumerate(padding_refs):
+            atc.add_method_call(
+                app_id=app_id,
+                method=self.get_method("op_up"),
+                sender=self.platform_address,
+                sp=params,
+                signer=signer,
+                boxes=[(app_id, box) for box in boxes],
+                accounts=accounts,
+                note=f"op_up:{i}".encode()
+            )
+        return atc
+
+    async def _call_with_budget(
+        self,
+        method_name: str,
+        method_args: List[Any],
+        inner_txns: int = 0,
+        lease: Optional[bytes] = None
+    ) -> tuple:
+        """Submit one app call, adding op_up calls for references and opcode budget.
+        
+        The group is simulated once with extra budget to measure its cost
+        and to catch references the plan missed. The first call pays the
+        fees of the whole group, inner transactions included.
+        """
+        
+        params = await self.suggested_params()
+        plan = self._plan([(method_name, method_args)])
+        
+        probe = self._budget_group(
+            method_name, method_args, plan, MAX_GROUP_SIZE - 1, inner_txns, params, lease, EmptySigner()
+        )
+        try:
+            group = await self._simulate_group(probe, method_name)
+        except SubmissionAlreadyApplied as e:
+            return self._applied_call(e, probe)
+        plan.add(*unnamed_resources(group))
+        
+        ref_calls = plan.transactions_needed() - 1
+        budget_calls = math.ceil(group.get("app-budget-consumed", 0) / APP_CALL_BUDGET) - 1
+        op_up_calls = min(max(ref_calls, budget_calls), MAX_GROUP_SIZE - 1)
+        
+        atc = self._budget_group(
+            method_name, method_args, plan, op_up_calls, inner_txns, params, lease, self.signer
+        )
+        try:
+            tx_ids, confirmed_round = await self._submit_group(atc)
+        except SubmissionAlreadyApplied as e:
+            return self._applied_call(e, atc)
+        return tx_ids[0], confirmed_round
+
+    def _budget_group(
+        self,
+        method_name: str,
+        method_args: List[Any],
+        plan: ResourcePlan,
+        op_up_calls: int,
+        inner_txns: int,
+        params: SuggestedParams,
+        lease: Optional[bytes],
+        signer: Any
+    ) -> AtomicTransactionComposer:
+        # Fee pooling: the first call covers every transaction, the op_up calls pay nothing
+        paying = copy.copy(params)
+        paying.flat_fee = True
+        paying.fee = params.min_fee * (1 + op_up_calls + inner_txns)
+        free = copy.copy(paying)
+        free.fee = 0
+        
+        call_refs, padding_refs = plan.pack(1, op_up_calls)
+        call_boxes, call_accounts = call_refs[0]
+        padding_refs += [([], [])] * (op_up_calls - len(padding_refs))
+        
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            app_id=self.app_id,
+            method=self.get_method(method_name),
+            sender=self.platform_address,
+            sp=paying,
+            signer=signer,
+            method_args=method_args,
+            boxes=[(self.app_id, box) for box in call_boxes],
+            accounts=call_accounts,
+            lease=lease
         )
+        for i, (boxes, accounts) in enumerate(padding_refs):
+            atc.add_method_call(
+                app_id=self.app_id,
+                method=self.get_method("op_up"),
+                sender=self.platform_address,
+                sp=free,
+                signer=signer,
+                boxes=[(self.app_id, box) for box in boxes],
+                accounts=accounts,
+                # Identical op_up calls would share a transaction id
+                note=f"op_up:{i}".encode()
+            )
+        return atc
+
+    async def _submit_group(self, atc: AtomicTransactionComposer) -> tuple:
+        """Sign and submit a group, then wait for it via the confirmation tracker."""
+        
+        signed_txns = atc.gather_signatures()
+        # Set once the group is signed
+        tx_ids = list(atc.tx_ids)
+        
+        try:
+            await self.algod.send_transactions(signed_txns)
+        except Exception as e:
+            applied = self._applied_error(str(e), tx_ids)
+            if applied is not None:
+                raise applied from e
+            raise
+        # A group confirms atomically, so its first transaction is enough to track
+        try:
+            confirmed_round = await self.confirmation_tracker.wait(tx_ids[0])
+        except asyncio.TimeoutError:
+            raise SubmissionUnconfirmed(tx_ids)
+        
+        return tx_ids, confirmed_round
 
     def _sign_transaction(self, txn: Any, private_key: str) -> Any:
         """Sign a transaction with private key."""
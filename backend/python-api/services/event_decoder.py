@@ -0,0 +1,123 @@
+# Decoder for ChallengePlatform ARC-28 event logs
+#
+# Each event is one log line: the first 4 bytes of sha512_256 of the event
+# signature, followed by the ARC-4 encoded event struct. Events mirror the
+# structs at the end of contracts/contract_types.py.
+from algosdk import abi
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import base64
+import hashlib
+
+SELECTOR_SIZE = 4
+
+# Event name -> ordered (field name, ARC-4 type) pairs
+EVENT_FIELDS: Dict[str, List[Tuple[str, str]]] = {
+    "ParticipantJoined": [
+        ("challenge_id", "uint64"),
+        ("participant", "address"),
+        ("stake_amount", "uint64"),
+        ("participant_count", "uint64"),
+        ("joined_at", "uint64"),
+    ],
+    "TaskCompleted": [
+        ("challenge_id", "uint64"),
+        ("participant", "address"),
+        ("task_id", "uint64"),
+        ("week", "uint64"),
+        ("completed_at", "uint64"),
+        ("tasks_completed", "uint64"),
+        ("proof_data", "string"),
+    ],
+    "ChatMessageSent": [
+        ("challenge_id", "uint64"),
+        ("message_id", "uint64"),
+        ("sender", "address"),
+        ("timestamp", "uint64"),
+        ("content", "string"),
+    ],
+    "ParticipantEliminated": [
+        ("challenge_id", "uint64"),
+        ("participant", "address"),
+        ("week", "uint64"),
+        ("tasks_completed", "uint64"),
+        ("timestamp", "uint64"),
+    ],
+    "PoolPaid": [
+        ("challenge_id", "uint64"),
+        ("winner", "address"),
+        ("amount", "uint64"),
+        ("rank", "uint64"),
+    ],
+}
+
+def event_signature(name: str) -> str:
+    """ARC-28 signature of an event, e.g. "PoolPaid(uint64,address,uint64,uint64)"."""
+    return f"{name}({','.join(arc4_type for _, arc4_type in EVENT_FIELDS[name])})"
+
+def event_selector(name: str) -> bytes:
+    return hashlib.new("sha512_256", event_signature(name).encode()).digest()[:SELECTOR_SIZE]
+
+# selector -> (event name, field names, tuple type)
+EVENT_TYPES: Dict[bytes, Tuple[str, List[str], abi.ABIType]] = {
+    event_selector(name): (
+        name,
+        [field for field, _ in fields],
+        abi.ABIType.from_string(f"({','.join(arc4_type for _, arc4_type in fields)})")
+    )
+    for name, fields in EVENT_FIELDS.items()
+}
+
+def decode_event(log: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one log line into {"name", "fields"}; None for logs that are not platform events."""
+    event_type = EVENT_TYPES.get(log[:SELECTOR_SIZE])
+    if event_type is None:
+        return None
+
+    name, field_names, tuple_type = event_type
+    try:
+        values = tuple_type.decode(log[SELECTOR_SIZE:])
+    except Exception:
+        # A method return value can start with the same four bytes
+        return None
+    return {"name": name, "fields": dict(zip(field_names, values))}
+
+def block_events(block: Dict[str, Any], app_id: int) -> Iterator[Dict[str, Any]]:
+    """Yield the decoded events an app logged in a JSON block, in block order.
+
+    Inner transactions are searched too, so calls made to the app by other
+    apps are included. Each event carries its position (top-level
+    transaction index) and log index within that transaction's logs.
+    """
+    for position, signed in enumerate(block.get("block", {}).get("txns", [])):
+        log_index = 0
+        for log in _app_logs(signed, app_id):
+            event = decode_event(log)
+            if event is not None:
+                yield {**event, "position": position, "log_index": log_index}
+            log_index += 1
+
+def _app_logs(signed: Dict[str, Any], app_id: int) -> Iterator[bytes]:
+    apply_data = signed.get("dt", {})
+    if signed.get("txn", {}).get("apid") == app_id:
+        for log in apply_data.get("lg", []):
+            yield base64.b64decode(log)
+    for inner in apply_data.get("itx", []):
+        yield from _app_logs(inner, app_id)
+
+def replay_proof_commitment(completions: List[Dict[str, Any]]) -> bytes:
+    """Recompute a weekly proof commitment from TaskCompleted events in log order.
+
+    Matches WeeklyCompletions.proof_commitment on chain:
+    sha256(previous commitment || task_id || completed_at || proof_data),
+    starting from 32 zero bytes.
+    """
+    commitment = bytes(32)
+    for completion in completions:
+        proof_data = completion["proof_data"].encode("utf-8")
+        commitment = hashlib.sha256(
+            commitment
+            + completion["task_id"].to_bytes(8, "big")
+            + completion["completed_at"].to_bytes(8, "big")
+            + len(proof_data).to_bytes(2, "big") + proof_data
+        ).digest()
+    return commitment
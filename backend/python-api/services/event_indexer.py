@@ -0,0 +1,129 @@
+# Event indexer streaming ChallengePlatform ARC-28 events into the database
+#
+# Follows rounds like the box indexer, but only appends the events logged in
+# each block: joins, completions, chat messages, eliminations and payouts
+# are observed without reading or diffing any box.
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
+
+from ..database import SessionLocal
+from ..models import ChainCursor, ChainEvent
+from .algod_client import AsyncAlgodClient, get_algod_client
+from .event_decoder import block_events
+
+class EventIndexer:
+    def __init__(self, app_id: int, client: Optional[AsyncAlgodClient] = None):
+        self.app_id = app_id
+        self.client = client or get_algod_client()
+        self.cursor_name = f"event_indexer:{app_id}"
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start following rounds in the background."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop following rounds."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def bootstrap(self, db: Session) -> int:
+        """Return the checkpointed round, starting at the current round on first run."""
+
+        cursor = db.query(ChainCursor).filter(ChainCursor.name == self.cursor_name).first()
+        if cursor is not None:
+            return cursor.round
+
+        round_num = (await self.client.status())["last-round"]
+        db.add(ChainCursor(name=self.cursor_name, round=round_num))
+        db.commit()
+        return round_num
+
+    async def index_round(self, db: Session, round_num: int) -> int:
+        """Append the events this app logged in a round."""
+
+        block = await self.client.block(round_num)
+        events = list(block_events(block, self.app_id))
+        for event in events:
+            # Keyed by position in the chain, so re-indexing a round is a no-op
+            db.merge(ChainEvent(
+                app_id=self.app_id,
+                round=round_num,
+                position=event["position"],
+                log_index=event["log_index"],
+                name=event["name"],
+                challenge_id=event["fields"]["challenge_id"],
+                payload=json.dumps(event["fields"])
+            ))
+
+        db.query(ChainCursor).filter(ChainCursor.name == self.cursor_name).update(
+            {ChainCursor.round: round_num}
+        )
+        # Events and cursor move together, so a restart resumes cleanly
+        db.commit()
+        return len(events)
+
+    def list_events(
+        self,
+        db: Session,
+        challenge_id: int,
+        after_round: int = 0,
+        name: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Get indexed events of a challenge in chain order."""
+
+        query = db.query(ChainEvent).filter(
+            ChainEvent.app_id == self.app_id,
+            ChainEvent.challenge_id == challenge_id,
+            ChainEvent.round > after_round
+        )
+        if name:
+            query = query.filter(ChainEvent.name == name)
+
+        events = query.order_by(
+            ChainEvent.round, ChainEvent.position, ChainEvent.log_index
+        ).limit(limit).all()
+
+        return [
+            {
+                "name": event.name,
+                "round": event.round,
+                "position": event.position,
+                "log_index": event.log_index,
+                "fields": json.loads(event.payload)
+            }
+            for event in events
+        ]
+
+    async def _run(self) -> None:
+        db = SessionLocal()
+        last_round = None
+        try:
+            while True:
+                try:
+                    if last_round is None:
+                        last_round = await self.bootstrap(db)
+
+                    status = await self.client.status_after_block(last_round)
+                    for round_num in range(last_round + 1, status["last-round"] + 1):
+                        await self.index_round(db, round_num)
+                        last_round = round_num
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    db.rollback()
+                    print(f"Error indexing contract events: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            db.close()
@@ -0,0 +1,160 @@
+# Health evaluation service for checking task thresholds against health data
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from typing import List, Tuple
+from datetime import datetime, date, timedelta
+import numpy as np
+
+from ..models import Task, HealthData, ChallengeParticipant
+
+# Data types that are compared against their peak value instead of their sum
+MAX_AGGREGATED_TYPES = {"heart_rate"}
+
+class HealthEvaluationService:
+    async def evaluate_day(
+        self,
+        challenge_id: str,
+        day: date,
+        db: Session
+    ) -> List[Tuple[str, str]]:
+        """Get (user_id, task_id) pairs satisfied by one day of health data."""
+
+        window_start = datetime.combine(day, datetime.min.time())
+        window_end = window_start + timedelta(days=1)
+
+        return await self.evaluate_window(challenge_id, window_start, window_end, db)
+
+    async def evaluate_window(
+        self,
+        challenge_id: str,
+        window_start: datetime,
+        window_end: datetime,
+        db: Session
+    ) -> List[Tuple[str, str]]:
+        """Get (user_id, task_id) pairs satisfied by health data in a time window."""
+
+        task_ids, task_types, task_required = self.load_thresholds(challenge_id, db)
+        if not task_ids:
+            return []
+
+        participant_ids = np.array(sorted(
+            user_id for (user_id,) in db.query(ChallengeParticipant.user_id).filter(
+                and_(
+                    ChallengeParticipant.challenge_id == challenge_id,
+                    ChallengeParticipant.is_active == True
+                )
+            ).all()
+        ))
+        if participant_ids.size == 0:
+            return []
+
+        type_names = sorted(set(task_types))
+        sample_users, sample_types, sample_values = self.load_samples(
+            challenge_id, type_names, window_start, window_end, db
+        )
+
+        # Map string ids onto dense integer indexes
+        known = np.isin(sample_users, participant_ids)
+        sample_participants = np.searchsorted(participant_ids, sample_users[known])
+        sample_type_index = np.searchsorted(np.array(type_names), sample_types[known])
+        task_type_index = np.searchsorted(np.array(type_names), np.array(task_types))
+        max_types = np.isin(np.array(type_names), list(MAX_AGGREGATED_TYPES))
+
+        satisfied = self.evaluate(
+            sample_participants,
+            sample_type_index,
+            sample_values[known],
+            task_type_index,
+            task_required,
+            num_participants=participant_ids.size,
+            max_types=max_types
+        )
+
+        participant_index, task_index = np.nonzero(satisfied)
+        return [
+            (str(participant_ids[p]), task_ids[t])
+            for p, t in zip(participant_index.tolist(), task_index.tolist())
+        ]
+
+    def load_thresholds(
+        self,
+        challenge_id: str,
+        db: Session
+    ) -> Tuple[List[str], List[str], np.ndarray]:
+        """Load ids, data types and required values of measurable tasks."""
+
+        tasks = db.query(Task.id, Task.data_type, Task.required_value).filter(
+            and_(
+                Task.challenge_id == challenge_id,
+                Task.data_type != None,
+                Task.required_value != None
+            )
+        ).all()
+
+        task_ids = [task_id for task_id, _, _ in tasks]
+        task_types = [data_type for _, data_type, _ in tasks]
+        task_required = np.fromiter(
+            (required for _, _, required in tasks), dtype=np.int64, count=len(tasks)
+        )
+
+        return task_ids, task_types, task_required
+
+    def load_samples(
+        self,
+        challenge_id: str,
+        data_types: List[str],
+        window_start: datetime,
+        window_end: datetime,
+        db: Session
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Load health samples in a window as user, type and value arrays."""
+
+        rows = db.query(HealthData.user_id, HealthData.data_type, HealthData.value).filter(
+            and_(
+                HealthData.challenge_id == challenge_id,
+                HealthData.data_type.in_(data_types),
+                HealthData.recorded_at >= window_start,
+                HealthData.recorded_at < window_end
+            )
+        ).all()
+
+        sample_users = np.array([user_id for user_id, _, _ in rows], dtype=str)
+        sample_types = np.array([data_type for _, data_type, _ in rows], dtype=str)
+        sample_values = np.fromiter(
+            (value for _, _, value in rows), dtype=np.int64, count=len(rows)
+        )
+
+        return sample_users, sample_types, sample_values
+
+    @staticmethod
+    def evaluate(
+        sample_participants: np.ndarray,
+        sample_types: np.ndarray,
+        sample_values: np.ndarray,
+        task_types: np.ndarray,
+        task_required: np.ndarray,
+        num_participants: int,
+        max_types: np.ndarray
+    ) -> np.ndarray:
+        """Return a (participants x tasks) boolean matrix of satisfied thresholds.
+
+        Samples are aggregated per (participant, data type) cell: summed for
+        cumulative types such as steps, and reduced to their peak for types
+        flagged in ``max_types``. Every task is then compared against the
+        aggregated column for its data type in a single broadcast.
+        """
+
+        num_types = max_types.size
+        cells = sample_participants * num_types + sample_types
+
+        # Sum in int64; bincount weights would accumulate in float64
+        totals = np.zeros(num_participants * num_types, dtype=np.int64)
+        np.add.at(totals, cells, sample_values.astype(np.int64, copy=False))
+
+        if max_types.any() and cells.size:
+            peaks = np.zeros_like(totals)
+            np.maximum.at(peaks, cells, sample_values.astype(np.int64, copy=False))
+            totals = np.where(np.tile(max_types, num_participants), peaks, totals)
+
+        totals = totals.reshape(num_participants, num_types)
+        return totals[:, task_types] >= task_required[np.newaxis, :]
@@ -0,0 +1,108 @@
+# Async stand-in for AsyncAlgodClient backed by the in-process local ledger
+from algosdk import error as algosdk_error
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.models import SimulateRequest
+from typing import Any, Callable, Dict, List, Optional
+import asyncio
+import time
+
+from .algod_client import AlgodHTTPError
+
+class LocalAlgodClient:
+    """Serves the AsyncAlgodClient interface from a contracts.local_ledger.LocalLedger.
+
+    Lets contract services, the outbox relay, the confirmation tracker and
+    the chain indexer run against ChallengePlatform with no network, e.g.
+    for throughput benchmarks. The ledger lives in the contracts package,
+    so the repository root must be importable.
+    """
+
+    def __init__(self, ledger: Any = None, block_time: Optional[float] = None):
+        if ledger is None:
+            from contracts.local_ledger import DEFAULT_BLOCK_TIME, LocalLedger
+            ledger = LocalLedger(block_time=block_time or DEFAULT_BLOCK_TIME)
+
+        self.ledger = ledger
+        # Same attribute as AsyncAlgodClient so sync callers keep working
+        self.sync_client = ledger
+        self.timeout = 10.0
+
+        # Number of simulate requests served, for asserting on batching
+        self.simulate_calls = 0
+
+    def put_box(self, app_id: int, name: bytes, value: bytes) -> None:
+        """Create or overwrite an application box."""
+        self.ledger.put_box(app_id, name, value)
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        raise AlgodHTTPError(501, f"local ledger does not serve {method} {path}")
+
+    async def run_sync(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any
+    ) -> Any:
+        return self._call(func, *args, **kwargs)
+
+    async def status(self) -> Dict[str, Any]:
+        return self._call(self.ledger.status)
+
+    async def status_after_block(self, round_num: int, timeout: Optional[float] = None) -> Dict[str, Any]:
+        deadline = time.monotonic() + (timeout or 60.0)
+        while True:
+            status = self._call(self.ledger.status)
+            if status["last-round"] > round_num or time.monotonic() >= deadline:
+                return status
+            await asyncio.sleep(self.ledger.block_time / 4)
+
+    async def suggested_params(self) -> SuggestedParams:
+        params = self._call(self.ledger.suggested_params)
+
+        # Flat min fee, as AsyncAlgodClient builds them
+        return SuggestedParams(
+            fee=params.min_fee,
+            first=params.first,
+            last=params.last,
+            gh=params.gh,
+            gen=params.gen,
+            flat_fee=True,
+            consensus_version=params.consensus_version,
+            min_fee=params.min_fee
+        )
+
+    async def send_transactions(self, signed_txns: List[Any]) -> str:
+        return self._call(self.ledger.send_transactions, signed_txns)
+
+    async def simulate(self, request: SimulateRequest) -> Dict[str, Any]:
+        self.simulate_calls += 1
+        return self._call(self.ledger.simulate_transactions, request)
+
+    async def pending_transaction_info(self, txid: str) -> Dict[str, Any]:
+        return self._call(self.ledger.pending_transaction_info, txid)
+
+    async def block_txids(self, round_num: int) -> List[str]:
+        return self._call(self.ledger.get_block_txids, round_num)["blockTxids"]
+
+    async def block(self, round_num: int) -> Dict[str, Any]:
+        return self._call(self.ledger.block_info, round_num)
+
+    async def application_info(self, app_id: int) -> Dict[str, Any]:
+        return self._call(self.ledger.application_info, app_id)
+
+    async def application_boxes(self, app_id: int) -> Dict[str, Any]:
+        return self._call(self.ledger.application_boxes, app_id)
+
+    async def application_box_by_name(self, app_id: int, box_name: bytes) -> Dict[str, Any]:
+        return self._call(self.ledger.application_box_by_name, app_id, box_name)
+
+    async def close(self) -> None:
+        pass
+
+    def _call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Surface ledger errors the way AsyncAlgodClient surfaces algod errors
+        try:
+            return func(*args, **kwargs)
+        except algosdk_error.AlgodHTTPError as e:
+            raise AlgodHTTPError(e.code or 400, str(e))
@@ -0,0 +1,211 @@
+# Merkle commitments for off-chain health data
+#
+# Health samples stay in the database. Once per day the backend builds one
+# Merkle tree per participant over that day's samples and commits only the
+# 32-byte root on chain (ChallengePlatform.commit_health_root). Any sample
+# can later be proven against the committed root with a log-sized proof.
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+import hashlib
+import json
+
+from ..models import Challenge, HealthData, HealthRoot, User
+from .contract_service import ContractService
+from .outbox_service import OutboxService
+
+# Domain separation so an inner node can never be passed off as a leaf
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+EPOCH = date(1970, 1, 1)
+
+def unix_day(value: datetime) -> int:
+    """Days since the unix epoch, the day number used on chain."""
+    return (value.date() - EPOCH).days
+
+def sample_leaf(sample: HealthData) -> Dict[str, Any]:
+    """Canonical fields of a health sample that are committed to."""
+    return {
+        "id": sample.id,
+        "data_type": sample.data_type,
+        "value": sample.value,
+        "recorded_at": sample.recorded_at.isoformat(),
+        "source": sample.source,
+        "verification_hash": sample.verification_hash,
+    }
+
+def leaf_hash(leaf: Dict[str, Any]) -> bytes:
+    encoded = json.dumps(leaf, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(LEAF_PREFIX + encoded).digest()
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+def build_levels(leaves: List[bytes]) -> List[List[bytes]]:
+    """Build all tree levels bottom-up; an unpaired node is promoted unchanged."""
+    if not leaves:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+def merkle_root(leaves: List[bytes]) -> bytes:
+    return build_levels(leaves)[-1][0]
+
+def merkle_proof(levels: List[List[bytes]], index: int) -> List[Dict[str, str]]:
+    """Sibling hashes from the leaf at index up to the root."""
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({
+                "hash": level[sibling].hex(),
+                "position": "left" if sibling < index else "right",
+            })
+        index //= 2
+    return proof
+
+def verify_proof(leaf: bytes, proof: List[Dict[str, str]], root: bytes) -> bool:
+    node = leaf
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        node = node_hash(sibling, node) if step["position"] == "left" else node_hash(node, sibling)
+    return node == root
+
+class MerkleService:
+    def __init__(self):
+        self.contract_service = ContractService()
+        self.outbox = OutboxService()
+
+    async def commit_day(
+        self,
+        challenge_id: str,
+        day: date,
+        db: Session
+    ) -> List[HealthRoot]:
+        """Commit one Merkle root per participant over a day of health samples."""
+
+        challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+        if not challenge:
+            raise ValueError("Challenge not found")
+
+        day_number = (day - EPOCH).days
+        window_start = datetime.combine(day, datetime.min.time())
+        window_end = window_start + timedelta(days=1)
+
+        samples = db.query(HealthData).filter(
+            and_(
+                HealthData.challenge_id == challenge_id,
+                HealthData.recorded_at >= window_start,
+                HealthData.recorded_at < window_end
+            )
+        ).order_by(HealthData.created_at, HealthData.id).all()
+
+        by_user: Dict[str, List[HealthData]] = {}
+        for sample in samples:
+            by_user.setdefault(sample.user_id, []).append(sample)
+
+        now = datetime.utcnow()
+        roots = []
+        for user_id, user_samples in by_user.items():
+            root = merkle_root([leaf_hash(sample_leaf(s)) for s in user_samples])
+
+            health_root = db.query(HealthRoot).filter(
+                and_(
+                    HealthRoot.challenge_id == challenge_id,
+                    HealthRoot.user_id == user_id,
+                    HealthRoot.day == day_number
+                )
+            ).first()
+            if health_root and health_root.root == root.hex():
+                roots.append(health_root)
+                continue
+
+            if not health_root:
+                health_root = HealthRoot(challenge_id=challenge_id, user_id=user_id, day=day_number)
+                db.add(health_root)
+            health_root.root = root.hex()
+            health_root.sample_count = len(user_samples)
+            health_root.committed_at = now
+
+            user = db.query(User).filter(User.id == user_id).first()
+
+            # Submitted by the outbox relay once this transaction commits
+            self.outbox.enqueue(
+                db,
+                method="commit_health_root",
+                app_id=self.contract_service.app_id,
+                payload={
+                    "challenge_id": challenge.contract_id,
+                    "participant_address": user.address,
+                    "day": day_number,
+                    "root": root.hex(),
+                    "sample_count": len(user_samples)
+                },
+                idempotency_key=f"commit_health_root:{challenge_id}:{user_id}:{day_number}:{root.hex()}"
+            )
+            roots.append(health_root)
+
+        db.commit()
+        return roots
+
+    async def get_proof(
+        self,
+        sample_id: str,
+        db: Session
+    ) -> Optional[Dict[str, Any]]:
+        """Get an inclusion proof of a health sample against its committed daily root."""
+
+        sample = db.query(HealthData).filter(HealthData.id == sample_id).first()
+        if not sample:
+            return None
+
+        day_number = unix_day(sample.recorded_at)
+        health_root = db.query(HealthRoot).filter(
+            and_(
+                HealthRoot.challenge_id == sample.challenge_id,
+                HealthRoot.user_id == sample.user_id,
+                HealthRoot.day == day_number
+            )
+        ).first()
+        if not health_root:
+            raise ValueError("Health data for this day has not been committed yet")
+
+        # Samples are appended in creation order, so the root covers a prefix
+        window_start = datetime.combine(sample.recorded_at.date(), datetime.min.time())
+        committed = db.query(HealthData).filter(
+            and_(
+                HealthData.challenge_id == sample.challenge_id,
+                HealthData.user_id == sample.user_id,
+                HealthData.recorded_at >= window_start,
+                HealthData.recorded_at < window_start + timedelta(days=1)
+            )
+        ).order_by(HealthData.created_at, HealthData.id).limit(health_root.sample_count).all()
+
+        ids = [s.id for s in committed]
+        if sample_id not in ids:
+            raise ValueError("Health sample is not covered by the committed root yet")
+
+        leaf = sample_leaf(sample)
+        levels = build_levels([leaf_hash(sample_leaf(s)) for s in committed])
+        proof = merkle_proof(levels, ids.index(sample_id))
+        root = bytes.fromhex(health_root.root)
+
+        return {
+            "sample": leaf,
+            "leaf": leaf_hash(leaf).hex(),
+            "proof": proof,
+            "root": health_root.root,
+            "day": day_number,
+            "sample_count": health_root.sample_count,
+            "committed_at": health_root.committed_at,
+            "verified": verify_proof(leaf_hash(leaf), proof, root)
+        }
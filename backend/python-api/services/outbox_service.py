@@ -0,0 +1,224 @@
+# Transactional outbox for contract calls made after database commits
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta
+import asyncio
+import json
+import os
+
+from ..database import SessionLocal
+from ..models import OutboxEvent
+from .contract_service import ContractService
+from .completion_batcher import CompletionBatcher, get_completion_batcher
+
+# Relay configuration
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "1"))
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "64"))
+OUTBOX_MAX_ATTEMPTS = 5
+# In-flight events older than this are assumed orphaned by a crashed relay
+OUTBOX_CLAIM_TIMEOUT = float(os.getenv("OUTBOX_CLAIM_TIMEOUT", "120"))
+
+class OutboxService:
+    def enqueue(
+        self,
+        db: Session,
+        method: str,
+        app_id: int,
+        payload: Dict[str, Any],
+        idempotency_key: str
+    ) -> OutboxEvent:
+        """Record a contract call in the caller's open transaction.
+
+        The event is only added to the session; it becomes visible to the
+        relay when the caller commits, together with the state change that
+        triggered it.
+        """
+
+        event = OutboxEvent(
+            idempotency_key=idempotency_key,
+            method=method,
+            app_id=app_id,
+            payload=json.dumps(payload),
+            status="pending"
+        )
+
+        db.add(event)
+        return event
+
+class OutboxRelay:
+    def __init__(
+        self,
+        contract_service: Optional[ContractService] = None,
+        completion_batcher: Optional[CompletionBatcher] = None,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL
+    ):
+        self.contract_service = contract_service or ContractService()
+        self.completion_batcher = completion_batcher or get_completion_batcher()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start draining the outbox in the background."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background relay."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def drain_once(self) -> int:
+        """Submit one batch of claimed events and return how many were processed."""
+
+        events = self._claim()
+        if not events:
+            return 0
+
+        results = await asyncio.gather(
+            *[self._attempt(event) for event in events],
+            return_exceptions=True
+        )
+        self._record(events, results)
+        return len(events)
+
+    def _claim(self) -> List[OutboxEvent]:
+        """Take a batch of events in flight, committing before any network I/O.
+
+        Row locks are held only by this short transaction, so parallel
+        relays skip rows being claimed but never wait on a chain
+        submission. Events left in flight by a crashed relay are claimed
+        again once their claim is stale.
+        """
+
+        db = SessionLocal(expire_on_commit=False)
+        try:
+            now = datetime.utcnow()
+            stale = now - timedelta(seconds=OUTBOX_CLAIM_TIMEOUT)
+            events = db.query(OutboxEvent).filter(or_(
+                OutboxEvent.status == "pending",
+                and_(OutboxEvent.status == "in_flight", OutboxEvent.claimed_at < stale)
+            )).order_by(OutboxEvent.created_at).limit(
+                self.batch_size
+            ).with_for_update(skip_locked=True).all()
+
+            for event in events:
+                event.status = "in_flight"
+                event.claimed_at = now
+                event.attempts = (event.attempts or 0) + 1
+
+            db.commit()
+            return events
+        finally:
+            db.close()
+
+    async def _attempt(self, event: OutboxEvent) -> Dict[str, Any]:
+        """Dispatch an event unless an earlier attempt of it already landed.
+
+        Every event is a single group, so its recorded transactions cover
+        all of it. A resubmission that algod rejects as already applied
+        comes back from ContractService as a success for the named call only.
+        """
+
+        if event.transaction_id and await self._confirmed(event.transaction_id):
+            return {"transaction_id": event.transaction_id}
+
+        return await self._dispatch(event)
+
+    async def _confirmed(self, transaction_id: str) -> bool:
+        """Whether every transaction recorded for an event is confirmed."""
+
+        for txid in transaction_id.split(","):
+            try:
+                info = await self.contract_service.algod.pending_transaction_info(txid)
+            except Exception:
+                # Unknown to the node: dropped, or confirmed too long ago to look up
+                return False
+            if not info.get("confirmed-round"):
+                return False
+        return True
+
+    def _record(self, events: List[OutboxEvent], results: List[Any]) -> None:
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            for event, result in zip(events, results):
+                if isinstance(result, Exception):
+                    update = {
+                        OutboxEvent.last_error: str(result),
+                        OutboxEvent.status: "failed" if event.attempts >= OUTBOX_MAX_ATTEMPTS else "pending",
+                        # Sent but unconfirmed calls keep their ids for the next attempt
+                        OutboxEvent.transaction_id: getattr(result, "transaction_id", None) or event.transaction_id
+                    }
+                else:
+                    update = {
+                        OutboxEvent.status: "confirmed",
+                        OutboxEvent.transaction_id: result.get("transaction_id") or event.transaction_id,
+                        OutboxEvent.last_error: None
+                    }
+                update[OutboxEvent.processed_at] = now
+
+                # Skip events another relay re-claimed after ours went stale
+                db.query(OutboxEvent).filter(
+                    OutboxEvent.id == event.id,
+                    OutboxEvent.claimed_at == event.claimed_at
+                ).update(update, synchronize_session=False)
+
+            db.commit()
+        finally:
+            db.close()
+
+    async def _dispatch(self, event: OutboxEvent) -> Dict[str, Any]:
+        payload = json.loads(event.payload)
+
+        if event.method == "complete_task":
+            # Concurrent completions are grouped into atomic groups by the batcher
+            return await self.completion_batcher.submit(
+                app_id=event.app_id,
+                challenge_id=payload["challenge_id"],
+                task_id=payload["task_id"],
+                participant_address=payload["participant_address"],
+                proof_data=payload["proof_data"],
+                idempotency_key=event.idempotency_key
+            )
+
+        if event.method == "process_weekly_elimination":
+            return await self.contract_service.process_weekly_elimination(
+                idempotency_key=event.idempotency_key, **payload
+            )
+
+        if event.method == "process_due_eliminations":
+            result = await self.contract_service.process_due_eliminations(
+                idempotency_key=event.idempotency_key, **payload
+            )
+            # Queued one batch per event, so this is a single group
+            return {**result, "transaction_id": ",".join(result["transaction_ids"])}
+
+        if event.method == "commit_health_root":
+            return await self.contract_service.commit_health_root(
+                idempotency_key=event.idempotency_key, **payload
+            )
+
+        raise ValueError(f"Unknown outbox method: {event.method}")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed = await self.drain_once()
+                # Keep draining without sleeping while there is a backlog
+                if processed < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error draining contract outbox: {e}")
+                await asyncio.sleep(self.poll_interval)
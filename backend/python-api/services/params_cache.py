@@ -0,0 +1,121 @@
+# Suggested-params cache shared by every transaction builder
+from algosdk.transaction import SuggestedParams
+from typing import Optional
+import asyncio
+import copy
+import os
+import time
+
+from .algod_client import AsyncAlgodClient, get_algod_client
+
+# Cached params are considered fresh for roughly one round
+PARAMS_TTL = float(os.getenv("ALGOD_PARAMS_TTL", "4"))
+# Fee and consensus version are re-read from algod every N rounds
+PARAMS_FULL_REFRESH_ROUNDS = 20
+# Validity window used for transactions built from cached params
+VALIDITY_ROUNDS = 1000
+
+class SuggestedParamsCache:
+    def __init__(self, client: Optional[AsyncAlgodClient] = None, ttl: float = PARAMS_TTL):
+        self.client = client or get_algod_client()
+        self.ttl = ttl
+
+        self._params: Optional[SuggestedParams] = None
+        self._fetched_at = 0.0
+        self._full_refresh_round = 0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get(self) -> SuggestedParams:
+        """Get suggested params, fetching from algod only when the cache is stale."""
+
+        if self._is_fresh():
+            return copy.copy(self._params)
+
+        async with self._lock:
+            # Another waiter may have refreshed while we queued on the lock
+            if not self._is_fresh():
+                await self._fetch()
+
+        return copy.copy(self._params)
+
+    def peek(self) -> Optional[SuggestedParams]:
+        """Get the last cached params without touching the network."""
+
+        return copy.copy(self._params) if self._params is not None else None
+
+    @property
+    def genesis_id(self) -> Optional[str]:
+        return self._params.gen if self._params is not None else None
+
+    @property
+    def genesis_hash(self) -> Optional[str]:
+        return self._params.gh if self._params is not None else None
+
+    async def start(self) -> None:
+        """Start refreshing the cache in the background once per round."""
+
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._follow_rounds())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def _is_fresh(self) -> bool:
+        return self._params is not None and time.monotonic() - self._fetched_at < self.ttl
+
+    async def _fetch(self) -> None:
+        self._params = await self.client.suggested_params()
+        self._fetched_at = time.monotonic()
+        self._full_refresh_round = self._params.first
+
+    def _advance(self, last_round: int) -> None:
+        # Genesis and fee do not change between rounds, only the validity window
+        params = copy.copy(self._params)
+        params.first = last_round
+        params.last = last_round + VALIDITY_ROUNDS
+        self._params = params
+        self._fetched_at = time.monotonic()
+
+    async def _follow_rounds(self) -> None:
+        while True:
+            try:
+                if self._params is None:
+                    async with self._lock:
+                        await self._fetch()
+
+                # One long-poll per round keeps the validity window current
+                status = await self.client.status_after_block(self._params.first)
+                last_round = status["last-round"]
+
+                if last_round - self._full_refresh_round >= PARAMS_FULL_REFRESH_ROUNDS:
+                    async with self._lock:
+                        await self._fetch()
+                else:
+                    self._advance(last_round)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error refreshing suggested params: {e}")
+                await asyncio.sleep(self.ttl)
+
+# Process-wide cache shared by every service
+_shared_cache: Optional[SuggestedParamsCache] = None
+
+def get_params_cache() -> SuggestedParamsCache:
+    """Get the shared suggested-params cache, creating it on first use."""
+    global _shared_cache
+
+    if _shared_cache is None:
+        _shared_cache = SuggestedParamsCache()
+
+    return _shared_cache
@@ -1,16 +1,20 @@
 # Ranking service for managing weekly rankings and eliminations
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
+import hashlib
+import json
 
-from ..models import Challenge, ChallengeParticipant, WeeklyRanking, ParticipantRanking, TaskCompletion
+from ..models import Challenge, ChallengeParticipant, WeeklyRanking, ParticipantRanking, TaskCompletion, User
 from ..schemas import WeeklyRankingResponse, ParticipantRankingBase
 from .contract_service import ContractService
+from .outbox_service import OutboxService
 
 class RankingService:
     def __init__(self):
         self.contract_service = ContractService()
+        self.outbox = OutboxService()
 
     async def get_weekly_rankings(
         self, 
@@ -38,6 +42,19 @@ class RankingService:
         
         return result
 
+    async def get_leaderboard_summary(
+        self,
+        challenge_id: str,
+        db: Session
+    ) -> Optional[dict]:
+        """Get on-chain leaderboard totals for a challenge."""
+        
+        challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
+        if not challenge:
+            return None
+        
+        return await self.contract_service.get_leaderboard_summary(challenge.contract_id)
+
     async def process_weekly_elimination(
         self, 
         challenge_id: str, 
@@ -58,6 +75,33 @@ class RankingService:
         if challenge.creator_id != user.id:
             raise ValueError("Only challenge creator can process eliminations")
         
+        result, eliminated_participant = self._record_elimination(challenge, db)
+        
+        # Queue the contract call in the same transaction (submitted by the outbox relay)
+        self.outbox.enqueue(
+            db,
+            method="process_weekly_elimination",
+            app_id=self.contract_service.app_id,
+            payload={
+                "challenge_id": challenge.contract_id,
+                "lowest_performer": eliminated_participant.participant_address
+            },
+            idempotency_key=f"process_weekly_elimination:{challenge_id}:{result['week']}"
+        )
+        
+        db.commit()
+        
+        return result
+
+    def _record_elimination(
+        self,
+        challenge: Challenge,
+        db: Session
+    ) -> Tuple[dict, ChallengeParticipant]:
+        """Rank this week's active participants and eliminate the lowest performer (not committed)."""
+        
+        challenge_id = challenge.id
+        
         # Check if it's time for weekly elimination
         now = datetime.utcnow()
         time_since_start = now - challenge.start_date
@@ -134,19 +178,7 @@ class RankingService:
         eliminated_participant.eliminated_at = now
         eliminated_participant.elimination_round = current_week
         
-        db.commit()
-        
-        # Call smart contract to process elimination
-        try:
-            await self.contract_service.process_weekly_elimination(
-                contract_address=challenge.contract_address
-            )
-        except Exception as e:
-            # Rollback database changes if contract call fails
-            db.rollback()
-            raise Exception(f"Failed to process elimination on smart contract: {str(e)}")
-        
-        return {
+        result = {
             "message": "Weekly elimination processed successfully",
             "eliminated_participant": {
                 "id": eliminated_participant.id,
@@ -155,9 +187,16 @@ class RankingService:
             },
             "week": current_week
         }
+        return result, eliminated_participant
 
     async def process_due_eliminations(self, db: Session) -> List[dict]:
-        """Process eliminations for all challenges that are due."""
+        """Process eliminations for all challenges that are due.
+        
+        Every due elimination is recorded in one database transaction and
+        queued as process_due_eliminations outbox events of one group each,
+        so a week boundary costs a few grouped calls instead of one call per
+        challenge, and the relay tracks every group on its own.
+        """
         
         # Get all active challenges
         active_challenges = db.query(Challenge).filter(
@@ -165,6 +204,8 @@ class RankingService:
         ).all()
         
         processed = []
+        eliminations = []
+        eliminated_weeks = []
         
         for challenge in active_challenges:
             try:
@@ -183,18 +224,36 @@ class RankingService:
                     ).first()
                     
                     if not existing_ranking:
-                        # Process elimination for this challenge
-                        result = await self.process_weekly_elimination(
-                            challenge.id, 
-                            challenge.creator, 
-                            db
-                        )
+                        # A savepoint per challenge, so one failure keeps the others
+                        with db.begin_nested():
+                            result, eliminated_participant = self._record_elimination(challenge, db)
                         processed.append(result)
+                        eliminations.append({
+                            "challenge_id": challenge.contract_id,
+                            "lowest_performer": eliminated_participant.participant_address
+                        })
+                        eliminated_weeks.append(f"{challenge.id}:{result['week']}")
                         
             except Exception as e:
                 print(f"Error processing elimination for challenge {challenge.id}: {e}")
                 continue
         
+        if eliminations:
+            # Queued with the rankings above, one event per group-sized batch
+            idempotency_key = "process_due_eliminations:" + hashlib.sha256(
+                ",".join(eliminated_weeks).encode()
+            ).hexdigest()
+            for batch_no, batch in enumerate(self.contract_service.elimination_batches(eliminations)):
+                self.outbox.enqueue(
+                    db,
+                    method="process_due_eliminations",
+                    app_id=self.contract_service.app_id,
+                    payload={"eliminations": batch},
+                    idempotency_key=f"{idempotency_key}:{batch_no}"
+                )
+        
+        db.commit()
+        
         return processed
 
     async def get_participant_rankings(
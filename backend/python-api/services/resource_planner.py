@@ -0,0 +1,354 @@
+# Box reference and resource planning for ChallengePlatform calls
+#
+# Every contract method touches a known set of BoxMaps. METHOD_BOXES declares
+# them per method; each box key is derived from the call's ABI arguments, its
+# sender and the locally indexed chain state. Since AVM v9 an app call may use
+# any box or account referenced anywhere in its group, so a plan takes the
+# union of what every call of a group needs and only has to fit it into the
+# group's reference slots, adding op_up calls when the calls themselves are full.
+from algosdk import encoding
+from algosdk.abi import Method
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import base64
+import time
+
+from .chain_indexer import ChainStateStore
+
+# References one transaction can carry: boxes, accounts, apps and assets together
+MAX_TXN_REFS = 8
+# Foreign accounts one transaction can carry
+MAX_TXN_ACCOUNTS = 4
+# Seconds per challenge week (week_duration in the contract)
+WEEK_DURATION = 604800
+# The latest block timestamp may differ from the local clock by this much
+CLOCK_SKEW = 60
+
+# Boxes and accounts one transaction references
+TxnRefs = Tuple[List[bytes], List[str]]
+
+def box_name(box_map: str, *key: Any) -> bytes:
+    """Box name of a BoxMap entry: the map prefix followed by the ARC-4 encoded key."""
+    encoded = [
+        encoding.decode_address(part) if isinstance(part, str) else part.to_bytes(8, "big")
+        for part in key
+    ]
+    return box_map.encode() + b"".join(encoded)
+
+def unnamed_resources(group: Dict[str, Any]) -> Tuple[List[bytes], List[str], int]:
+    """Boxes, accounts and extra box refs a simulated group used without referencing them."""
+    reports = [group.get("unnamed-resources-accessed", {})] + [
+        result.get("unnamed-resources-accessed", {}) for result in group.get("txn-results", [])
+    ]
+    boxes: List[bytes] = []
+    accounts: List[str] = []
+    extra_box_refs = 0
+    for report in reports:
+        boxes.extend(base64.b64decode(box["name"]) for box in report.get("boxes", []))
+        accounts.extend(report.get("accounts", []))
+        extra_box_refs += report.get("extra-box-refs", 0)
+    return boxes, accounts, extra_box_refs
+
+class PlannedCall:
+    """One app call of a group: its method, ABI arguments by name and sender."""
+
+    def __init__(self, method: Method, args: List[Any], sender: str):
+        self.method = method
+        self.args = {arg.name: value for arg, value in zip(method.args, args)}
+        self.sender = sender
+
+class PlanState:
+    """Chain state seen by the calls of a group, including earlier calls of the same group."""
+
+    def __init__(self, chain_state: ChainStateStore, now: float):
+        self.chain_state = chain_state
+        self.now = now
+        # (challenge_id, address) -> completions recorded earlier in the group
+        self._pending_tasks: Dict[Tuple[int, str], int] = {}
+        # challenge_id -> task count -> active participants, for non-empty buckets
+        self._buckets: Dict[int, Dict[int, int]] = {}
+
+    def tasks_completed(self, challenge_id: int, address: str) -> int:
+        participant = self.chain_state.get("participants", challenge_id, {}).get(address)
+        indexed = int(participant["tasks_completed"]) if participant is not None else 0
+        return indexed + self._pending_tasks.get((challenge_id, address), 0)
+
+    def buckets(self, challenge_id: int) -> Dict[int, int]:
+        """Non-empty completion buckets of a challenge, following the indexed links up from min_tasks."""
+        if challenge_id not in self._buckets:
+            buckets: Dict[int, int] = {}
+            tracker = self.chain_state.get("elimination_trackers", challenge_id)
+            tasks = tracker["min_tasks"] if tracker and tracker["active_count"] else None
+            while tasks is not None and tasks not in buckets:
+                bucket = self.chain_state.get("completion_buckets", (challenge_id, tasks))
+                if not bucket or not bucket["count"]:
+                    break
+                buckets[tasks] = bucket["count"]
+                tasks = bucket["higher"]
+            self._buckets[challenge_id] = buckets
+        return self._buckets[challenge_id]
+
+    def neighbours(self, challenge_id: int, tasks: int) -> List[int]:
+        """The next lower and next higher non-empty task counts around a bucket, where they exist."""
+        buckets = self.buckets(challenge_id)
+        lower = [count for count in buckets if count < tasks]
+        higher = [count for count in buckets if count > tasks]
+        return ([max(lower)] if lower else []) + ([min(higher)] if higher else [])
+
+    def _bucket_add(self, challenge_id: int, tasks: int) -> None:
+        buckets = self.buckets(challenge_id)
+        buckets[tasks] = buckets.get(tasks, 0) + 1
+
+    def _bucket_remove(self, challenge_id: int, tasks: int) -> None:
+        buckets = self.buckets(challenge_id)
+        if buckets.get(tasks, 0) > 1:
+            buckets[tasks] -= 1
+        else:
+            buckets.pop(tasks, None)
+
+    def weeks(self, challenge_id: int) -> List[int]:
+        """Challenge weeks the next block can fall in (both, close to a week boundary)."""
+        metadata = self.chain_state.get("challenge_metadata", challenge_id)
+        if metadata is None:
+            return [0]
+        start_time = metadata["start_time"]
+        return sorted({
+            max(0, int(timestamp) - start_time) // WEEK_DURATION
+            for timestamp in (self.now - CLOCK_SKEW, self.now + CLOCK_SKEW)
+        })
+
+    def record(self, call: PlannedCall) -> None:
+        name = call.method.name
+        if name in ("create_challenge", "join_challenge"):
+            self._bucket_add(call.args["challenge_id"], 0)
+        elif name == "leave_challenge":
+            challenge_id = call.args["challenge_id"]
+            self._bucket_remove(challenge_id, self.tasks_completed(challenge_id, call.sender))
+        elif name == "complete_task":
+            challenge_id = call.args["challenge_id"]
+            key = (challenge_id, call.args["participant_address"])
+            tasks = self.tasks_completed(*key)
+            self._bucket_add(challenge_id, tasks + 1)
+            self._bucket_remove(challenge_id, tasks)
+            self._pending_tasks[key] = self._pending_tasks.get(key, 0) + 1
+        elif name in ("process_weekly_elimination", "process_due_eliminations"):
+            for challenge_id, address in _eliminations(call):
+                self._bucket_remove(challenge_id, self.tasks_completed(challenge_id, address))
+
+# ===== BOX KEYS =====
+# Each returns the keys one call touches in a box map
+
+KeyFn = Callable[[PlannedCall, PlanState], Iterable[Tuple[Any, ...]]]
+
+def _challenge(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["challenge_id"],)]
+
+def _sender_participant(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["challenge_id"], call.sender)]
+
+def _sender_deposit(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.sender,)]
+
+def _participant(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["challenge_id"], call.args["participant_address"])]
+
+def _participant_deposit(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["participant_address"],)]
+
+def _removed_buckets(state: PlanState, challenge_id: int, tasks: int) -> List[Tuple[Any, ...]]:
+    # Leaving a bucket; its neighbours are relinked once it is empty
+    keys = [(challenge_id, tasks)]
+    if state.buckets(challenge_id).get(tasks, 0) <= 1:
+        keys += [(challenge_id, count) for count in state.neighbours(challenge_id, tasks)]
+    return keys
+
+def _first_bucket(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    # An empty bucket 0 is linked in below the current lowest one
+    challenge_id = call.args["challenge_id"]
+    keys = [(challenge_id, 0)]
+    if 0 not in state.buckets(challenge_id):
+        keys += [(challenge_id, count) for count in state.neighbours(challenge_id, 0)]
+    return keys
+
+def _sender_bucket(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    challenge_id = call.args["challenge_id"]
+    return _removed_buckets(state, challenge_id, state.tasks_completed(challenge_id, call.sender))
+
+def _completion_buckets(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    # The participant moves from its bucket to the next one, which is linked
+    # in above it if empty
+    challenge_id = call.args["challenge_id"]
+    tasks = state.tasks_completed(challenge_id, call.args["participant_address"])
+    keys = _removed_buckets(state, challenge_id, tasks) + [(challenge_id, tasks + 1)]
+    if tasks + 1 not in state.buckets(challenge_id):
+        keys += [(challenge_id, count) for count in state.neighbours(challenge_id, tasks)[-1:] if count > tasks]
+    return keys
+
+def _completion_weeks(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    challenge_id = call.args["challenge_id"]
+    address = call.args["participant_address"]
+    return [(challenge_id, address, week) for week in state.weeks(challenge_id)]
+
+def _health_root(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["challenge_id"], call.args["participant_address"], call.args["day"])]
+
+def _winners(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(call.args["challenge_id"], winner) for winner in call.args["winners"]]
+
+def _winner_deposits(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(winner,) for winner in call.args["winners"]]
+
+def _eliminations(call: PlannedCall) -> List[Tuple[int, str]]:
+    if "eliminations" in call.args:
+        return [tuple(elimination) for elimination in call.args["eliminations"]]
+    return [(call.args["challenge_id"], call.args["lowest_performer"])]
+
+def _elimination_challenges(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return [(challenge_id,) for challenge_id, _ in _eliminations(call)]
+
+def _lowest_performers(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    return _eliminations(call)
+
+def _elimination_buckets(call: PlannedCall, state: PlanState) -> Iterable[Tuple[Any, ...]]:
+    # The performer's bucket and, once it empties, the next one up
+    return [
+        key
+        for challenge_id, address in _eliminations(call)
+        for key in _removed_buckets(state, challenge_id, state.tasks_completed(challenge_id, address))
+    ]
+
+ELIMINATION_BOXES: List[Tuple[str, KeyFn]] = [
+    ("challenge_metadata", _elimination_challenges),
+    ("challenge_states", _elimination_challenges),
+    ("elimination_trackers", _elimination_challenges),
+    ("weekly_rankings", _elimination_challenges),
+    ("participants", _lowest_performers),
+    ("completion_buckets", _elimination_buckets),
+]
+
+# Method -> (box map, key function) of every box the method reads or writes
+METHOD_BOXES: Dict[str, List[Tuple[str, KeyFn]]] = {
+    "create_challenge": [
+        ("challenge_metadata", _challenge),
+        ("challenge_states", _challenge),
+        ("participants", _sender_participant),
+        ("participant_index", _challenge),
+        ("participant_counts", _challenge),
+        ("elimination_trackers", _challenge),
+        ("completion_buckets", _first_bucket),
+        ("deposited", _sender_deposit),
+    ],
+    "join_challenge": [
+        ("challenge_metadata", _challenge),
+        ("challenge_states", _challenge),
+        ("participants", _sender_participant),
+        ("participant_index", _challenge),
+        ("participant_counts", _challenge),
+        ("elimination_trackers", _challenge),
+        ("completion_buckets", _first_bucket),
+        ("deposited", _sender_deposit),
+    ],
+    "leave_challenge": [
+        ("challenge_states", _challenge),
+        ("participants", _sender_participant),
+        ("elimination_trackers", _challenge),
+        ("completion_buckets", _sender_bucket),
+    ],
+    "complete_task": [
+        ("challenge_metadata", _challenge),
+        ("challenge_states", _challenge),
+        ("participants", _participant),
+        ("weekly_completions", _completion_weeks),
+        ("elimination_trackers", _challenge),
+        ("completion_buckets", _completion_buckets),
+        ("deposited", _participant_deposit),
+    ],
+    "process_weekly_elimination": ELIMINATION_BOXES,
+    "process_due_eliminations": ELIMINATION_BOXES,
+    "distribute_pool": [
+        ("challenge_metadata", _challenge),
+        ("challenge_states", _challenge),
+        ("payout_plans", _challenge),
+        ("elimination_trackers", _challenge),
+        ("participants", _winners),
+        ("deposited", _winner_deposits),
+    ],
+    "commit_health_root": [
+        ("challenge_states", _challenge),
+        ("participants", _participant),
+        ("health_roots", _health_root),
+    ],
+    "op_up": [],
+}
+
+# Method -> accounts it needs beyond the sender, e.g. inner payment receivers
+METHOD_ACCOUNTS: Dict[str, Callable[[PlannedCall], Iterable[str]]] = {
+    "distribute_pool": lambda call: call.args["winners"],
+}
+
+class ResourcePlan:
+    """Boxes and accounts a group needs, packed into its transactions."""
+
+    def __init__(self):
+        self.boxes: List[bytes] = []
+        self.accounts: List[str] = []
+        # Empty box refs that only add box I/O quota
+        self.extra_box_refs = 0
+
+    def add(self, boxes: Iterable[bytes] = (), accounts: Iterable[str] = (), extra_box_refs: int = 0) -> None:
+        """Add references, skipping ones the plan already has."""
+        for name in boxes:
+            if name not in self.boxes:
+                self.boxes.append(name)
+        for address in accounts:
+            if address not in self.accounts:
+                self.accounts.append(address)
+        self.extra_box_refs += extra_box_refs
+
+    def transactions_needed(self) -> int:
+        """Fewest app calls whose reference slots hold the whole plan."""
+        refs = len(self.boxes) + self.extra_box_refs + len(self.accounts)
+        return max(1, -(-refs // MAX_TXN_REFS), -(-len(self.accounts) // MAX_TXN_ACCOUNTS))
+
+    def pack(self, call_count: int, max_padding: int) -> Tuple[List[TxnRefs], List[TxnRefs]]:
+        """Spread the references over the calls, then over as few padding calls as possible.
+
+        Returns the references of each call and of each padding (op_up) call.
+        Raises ValueError if more than max_padding padding calls would be needed.
+        """
+        padding = max(0, self.transactions_needed() - call_count)
+        if padding > max_padding:
+            raise ValueError(
+                f"Group needs {padding} extra calls for its references, at most {max_padding} fit"
+            )
+
+        slots: List[TxnRefs] = [([], []) for _ in range(call_count + padding)]
+        # Accounts first, since only four fit per transaction
+        for index, address in enumerate(self.accounts):
+            slots[index // MAX_TXN_ACCOUNTS][1].append(address)
+        free = (slot for slot in slots for _ in range(MAX_TXN_REFS - len(slot[1])))
+        for name in self.boxes + [b""] * self.extra_box_refs:
+            next(free)[0].append(name)
+
+        return slots[:call_count], slots[call_count:]
+
+class ResourcePlanner:
+    def __init__(self, chain_state: ChainStateStore):
+        self.chain_state = chain_state
+
+    def plan(self, calls: List[PlannedCall], now: Optional[float] = None) -> ResourcePlan:
+        """Collect the boxes and accounts of a group's calls, in group order."""
+        state = PlanState(self.chain_state, time.time() if now is None else now)
+        plan = ResourcePlan()
+        for call in calls:
+            if call.method.name not in METHOD_BOXES:
+                raise ValueError(f"No resource map for {call.method.name}")
+            plan.add(
+                boxes=[
+                    box_name(box_map, *key)
+                    for box_map, keys in METHOD_BOXES[call.method.name]
+                    for key in keys(call, state)
+                ],
+                accounts=METHOD_ACCOUNTS.get(call.method.name, lambda _: [])(call)
+            )
+            state.record(call)
+        return plan
@@ -4,10 +4,16 @@ from sqlalchemy import and_, desc
 from typing import List, Optional
 from datetime import datetime
 
-from ..models import Task, TaskCompletion, ChallengeParticipant
+from ..models import Task, TaskCompletion, Challenge, ChallengeParticipant, User
 from ..schemas import TaskCreate, TaskResponse
+from .contract_service import ContractService
+from .outbox_service import OutboxService
 
 class TaskService:
+    def __init__(self):
+        self.contract_service = ContractService()
+        self.outbox = OutboxService()
+
     async def get_tasks(
         self, 
         challenge_id: str, 
@@ -45,6 +51,8 @@ class TaskService:
             title=task_data.title,
             description=task_data.description,
             points=task_data.points,
+            required_value=task_data.required_value,
+            data_type=task_data.data_type,
             due_date=task_data.due_date
         )
         
@@ -100,25 +108,26 @@ class TaskService:
         )
         
         db.add(completion)
-        db.commit()
         
         # Update participant's task count
         participant.tasks_completed = (participant.tasks_completed or 0) + 1
         
-        db.commit()
+        # Queue the contract call in the same transaction; the outbox relay
+        # submits it batched with other completions
+        self.outbox.enqueue(
+            db,
+            method="complete_task",
+            app_id=self.contract_service.app_id,
+            payload={
+                "challenge_id": task.challenge.contract_id,
+                "task_id": self.contract_service.to_chain_id(task_id),
+                "participant_address": user.address,
+                "proof_data": "placeholder"
+            },
+            idempotency_key=f"complete_task:{task_id}:{user.id}"
+        )
         
-        # Call smart contract to record completion
-        try:
-            await self.contract_service.complete_task(
-                contract_address=task.challenge.contract_address,
-                participant_address=user.address,
-                task_id=task_id,
-                proof_data="placeholder"
-            )
-        except Exception as e:
-            # Rollback database changes if contract call fails
-            db.rollback()
-            raise Exception(f"Failed to record task completion on smart contract: {str(e)}")
+        db.commit()
         
         return {
             "message": "Task completed successfully",
@@ -4,25 +4,65 @@
 from .challenge_contract import ChallengePlatform
 from .contract_types import (
     Challenge,
+    ChallengeMetadata,
+    ChallengeState,
     Participant,
+    ParticipantKey,
+    EliminationTracker,
+    EliminationRequest,
+    LeaderboardSummary,
+    CompletionBucketKey,
+    CompletionBucket,
     WeeklyRanking,
-    TaskCompletion,
+    WeeklyCompletionKey,
+    WeeklyCompletions,
     PoolDistribution,
+    PayoutPlan,
     ChatMessage,
+    ChatMessagePage,
+    ChatPageKey,
     HealthData,
+    HealthRootKey,
+    HealthRoot,
     PlatformRevenue,
     Task,
+    TaskPage,
+    ParticipantJoined,
+    TaskCompleted,
+    ChatMessageSent,
+    ParticipantEliminated,
+    PoolPaid,
 )
 
 __all__ = [
     "ChallengePlatform",
     "Challenge",
+    "ChallengeMetadata",
+    "ChallengeState",
     "Participant", 
+    "ParticipantKey",
+    "EliminationTracker",
+    "EliminationRequest",
+    "LeaderboardSummary",
+    "CompletionBucketKey",
+    "CompletionBucket",
     "WeeklyRanking",
-    "TaskCompletion",
+    "WeeklyCompletionKey",
+    "WeeklyCompletions",
     "PoolDistribution",
+    "PayoutPlan",
     "ChatMessage",
+    "ChatMessagePage",
+    "ChatPageKey",
     "HealthData",
+    "HealthRootKey",
+    "HealthRoot",
     "PlatformRevenue",
     "Task",
+    "TaskPage",
+    "ParticipantJoined",
+    "TaskCompleted",
+    "ChatMessageSent",
+    "ParticipantEliminated",
+    "PoolPaid",
 ]
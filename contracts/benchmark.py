@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Opcode cost and box I/O benchmark for ChallengePlatform methods
+
+Builds a challenge with a given number of participants and chat messages,
+then measures join_challenge, complete_task, send_chat_message and
+distribute_pool against it:
+
+- box references, box bytes read / written and the app's MBR delta, by
+  running the contract with the algopy testing framework (offline)
+- opcode cost of the compiled TEAL in contracts/artifacts (contracts/build.py),
+  simulated on an AlgoKit LocalNet when one is reachable
+
+Results are written as a JSON baseline. Pass --compare with an earlier
+baseline to exit non-zero when a metric regressed.
+
+Usage:
+    python contracts/benchmark.py --participants 1,10,30 --messages 0,16,64
+    python contracts/benchmark.py --compare contracts/artifacts/benchmark_baseline.json
+"""
+
+import argparse
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from algosdk import account, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+)
+from algosdk.kmd import KMDClient
+from algosdk.v2client import algod
+from algosdk.v2client.models import SimulateRequest
+from contracts.local_ledger import CHALLENGE_PLATFORM_SELECTORS, MIN_FEE
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "http://localhost:4001")
+KMD_SERVER = os.getenv("KMD_SERVER", "http://localhost:4002")
+LOCALNET_TOKEN = "a" * 64
+
+ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
+APPROVAL_PATH = ARTIFACTS_DIR / "challenge_platform_approval.teal"
+CLEAR_PATH = ARTIFACTS_DIR / "challenge_platform_clear.teal"
+DEFAULT_OUTPUT = ARTIFACTS_DIR / "benchmark_baseline.json"
+
+METHODS = {method.name: method for method in CHALLENGE_PLATFORM_SELECTORS.values()}
+METRICS = ("opcode_cost", "box_refs", "box_bytes_read", "box_bytes_written", "mbr_delta")
+
+# Box minimum balance: flat per box plus per byte of name and value
+BOX_FLAT_MBR = 2500
+BOX_BYTE_MBR = 400
+# Resource references a single app call may carry
+MAX_TXN_REFS = 8
+MAX_TXN_ACCOUNTS = 4
+
+STAKE_AMOUNT = 100_000
+MESSAGE = "benchmark message"
+PROOF_DATA = "benchmark proof"
+# Past the 21 day challenge duration, so the next elimination closes it
+CLOSE_OFFSET = 22 * 86400
+# Winners paid per distribute_pool call (contracts/challenge_contract.py)
+PAYOUT_PAGE_SIZE = 8
+
+def box_mbr(name: bytes, value: Optional[bytes]) -> int:
+    """Minimum balance a box holds in the app account."""
+    if value is None:
+        return 0
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (len(name) + len(value))
+
+def _parse_counts(value: str) -> List[int]:
+    return sorted({int(part) for part in value.split(",") if part.strip()})
+
+class Account:
+    def __init__(self, address: str, signer: Any = None):
+        self.address = address
+        self.signer = signer
+
+# ===== ALGOPY TESTING BACKEND =====
+
+class BoxTracker:
+    """Records the boxes a call touches on an algopy testing ledger.
+
+    Box operations go through the ledger context, so wrapping its box
+    methods sees every BoxMap access and op.Box call of the contract.
+    """
+
+    WRAPPED = ("get_box", "box_exists", "set_box", "delete_box")
+
+    def __init__(self, ledger: Any, app: Any):
+        self.ledger = ledger
+        self.app = app
+        self.before: Dict[bytes, Optional[bytes]] = {}
+        self.read: set = set()
+        self.written: set = set()
+        self._original = {name: getattr(ledger, name) for name in self.WRAPPED}
+
+    @contextlib.contextmanager
+    def tracking(self):
+        for name in self.WRAPPED:
+            setattr(self.ledger, name, self._wrap(name))
+        try:
+            yield self
+        finally:
+            for name in self.WRAPPED:
+                delattr(self.ledger, name)
+
+    def metrics(self) -> Dict[str, Any]:
+        after = {name: self._value(name) for name in self.before}
+        return {
+            "opcode_cost": None,
+            "box_refs": len(self.before),
+            "box_bytes_read": sum(len(self.before[name] or b"") for name in self.read),
+            "box_bytes_written": sum(len(after[name] or b"") for name in self.written),
+            "mbr_delta": sum(
+                box_mbr(name, after[name]) - box_mbr(name, self.before[name]) for name in self.before
+            ),
+        }
+
+    def _wrap(self, operation: str):
+        original = self._original[operation]
+        touched = self.written if operation in ("set_box", "delete_box") else self.read
+
+        def wrapper(app, key, *args, **kwargs):
+            name = bytes(getattr(key, "value", key))
+            if name not in self.before:
+                self.before[name] = self._value(name)
+            touched.add(name)
+            return original(app, key, *args, **kwargs)
+
+        return wrapper
+
+    def _value(self, name: bytes) -> Optional[bytes]:
+        if not self._original["box_exists"](self.app, name):
+            return None
+        return bytes(self._original["get_box"](self.app, name))
+
+class AlgopyBackend:
+    """Runs the contract in-process; measures box I/O and MBR, not opcodes."""
+
+    name = "algopy"
+    START_TIMESTAMP = 1_700_000_000
+    APP_ADDRESS = logic.get_application_address(1)
+
+    def __init__(self):
+        from contracts.local_ledger import AlgopyApp
+
+        self._app_class = AlgopyApp
+        self.executor = None
+        self.timestamp = self.START_TIMESTAMP
+        self.round = 1
+        self.params = transaction.SuggestedParams(
+            fee=MIN_FEE, first=1, last=1000,
+            gh=base64.b64encode(bytes(32)).decode(), flat_fee=True
+        )
+
+    @staticmethod
+    def available() -> bool:
+        try:
+            import algopy_testing  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def new_scenario(self) -> None:
+        self.executor = None
+        self.timestamp = self.START_TIMESTAMP
+
+    def new_account(self) -> Account:
+        return Account(account.generate_account()[1])
+
+    def advance_time(self, seconds: int) -> None:
+        self.timestamp += seconds
+
+    def end_scenario(self) -> None:
+        self.executor = None
+
+    def call(
+        self,
+        sender: Account,
+        method_name: str,
+        args: List[Any],
+        payment: int = 0,
+        inner_txns: int = 0,
+        measure: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        if self.executor is None:
+            # The first caller creates the app, as the creator of a deployment
+            self.executor = self._app_class(sender.address, {})
+
+        method = METHODS[method_name]
+        encoded = [
+            arg.type.encode(value)
+            for arg, value in zip([arg for arg in method.args if arg.type != "pay"], args)
+        ]
+        payments = [transaction.PaymentTxn(sender.address, self.params, self.APP_ADDRESS, payment)] if payment else []
+
+        self.round += 1
+        tracker = BoxTracker(self.executor.context.ledger, self.executor.app)
+        with tracker.tracking():
+            self.executor.execute(
+                sender.address, method, encoded, payments, self.APP_ADDRESS, self.timestamp, self.round
+            )
+        # The testing context lives in the executor's context variables
+        return self.executor._scope.run(tracker.metrics) if measure else None
+
+# ===== LOCALNET BACKEND =====
+
+class LocalNetBackend:
+    """Runs the compiled TEAL on a LocalNet (dev mode); measures opcode cost.
+
+    Calls are simulated with unnamed resources allowed, then sent with the
+    box and account references the simulation reported, spread over op_up
+    calls when one transaction cannot carry them all.
+    """
+
+    name = "localnet"
+    ACCOUNT_FUNDING = 10_000_000
+    APP_FUNDING = 100_000_000
+
+    def __init__(self):
+        self.client = algod.AlgodClient(LOCALNET_TOKEN, ALGOD_SERVER)
+        self.dispenser = self._dispenser()
+        self.app_id = self._deploy()
+        self.app_address = logic.get_application_address(self.app_id)
+        self.offset = 0
+
+    @staticmethod
+    def available() -> bool:
+        if not APPROVAL_PATH.exists():
+            return False
+        try:
+            algod.AlgodClient(LOCALNET_TOKEN, ALGOD_SERVER).status()
+        except Exception:
+            return False
+        return True
+
+    def new_scenario(self) -> None:
+        self.offset = 0
+
+    def new_account(self) -> Account:
+        private_key, address = account.generate_account()
+        self._pay(self.dispenser, address, self.ACCOUNT_FUNDING)
+        return Account(address, AccountTransactionSigner(private_key))
+
+    def advance_time(self, seconds: int) -> None:
+        self.offset += seconds
+        self.client.set_timestamp_offset(self.offset)
+
+    def end_scenario(self) -> None:
+        if self.offset:
+            self.client.set_timestamp_offset(0)
+            self.offset = 0
+
+    def call(
+        self,
+        sender: Account,
+        method_name: str,
+        args: List[Any],
+        payment: int = 0,
+        inner_txns: int = 0,
+        measure: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        simulated = self._compose(sender, method_name, args, payment, inner_txns, EmptySigner()).simulate(
+            self.client,
+            SimulateRequest(txn_groups=[], allow_empty_signatures=True, allow_unnamed_resources=True)
+        ).simulate_response["txn-groups"][0]
+        if "failure-message" in simulated:
+            raise RuntimeError(f"{method_name} failed: {simulated['failure-message']}")
+
+        boxes, accounts = self._unnamed_resources(simulated)
+        min_balance = self._app_min_balance()
+        self._compose(sender, method_name, args, payment, inner_txns, sender.signer, boxes, accounts).execute(
+            self.client, 4
+        )
+        if not measure:
+            return None
+
+        return {
+            "opcode_cost": simulated["app-budget-consumed"],
+            "box_refs": len(boxes),
+            "box_bytes_read": None,
+            "box_bytes_written": None,
+            "mbr_delta": self._app_min_balance() - min_balance,
+        }
+
+    def _compose(
+        self,
+        sender: Account,
+        method_name: str,
+        args: List[Any],
+        payment: int,
+        inner_txns: int,
+        signer: Any,
+        boxes: Optional[List[bytes]] = None,
+        accounts: Optional[List[str]] = None
+    ) -> AtomicTransactionComposer:
+        params = self.client.suggested_params()
+        params.flat_fee = True
+        params.fee = MIN_FEE * (1 + inner_txns)
+        method_args = list(args)
+        if payment:
+            method_args.append(TransactionWithSigner(
+                transaction.PaymentTxn(sender.address, self.client.suggested_params(), self.app_address, payment),
+                signer
+            ))
+
+        chunks = self._reference_chunks(boxes or [], accounts or [])
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            app_id=self.app_id, method=METHODS[method_name], sender=sender.address, sp=params,
+            signer=signer, method_args=method_args,
+            boxes=[(self.app_id, name) for name in chunks[0][0]], accounts=chunks[0][1]
+        )
+        # Group members share references, so op_up calls carry the rest
+        for index, (chunk_boxes, chunk_accounts) in enumerate(chunks[1:]):
+            atc.add_method_call(
+                app_id=self.app_id, method=METHODS["op_up"], sender=sender.address,
+                sp=self.client.suggested_params(), signer=signer, note=bytes([index]),
+                boxes=[(self.app_id, name) for name in chunk_boxes], accounts=chunk_accounts
+            )
+        return atc
+
+    @staticmethod
+    def _reference_chunks(boxes: List[bytes], accounts: List[str]) -> List[Tuple[List[bytes], List[str]]]:
+        chunks: List[Tuple[List[bytes], List[str]]] = [([], [])]
+        for address in accounts:
+            if len(chunks[-1][1]) == MAX_TXN_ACCOUNTS:
+                chunks.append(([], []))
+            chunks[-1][1].append(address)
+        for name in boxes:
+            chunk = next((c for c in chunks if len(c[0]) + len(c[1]) < MAX_TXN_REFS), None)
+            if chunk is None:
+                chunk = ([], [])
+                chunks.append(chunk)
+            chunk[0].append(name)
+        return chunks
+
+    @staticmethod
+    def _unnamed_resources(simulated: Dict[str, Any]) -> Tuple[List[bytes], List[str]]:
+        reports = [simulated.get("unnamed-resources-accessed", {})] + [
+            result.get("unnamed-resources-accessed", {}) for result in simulated.get("txn-results", [])
+        ]
+        boxes: List[bytes] = []
+        accounts: List[str] = []
+        for report in reports:
+            for box in report.get("boxes", []):
+                name = base64.b64decode(box["name"])
+                if name not in boxes:
+                    boxes.append(name)
+            for address in report.get("accounts", []):
+                if address not in accounts:
+                    accounts.append(address)
+            # Empty references only add box I/O quota
+            boxes.extend(b"" for _ in range(report.get("extra-box-refs", 0)))
+        return boxes, accounts
+
+    def _app_min_balance(self) -> int:
+        return self.client.account_info(self.app_address)["min-balance"]
+
+    def _dispenser(self) -> Account:
+        kmd = KMDClient(LOCALNET_TOKEN, KMD_SERVER)
+        wallet_id = next(w["id"] for w in kmd.list_wallets() if w["name"] == "unencrypted-default-wallet")
+        handle = kmd.init_wallet_handle(wallet_id, "")
+        try:
+            address = kmd.list_keys(handle)[0]
+            private_key = kmd.export_key(handle, "", address)
+        finally:
+            kmd.release_wallet_handle(handle)
+        return Account(address, AccountTransactionSigner(private_key))
+
+    def _pay(self, sender: Account, receiver: str, amount: int) -> None:
+        txn = transaction.PaymentTxn(sender.address, self.client.suggested_params(), receiver, amount)
+        txid = self.client.send_transaction(txn.sign(sender.signer.private_key))
+        transaction.wait_for_confirmation(self.client, txid, 4)
+
+    def _deploy(self) -> int:
+        approval = base64.b64decode(self.client.compile(APPROVAL_PATH.read_text())["result"])
+        clear = base64.b64decode(self.client.compile(CLEAR_PATH.read_text())["result"])
+        txn = transaction.ApplicationCreateTxn(
+            sender=self.dispenser.address,
+            sp=self.client.suggested_params(),
+            on_complete=transaction.OnComplete.NoOpOC,
+            approval_program=approval,
+            clear_program=clear,
+            global_schema=transaction.StateSchema(num_uints=8, num_byte_slices=8),
+            local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+            extra_pages=3
+        )
+        txid = self.client.send_transaction(txn.sign(self.dispenser.signer.private_key))
+        app_id = transaction.wait_for_confirmation(self.client, txid, 4)["application-index"]
+
+        # Box MBR is paid from the app account
+        self._pay(self.dispenser, logic.get_application_address(app_id), self.APP_FUNDING)
+        return app_id
+
+# ===== SCENARIOS =====
+
+def run_scenario(
+    backend: Any,
+    challenge_id: int,
+    participants: int,
+    messages: int,
+    max_participants: int
+) -> List[Dict[str, Any]]:
+    """Measure the benchmarked methods on a challenge with the given history.
+
+    Methods run in an order that keeps the scenario's shape for each one:
+    complete_task and send_chat_message see `participants` members and
+    `messages` messages, join_challenge adds one member, who is then
+    eliminated to close the challenge, so distribute_pool pays the first
+    page of the `participants` winners.
+    """
+    backend.new_scenario()
+    rows: List[Dict[str, Any]] = []
+
+    def measure(method_name: str, sender: Account, args: List[Any], **kwargs: Any) -> None:
+        metrics = backend.call(sender, method_name, args, measure=True, **kwargs)
+        rows.append({"method": method_name, "participants": participants, "messages": messages, **metrics})
+
+    try:
+        creator = backend.new_account()
+        backend.call(
+            creator, "create_challenge",
+            [challenge_id, f"Benchmark {challenge_id}", "benchmark", STAKE_AMOUNT, max_participants],
+            payment=STAKE_AMOUNT
+        )
+        members = [creator]
+        for _ in range(participants - 1):
+            member = backend.new_account()
+            backend.call(member, "join_challenge", [challenge_id], payment=STAKE_AMOUNT)
+            members.append(member)
+        for _ in range(messages):
+            backend.call(creator, "send_chat_message", [challenge_id, MESSAGE])
+
+        measure("complete_task", creator, [challenge_id, 1, creator.address, PROOF_DATA])
+        measure("send_chat_message", creator, [challenge_id, MESSAGE])
+        newcomer = backend.new_account()
+        measure("join_challenge", newcomer, [challenge_id], payment=STAKE_AMOUNT)
+
+        # The newcomer has no tasks, so it is the lowest performer; past the
+        # end time the elimination also closes the challenge
+        backend.advance_time(CLOSE_OFFSET)
+        backend.call(creator, "process_weekly_elimination", [challenge_id, newcomer.address])
+
+        # Ranked by tasks (only the creator has one), then join order
+        winners = [member.address for member in members[:PAYOUT_PAGE_SIZE]]
+        measure("distribute_pool", creator, [challenge_id, winners], inner_txns=len(winners))
+    finally:
+        backend.end_scenario()
+
+    return rows
+
+def run_benchmark(backends: List[Any], participant_counts: List[int], message_counts: List[int]) -> List[Dict[str, Any]]:
+    """Run every (participants, messages) scenario on each backend and merge the metrics."""
+    merged: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+    max_participants = max(participant_counts) + 1
+    for backend in backends:
+        # Unique challenge ids, since a LocalNet app outlives a scenario
+        challenge_id = int(time.time())
+        for participants in participant_counts:
+            for messages in message_counts:
+                print(f"⏱️  {backend.name}: {participants} participants, {messages} messages")
+                challenge_id += 1
+                for row in run_scenario(backend, challenge_id, participants, messages, max_participants):
+                    key = (row["method"], row["participants"], row["messages"])
+                    current = merged.setdefault(key, dict(row))
+                    for metric in METRICS:
+                        if current.get(metric) is None:
+                            current[metric] = row[metric]
+
+    return sorted(merged.values(), key=lambda row: (row["method"], row["participants"], row["messages"]))
+
+# ===== BASELINE =====
+
+def program_info() -> Optional[Dict[str, Any]]:
+    """Identify the compiled program the opcode costs belong to."""
+    if not APPROVAL_PATH.exists():
+        return None
+    source = APPROVAL_PATH.read_bytes()
+    return {"path": str(APPROVAL_PATH.relative_to(project_root)), "sha256": hashlib.sha256(source).hexdigest()}
+
+def compare(baseline: Dict[str, Any], results: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """List metrics that grew by more than `tolerance` (a fraction) over the baseline."""
+    previous = {(row["method"], row["participants"], row["messages"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = previous.get((row["method"], row["participants"], row["messages"]))
+        if old is None:
+            continue
+        for metric in METRICS:
+            if old.get(metric) is None or row.get(metric) is None:
+                continue
+            if row[metric] > old[metric] + abs(old[metric]) * tolerance:
+                regressions.append(
+                    f"{row['method']} ({row['participants']} participants, {row['messages']} messages): "
+                    f"{metric} {old[metric]} -> {row[metric]}"
+                )
+    return regressions
+
+def print_table(results: List[Dict[str, Any]]) -> None:
+    header = ("method", "participants", "messages") + METRICS
+    print(" | ".join(f"{column:>17}" for column in header))
+    for row in results:
+        print(" | ".join(
+            f"{'-' if row.get(column) is None else row[column]:>17}" for column in header
+        ))
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ChallengePlatform method cost and box I/O")
+    parser.add_argument("--participants", default="1,2,5,10,20,30", help="comma separated participant counts")
+    # 15 and 16 straddle a chat page boundary (CHAT_PAGE_SIZE)
+    parser.add_argument("--messages", default="0,15,16,64", help="comma separated chat message counts")
+    parser.add_argument("--backend", choices=["all", "algopy", "localnet"], default="all")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="where to write the JSON baseline")
+    parser.add_argument("--compare", help="earlier baseline to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="allowed growth, e.g. 0.05 for 5%%")
+    args = parser.parse_args()
+
+    backends = []
+    if args.backend in ("all", "algopy") and AlgopyBackend.available():
+        backends.append(AlgopyBackend())
+    if args.backend in ("all", "localnet") and LocalNetBackend.available():
+        backends.append(LocalNetBackend())
+    if not backends:
+        print("❌ No backend available: install algorand-python-testing, "
+              "or build the contract and start a LocalNet")
+        return 1
+
+    participant_counts = _parse_counts(args.participants)
+    if participant_counts[0] < 1:
+        parser.error("--participants must be at least 1")
+    results = run_benchmark(backends, participant_counts, _parse_counts(args.messages))
+    print_table(results)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "generated_at": int(time.time()),
+            "backends": [backend.name for backend in backends],
+            "program": program_info(),
+            "results": results,
+        }, f, indent=2)
+    print(f"📁 Baseline saved to: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            return 1
+        print("✅ No regressions against the baseline")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,17 @@
 from algopy import (
     ARC4Contract,
     BoxMap,
+    Bytes,
     Global,
+    TransactionType,
     Txn,
     UInt64,
     arc4,
     gtxn,
     itxn,
+    op,
+    subroutine,
+    urange,
 )
 from algopy.arc4 import abimethod 
 
@@ -22,24 +27,79 @@ from .smart_contracts.challenge_platform.errors import (
     ALREADY_PARTICIPATING,
     NOT_PARTICIPATING,
     INSUFFICIENT_PARTICIPANTS,
+    NOT_LOWEST_PERFORMER,
+    PAYOUT_OUT_OF_ORDER,
+    TOO_MANY_WINNERS,
+    TOO_MANY_ELIMINATIONS,
     DIFFERENT_SENDER,
     WRONG_RECEIVER,
     INSUFFICIENT_STAKE,
     UNAUTHORIZED,
     NOT_TIME_FOR_ELIMINATION,
+    INVALID_ARGUMENTS,
+    ENTRY_TOO_LARGE,
 )
 from .contract_types import (
     Challenge,
+    ChallengeMetadata,
+    ChallengeState,
     Participant,
+    ParticipantKey,
+    EliminationTracker,
+    EliminationRequest,
+    LeaderboardSummary,
+    CompletionBucketKey,
+    CompletionBucket,
     WeeklyRanking,
-    TaskCompletion,
+    WeeklyCompletionKey,
+    WeeklyCompletions,
+    Hash32,
     PoolDistribution,
+    PayoutPlan,
     ChatMessage,
-    HealthData,
+    ChatMessagePage,
+    ChatPageKey,
+    HealthRootKey,
+    HealthRoot,
     PlatformRevenue,
     Task,
+    TaskPage,
+    ParticipantJoined,
+    TaskCompleted,
+    ChatMessageSent,
+    ParticipantEliminated,
+    PoolPaid,
 )
 
+# Messages per chat page box; a full page is never rewritten again
+CHAT_PAGE_SIZE = 16
+# Bytes per slot of a participant index box (one address)
+ADDRESS_SIZE = 32
+# Fixed-point scale of the cumulative interest index
+INTEREST_INDEX_SCALE = 1_000_000_000
+SECONDS_PER_DAY = 86400
+# Most entries returned by a range getter; return values are logged and a
+# log line holds at most 1024 bytes (15 participants)
+READ_PAGE_LIMIT = 12
+# Bytes of entries a variable-size read returns: one 1024-byte log less the
+# return prefix (4), next offset (8), array offset (2) and array length (2)
+READ_BYTE_LIMIT = 1008
+# Largest stored variable-size entry, so any one of them (and its 2-byte
+# head offset) fits in a read
+MAX_ENTRY_SIZE = READ_BYTE_LIMIT - 2
+# ARC-4 length prefix of a DynamicArray box and encoded WeeklyRanking size
+ARRAY_LENGTH_SIZE = 2
+WEEKLY_RANKING_SIZE = 48
+# Winners paid per distribute_pool call (one inner transaction group)
+PAYOUT_PAGE_SIZE = 8
+# Most eliminations per process_due_eliminations call: each one logs a
+# 68-byte ParticipantEliminated event and adds 8 bytes to the 6-byte return
+# log, and an app call may log at most 1024 bytes in total
+ELIMINATION_BATCH_SIZE = 13
+MAX_UINT64 = 2**64 - 1
+# Link of a completion bucket without a non-empty neighbour on that side
+NO_BUCKET = MAX_UINT64
+
 
 class ChallengePlatform(ARC4Contract):
     """
@@ -52,31 +112,40 @@ class ChallengePlatform(ARC4Contract):
         self.deposited = BoxMap(arc4.Address, arc4.UInt64)
         
         # Challenge state management
-        self.challenges = BoxMap(arc4.UInt64, Challenge)  # challenge_id -> Challenge
-        self.participants = BoxMap(arc4.UInt64, arc4.DynamicArray[Participant])  # challenge_id -> participants
+        self.challenge_metadata = BoxMap(arc4.UInt64, ChallengeMetadata)  # challenge_id -> metadata, written once
+        self.challenge_states = BoxMap(arc4.UInt64, ChallengeState)  # challenge_id -> hot fixed-width state
+        self.participants = BoxMap(ParticipantKey, Participant)  # (challenge_id, address) -> participant
+        self.participant_counts = BoxMap(arc4.UInt64, arc4.UInt64)  # challenge_id -> number of participants
+        self.participant_index = BoxMap(arc4.UInt64, Bytes)  # challenge_id -> packed addresses in join order
+        self.elimination_trackers = BoxMap(arc4.UInt64, EliminationTracker)  # challenge_id -> active count, min tasks
+        self.completion_buckets = BoxMap(CompletionBucketKey, CompletionBucket)  # (challenge_id, tasks) -> active participants, linked in task count order
         self.weekly_rankings = BoxMap(arc4.UInt64, arc4.DynamicArray[WeeklyRanking])  # challenge_id -> rankings
-        self.task_completions = BoxMap(arc4.UInt64, arc4.DynamicArray[TaskCompletion])  # challenge_id -> completions
+        self.payout_plans = BoxMap(arc4.UInt64, PayoutPlan)  # challenge_id -> payout progress
+        self.weekly_completions = BoxMap(WeeklyCompletionKey, WeeklyCompletions)  # (challenge_id, address, week) -> counter
         
         # Chat system - each challenge has its own chat
-        self.chat_messages = BoxMap(arc4.UInt64, arc4.DynamicArray[ChatMessage])  # challenge_id -> messages
-        self.message_counters = BoxMap(arc4.UInt64, arc4.UInt64)  # challenge_id -> next_message_id
+        self.chat_messages = BoxMap(ChatPageKey, arc4.DynamicArray[ChatMessage])  # (challenge_id, page_no) -> messages
+        self.message_counters = BoxMap(arc4.UInt64, arc4.UInt64)  # challenge_id -> next_message_id (selects the page)
         
-        # Health data verification
-        self.health_data = BoxMap(arc4.UInt64, arc4.DynamicArray[HealthData])  # challenge_id -> health_data
+        # Health data verification - samples stay off-chain, one Merkle root per participant per day
+        self.health_roots = BoxMap(HealthRootKey, HealthRoot)  # (challenge_id, address, day) -> root
         self.tasks = BoxMap(arc4.UInt64, arc4.DynamicArray[Task])  # challenge_id -> tasks
         
         # Platform revenue tracking
-        self.platform_revenue = PlatformRevenue(
-            total_fees_collected=arc4.UInt64(0),
-            interest_earned=arc4.UInt64(0),
-            last_updated=arc4.UInt64(0)
-        )
+        self.total_fees_collected = UInt64(0)
+        self.interest_earned = UInt64(0)
+        self.revenue_updated_at = UInt64(0)  # interest is accrued up to this timestamp
         
         # Platform configuration
         self.platform_fee_percentage = arc4.UInt64(500)  # 5% platform fee (500/10000)
         self.interest_rate = arc4.UInt64(100)  # 1% daily interest (100/10000)
         self.week_duration = arc4.UInt64(604800)  # 7 days in seconds
         self.challenge_duration = arc4.UInt64(1814400)  # 21 days in seconds
+        
+        # Interest accrual: stake of all unsettled challenges and the cumulative
+        # interest per staked microAlgo (scaled by INTEREST_INDEX_SCALE)
+        self.total_active_staked = UInt64(0)
+        self.interest_index = UInt64(0)
 
     @abimethod
     def create_challenge(
@@ -92,38 +161,36 @@ class ChallengePlatform(ARC4Contract):
         assert payment.sender == Txn.sender, DIFFERENT_SENDER
         assert payment.receiver == Global.current_application_address, WRONG_RECEIVER
         assert payment.amount >= stake_amount.native, INSUFFICIENT_STAKE
-        assert challenge_id not in self.challenges, CHALLENGE_ALREADY_EXISTS
+        assert challenge_id not in self.challenge_metadata, CHALLENGE_ALREADY_EXISTS
         
         # Calculate platform fee
         platform_fee = (stake_amount.native * self.platform_fee_percentage.native) // 10000
         net_stake = stake_amount.native - platform_fee
         
         # Update platform revenue
-        self.platform_revenue = PlatformRevenue(
-            total_fees_collected=arc4.UInt64(self.platform_revenue.total_fees_collected.native + platform_fee),
-            interest_earned=self.platform_revenue.interest_earned,
-            last_updated=self.platform_revenue.last_updated
-        )
+        self.total_fees_collected += platform_fee
         
-        # Create challenge
-        challenge = Challenge(
-            challenge_id=challenge_id,
+        # Settle interest on the old total before the staked amount changes
+        self._accrue_interest()
+        self.total_active_staked += net_stake
+        
+        # Store challenge: metadata once, counters in their own small box
+        mbr_baseline = Global.current_application_address.min_balance
+        self.challenge_metadata[challenge_id] = ChallengeMetadata(
             name=name,
             description=description,
             stake_amount=stake_amount,
             max_participants=max_participants,
             creator=arc4.Address(Txn.sender),
             start_time=arc4.UInt64(Global.latest_timestamp()),
-            end_time=arc4.UInt64(Global.latest_timestamp() + self.challenge_duration.native),
+            end_time=arc4.UInt64(Global.latest_timestamp() + self.challenge_duration.native)
+        )
+        self.challenge_states[challenge_id] = ChallengeState(
             total_staked=arc4.UInt64(net_stake),
-            is_active=arc4.Bool(True),
-            current_week=arc4.UInt64(0)
+            current_week=arc4.UInt64(0),
+            is_active=arc4.Bool(True)
         )
         
-        # Store challenge
-        mbr_baseline = Global.current_application_address.min_balance
-        self.challenges[challenge_id] = challenge
-        
         # Add creator as first participant
         creator_participant = Participant(
             address=arc4.Address(Txn.sender),
@@ -133,7 +200,18 @@ class ChallengePlatform(ARC4Contract):
             tasks_completed=arc4.UInt64(0),
             current_rank=arc4.UInt64(1)
         )
-        self.participants[challenge_id] = arc4.DynamicArray(creator_participant)
+        self.participants[ParticipantKey(challenge_id=challenge_id, address=arc4.Address(Txn.sender))] = creator_participant
+        
+        # Index box sized for every participant up front; joins only fill a slot
+        index_box = self.participant_index.box(challenge_id)
+        index_box.create(size=max_participants.native * ADDRESS_SIZE)
+        index_box.replace(0, arc4.Address(Txn.sender).bytes)
+        self.participant_counts[challenge_id] = arc4.UInt64(1)
+        self.elimination_trackers[challenge_id] = EliminationTracker(
+            active_count=arc4.UInt64(0),
+            min_tasks=arc4.UInt64(0)
+        )
+        self._add_active(challenge_id)
         
         # Update deposited amount (similar to digital marketplace)
         mbr_diff = Global.current_application_address.min_balance - mbr_baseline
@@ -151,17 +229,18 @@ class ChallengePlatform(ARC4Contract):
         assert payment.sender == Txn.sender, DIFFERENT_SENDER
         assert payment.receiver == Global.current_application_address, WRONG_RECEIVER
         
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
+        state = self.challenge_states[challenge_id]
+        assert state.is_active, CHALLENGE_NOT_ACTIVE
+        challenge = self.challenge_metadata[challenge_id]
         assert Global.latest_timestamp() < challenge.end_time.native, "Challenge ended"
         
         # Check if user already participating
-        participants = self.participants[challenge_id]
-        for participant in participants:
-            assert participant.address.native != Txn.sender, ALREADY_PARTICIPATING
+        participant_key = ParticipantKey(challenge_id=challenge_id, address=arc4.Address(Txn.sender))
+        assert participant_key not in self.participants, ALREADY_PARTICIPATING
         
         # Check max participants
-        assert len(participants) < challenge.max_participants.native, CHALLENGE_FULL
+        participant_count = self.participant_counts[challenge_id].native
+        assert participant_count < challenge.max_participants.native, CHALLENGE_FULL
         
         # Verify stake amount
         assert payment.amount >= challenge.stake_amount.native, INSUFFICIENT_STAKE
@@ -171,11 +250,7 @@ class ChallengePlatform(ARC4Contract):
         net_stake = challenge.stake_amount.native - platform_fee
         
         # Update platform revenue
-        self.platform_revenue = PlatformRevenue(
-            total_fees_collected=arc4.UInt64(self.platform_revenue.total_fees_collected.native + platform_fee),
-            interest_earned=self.platform_revenue.interest_earned,
-            last_updated=self.platform_revenue.last_updated
-        )
+        self.total_fees_collected += platform_fee
         
         # Add participant
         new_participant = Participant(
@@ -184,24 +259,22 @@ class ChallengePlatform(ARC4Contract):
             joined_at=arc4.UInt64(Global.latest_timestamp()),
             is_active=arc4.Bool(True),
             tasks_completed=arc4.UInt64(0),
-            current_rank=arc4.UInt64(len(participants) + 1)
+            current_rank=arc4.UInt64(participant_count + 1)
         )
         
+        self._accrue_interest()
+        self.total_active_staked += net_stake
+        
         # Update challenge and participants
         mbr_baseline = Global.current_application_address.min_balance
-        self.participants[challenge_id] = participants.append(new_participant)
-        self.challenges[challenge_id] = Challenge(
-            challenge_id=challenge.challenge_id,
-            name=challenge.name,
-            description=challenge.description,
-            stake_amount=challenge.stake_amount,
-            max_participants=challenge.max_participants,
-            creator=challenge.creator,
-            start_time=challenge.start_time,
-            end_time=challenge.end_time,
-            total_staked=arc4.UInt64(challenge.total_staked.native + net_stake),
-            is_active=challenge.is_active,
-            current_week=challenge.current_week
+        self.participants[participant_key] = new_participant
+        self.participant_index.box(challenge_id).replace(
+            participant_count * ADDRESS_SIZE, arc4.Address(Txn.sender).bytes
+        )
+        self.participant_counts[challenge_id] = arc4.UInt64(participant_count + 1)
+        self._add_active(challenge_id)
+        self.challenge_states[challenge_id] = state._replace(
+            total_staked=arc4.UInt64(state.total_staked.native + net_stake)
         )
         
         # Update deposited amount
@@ -209,241 +282,590 @@ class ChallengePlatform(ARC4Contract):
         self.deposited[arc4.Address(Txn.sender)] = arc4.UInt64(
             self.deposited.get(arc4.Address(Txn.sender), default=arc4.UInt64(0)).native + net_stake - mbr_diff
         )
+        
+        arc4.emit(ParticipantJoined(
+            challenge_id=challenge_id,
+            participant=arc4.Address(Txn.sender),
+            stake_amount=arc4.UInt64(net_stake),
+            participant_count=arc4.UInt64(participant_count + 1),
+            joined_at=new_participant.joined_at
+        ))
 
     @abimethod
     def leave_challenge(self, challenge_id: arc4.UInt64) -> None:
         """Leave challenge early - forfeit stake (coins remain in pool)."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
+        assert self.challenge_states[challenge_id].is_active, CHALLENGE_NOT_ACTIVE
         
         # Find participant
-        participants = self.participants[challenge_id]
-        participant_index = -1
-        for i, participant in enumerate(participants):
-            if participant.address.native == Txn.sender:
-                participant_index = i
-                break
+        participant_key = ParticipantKey(challenge_id=challenge_id, address=arc4.Address(Txn.sender))
+        assert participant_key in self.participants, NOT_PARTICIPATING
         
-        assert participant_index >= 0, NOT_PARTICIPATING
-        
-        # Mark as inactive (stake remains in pool)
-        updated_participant = Participant(
-            address=participants[participant_index].address,
-            stake_amount=participants[participant_index].stake_amount,
-            joined_at=participants[participant_index].joined_at,
-            is_active=arc4.Bool(False),
-            tasks_completed=participants[participant_index].tasks_completed,
-            current_rank=participants[participant_index].current_rank
-        )
-        self.participants[challenge_id] = participants.replace(participant_index, updated_participant)
-        
-        # Update challenge total_staked (stake remains in pool)
-        self.challenges[challenge_id] = Challenge(
-            challenge_id=challenge.challenge_id,
-            name=challenge.name,
-            description=challenge.description,
-            stake_amount=challenge.stake_amount,
-            max_participants=challenge.max_participants,
-            creator=challenge.creator,
-            start_time=challenge.start_time,
-            end_time=challenge.end_time,
-            total_staked=challenge.total_staked,  # Stake remains in pool
-            is_active=challenge.is_active,
-            current_week=challenge.current_week
-        )
+        # Mark as inactive (stake remains in pool, so total_staked is unchanged)
+        participant = self.participants[participant_key]
+        assert participant.is_active, NOT_PARTICIPATING
+        self.participants[participant_key] = participant._replace(is_active=arc4.Bool(False))
+        self._remove_active(challenge_id, participant.tasks_completed.native)
 
     @abimethod
     def complete_task(
         self,
         challenge_id: arc4.UInt64,
         task_id: arc4.UInt64,
+        participant_address: arc4.Address,
         proof_data: arc4.String  # Placeholder for health data verification
     ) -> None:
-        """Record task completion for a participant."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
+        """Record task completion for a participant (sent by the participant or the platform)."""
+        assert Txn.sender == participant_address.native or Txn.sender == Global.creator_address, UNAUTHORIZED
         
-        # Find participant
-        participants = self.participants[challenge_id]
-        participant_index = -1
-        for i, participant in enumerate(participants):
-            if participant.address.native == Txn.sender and participant.is_active:
-                participant_index = i
-                break
+        assert self.challenge_states[challenge_id].is_active, CHALLENGE_NOT_ACTIVE
         
-        assert participant_index >= 0, NOT_PARTICIPATING
+        # Find participant
+        participant_key = ParticipantKey(challenge_id=challenge_id, address=participant_address)
+        assert participant_key in self.participants, NOT_PARTICIPATING
+        participant = self.participants[participant_key]
+        assert participant.is_active, NOT_PARTICIPATING
         
-        # Update task completion
-        task_completion = TaskCompletion(
-            participant_address=arc4.Address(Txn.sender),
-            task_id=task_id,
-            completed_at=arc4.UInt64(Global.latest_timestamp()),
-            proof_data=proof_data
+        # Fixed-size weekly counter; its proof commitment chains every proof of the week:
+        # commitment = sha256(previous commitment || task_id || completed_at || proof_data)
+        completed_at = arc4.UInt64(Global.latest_timestamp())
+        start_time = self.challenge_metadata[challenge_id].start_time.native
+        week = (Global.latest_timestamp() - start_time) // self.week_duration.native
+        counter_key = WeeklyCompletionKey(
+            challenge_id=challenge_id,
+            participant_address=participant_address,
+            week=arc4.UInt64(week)
+        )
+        counter = self.weekly_completions.get(
+            counter_key,
+            default=WeeklyCompletions(count=arc4.UInt64(0), proof_commitment=Hash32.from_bytes(op.bzero(32)))
+        )
+        commitment = op.sha256(
+            counter.proof_commitment.bytes
+            + task_id.bytes
+            + completed_at.bytes
+            + proof_data.bytes
         )
         
         mbr_baseline = Global.current_application_address.min_balance
-        completions = self.task_completions.get(challenge_id, default=arc4.DynamicArray[TaskCompletion]())
-        self.task_completions[challenge_id] = completions.append(task_completion)
+        self.weekly_completions[counter_key] = WeeklyCompletions(
+            count=arc4.UInt64(counter.count.native + 1),
+            proof_commitment=Hash32.from_bytes(commitment)
+        )
         
         # Update participant's task count
-        updated_participant = Participant(
-            address=participants[participant_index].address,
-            stake_amount=participants[participant_index].stake_amount,
-            joined_at=participants[participant_index].joined_at,
-            is_active=participants[participant_index].is_active,
-            tasks_completed=arc4.UInt64(participants[participant_index].tasks_completed.native + 1),
-            current_rank=participants[participant_index].current_rank
+        tasks_completed = participant.tasks_completed.native
+        self.participants[participant_key] = participant._replace(
+            tasks_completed=arc4.UInt64(tasks_completed + 1)
         )
-        self.participants[challenge_id] = participants.replace(participant_index, updated_participant)
+        
+        # Move the participant up one completion bucket; the new bucket links in
+        # right above the old one, which is still non-empty at that point
+        self._bucket_add(challenge_id, tasks_completed + 1, tasks_completed)
+        self._bucket_remove(challenge_id, tasks_completed)
         
         mbr_diff = Global.current_application_address.min_balance - mbr_baseline
-        self.deposited[arc4.Address(Txn.sender)] = arc4.UInt64(
-            self.deposited.get(arc4.Address(Txn.sender), default=arc4.UInt64(0)).native - mbr_diff
+        self.deposited[participant_address] = arc4.UInt64(
+            self.deposited.get(participant_address, default=arc4.UInt64(0)).native - mbr_diff
         )
+        
+        # Full completion history goes to the logs for off-chain indexing
+        arc4.emit(TaskCompleted(
+            challenge_id=challenge_id,
+            participant=participant_address,
+            task_id=task_id,
+            week=arc4.UInt64(week),
+            completed_at=completed_at,
+            tasks_completed=arc4.UInt64(tasks_completed + 1),
+            proof_data=proof_data
+        ))
 
     @abimethod
-    def process_weekly_elimination(self, challenge_id: arc4.UInt64) -> None:
-        """Process weekly elimination - eliminate lowest performer."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
-        
-        # Check if it's time for weekly elimination (every 7 days)
-        current_time = Global.latest_timestamp()
-        time_since_start = current_time - challenge.start_time.native
-        expected_week = time_since_start // self.week_duration.native
+    def process_weekly_elimination(self, challenge_id: arc4.UInt64, lowest_performer: arc4.Address) -> None:
+        """Process weekly elimination - eliminate lowest performer.
         
-        assert expected_week > challenge.current_week.native, NOT_TIME_FOR_ELIMINATION
+        The caller names the lowest performer and the contract only verifies
+        that no active participant has fewer completed tasks, so the cost does
+        not depend on the number of participants.
+        """
+        state = self.challenge_states[challenge_id]
+        assert state.is_active, CHALLENGE_NOT_ACTIVE
         
-        participants = self.participants[challenge_id]
-        active_participants = [p for p in participants if p.is_active]
+        # Check if it's time for weekly elimination (every 7 days)
+        assert self._elimination_week(challenge_id) > state.current_week.native, NOT_TIME_FOR_ELIMINATION
         
         # Need at least 2 participants to eliminate one
-        assert len(active_participants) > 1, INSUFFICIENT_PARTICIPANTS
+        assert self.elimination_trackers[challenge_id].active_count.native > 1, INSUFFICIENT_PARTICIPANTS
         
-        # Find participant with lowest task completion
-        lowest_performer = min(active_participants, key=lambda p: p.tasks_completed.native)
+        assert self._is_active_participant(challenge_id, lowest_performer), NOT_PARTICIPATING
+        assert self._is_lowest_performer(challenge_id, lowest_performer), NOT_LOWEST_PERFORMER
         
-        # Mark as eliminated
-        for i, participant in enumerate(participants):
-            if participant.address.native == lowest_performer.address.native:
-                eliminated_participant = Participant(
-                    address=participant.address,
-                    stake_amount=participant.stake_amount,
-                    joined_at=participant.joined_at,
-                    is_active=arc4.Bool(False),
-                    tasks_completed=participant.tasks_completed,
-                    current_rank=participant.current_rank
-                )
-                self.participants[challenge_id] = participants.replace(i, eliminated_participant)
-                break
-        
-        # Create weekly ranking
-        ranking = WeeklyRanking(
-            week=arc4.UInt64(expected_week),
-            eliminated_participant=lowest_performer.address,
-            timestamp=arc4.UInt64(current_time)
-        )
-        
-        rankings = self.weekly_rankings.get(challenge_id, default=arc4.DynamicArray[WeeklyRanking]())
-        self.weekly_rankings[challenge_id] = rankings.append(ranking)
-        
-        # Update challenge week
-        self.challenges[challenge_id] = Challenge(
-            challenge_id=challenge.challenge_id,
-            name=challenge.name,
-            description=challenge.description,
-            stake_amount=challenge.stake_amount,
-            max_participants=challenge.max_participants,
-            creator=challenge.creator,
-            start_time=challenge.start_time,
-            end_time=challenge.end_time,
-            total_staked=challenge.total_staked,
-            is_active=challenge.is_active,
-            current_week=arc4.UInt64(expected_week)
-        )
-        
-        # Check if challenge should end (21 days completed)
-        if current_time >= challenge.end_time.native:
-            self.challenges[challenge_id] = Challenge(
-                challenge_id=challenge.challenge_id,
-                name=challenge.name,
-                description=challenge.description,
-                stake_amount=challenge.stake_amount,
-                max_participants=challenge.max_participants,
-                creator=challenge.creator,
-                start_time=challenge.start_time,
-                end_time=challenge.end_time,
-                total_staked=challenge.total_staked,
-                is_active=arc4.Bool(False),
-                current_week=challenge.current_week
-            )
+        self._eliminate(challenge_id, lowest_performer)
 
     @abimethod
-    def distribute_pool(self, challenge_id: arc4.UInt64) -> None:
-        """Distribute pool to remaining participants based on final ranking."""
-        challenge = self.challenges[challenge_id]
-        assert not challenge.is_active, CHALLENGE_STILL_ACTIVE  # Should be closed
-        assert Global.latest_timestamp() >= challenge.end_time.native, "Challenge not ended"
+    def process_due_eliminations(
+        self,
+        eliminations: arc4.DynamicArray[EliminationRequest]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Process the weekly elimination of several challenges in one call.
         
-        participants = self.participants[challenge_id]
-        active_participants = [p for p in participants if p.is_active]
+        Challenges that are not due, and stale lowest performer hints, are
+        skipped instead of failing the call. Returns the ids of the
+        challenges that were processed. At most ELIMINATION_BATCH_SIZE
+        eliminations fit in the call's log budget.
+        """
+        assert eliminations.length <= ELIMINATION_BATCH_SIZE, TOO_MANY_ELIMINATIONS
+        processed = arc4.DynamicArray[arc4.UInt64]()
+        for i in urange(eliminations.length):
+            request = eliminations[i].copy()
+            if (
+                self._elimination_due(request.challenge_id)
+                and self._is_active_participant(request.challenge_id, request.lowest_performer)
+                and self._is_lowest_performer(request.challenge_id, request.lowest_performer)
+            ):
+                self._eliminate(request.challenge_id, request.lowest_performer)
+                processed.append(request.challenge_id)
+        return processed
+
+    @abimethod
+    def distribute_pool(
+        self,
+        challenge_id: arc4.UInt64,
+        winners: arc4.DynamicArray[arc4.Address]
+    ) -> None:
+        """Pay the next page of winners, in final ranking order.
         
-        # Sort by tasks completed (descending) for final ranking
-        sorted_participants = sorted(active_participants, key=lambda p: p.tasks_completed.native, reverse=True)
+        The first call fixes the payout plan and later calls resume from its
+        cursor. Winners are ranked by tasks completed (descending), then join
+        order; the contract verifies the order instead of sorting. Payments
+        go out as one inner group whose fees the outer call pays.
+        """
+        assert not self.challenge_states[challenge_id].is_active, CHALLENGE_STILL_ACTIVE  # Should be closed
+        end_time = self.challenge_metadata[challenge_id].end_time.native
+        assert Global.latest_timestamp() >= end_time, "Challenge not ended"
         
-        # Calculate distribution based on ranking
-        total_pool = challenge.total_staked.native
-        platform_fee = (total_pool * self.platform_fee_percentage.native) // 10000
-        distribution_pool = total_pool - platform_fee
+        if challenge_id not in self.payout_plans:
+            self._start_payout(challenge_id)
+        plan = self.payout_plans[challenge_id]
         
-        # Update platform revenue
-        self.platform_revenue = PlatformRevenue(
-            total_fees_collected=arc4.UInt64(self.platform_revenue.total_fees_collected.native + platform_fee),
-            interest_earned=self.platform_revenue.interest_earned,
-            last_updated=self.platform_revenue.last_updated
-        )
+        page_size = winners.length
+        assert page_size <= PAYOUT_PAGE_SIZE, TOO_MANY_WINNERS
+        assert plan.cursor.native + page_size <= plan.winner_count.native, TOO_MANY_WINNERS
         
-        # Distribute based on ranking (winner gets more)
-        # Use atomic transaction group for all payments
-        if len(sorted_participants) > 0:
-            total_multiplier = sum(range(1, len(sorted_participants) + 1))
+        cursor = plan.cursor.native
+        last_tasks = plan.last_tasks.native
+        last_rank = plan.last_rank.native
+        for i in urange(page_size):
+            address = winners[i]
+            participant = self.participants[ParticipantKey(challenge_id=challenge_id, address=address)]
+            assert participant.is_active, NOT_PARTICIPATING
+            
+            # Strictly after the previous winner, so nobody is paid twice or skipped
+            tasks = participant.tasks_completed.native
+            rank = participant.current_rank.native
+            assert tasks < last_tasks or (tasks == last_tasks and rank > last_rank), PAYOUT_OUT_OF_ORDER
+            
+            # Winner gets more: multiplier winner_count for first place down to 1
+            share = (plan.distribution_pool.native * (plan.winner_count.native - cursor)) // plan.total_multiplier.native
+            
+            if i == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.Payment)
+            op.ITxnCreate.set_receiver(address.native)
+            op.ITxnCreate.set_amount(share)
+            op.ITxnCreate.set_fee(0)  # pooled from the outer call
+            
+            # Update deposited amounts
+            self.deposited[address] = arc4.UInt64(
+                self.deposited.get(address, default=arc4.UInt64(0)).native - share
+            )
             
-            # Create payment transactions
-            for i, participant in enumerate(sorted_participants):
-                rank_multiplier = len(sorted_participants) - i
-                share = (distribution_pool * rank_multiplier) // total_multiplier
-                
-                if share > 0:
-                    itxn.Payment(
-                        receiver=participant.address.native,
-                        amount=share
-                    ).submit()
-                    
-                    # Update deposited amounts
-                    self.deposited[participant.address] = arc4.UInt64(
-                        self.deposited.get(participant.address, default=arc4.UInt64(0)).native - share
-                    )
+            arc4.emit(PoolPaid(
+                challenge_id=challenge_id,
+                winner=address,
+                amount=arc4.UInt64(share),
+                rank=arc4.UInt64(cursor + 1)
+            ))
+            
+            cursor += 1
+            last_tasks = tasks
+            last_rank = rank
+        
+        if page_size > 0:
+            op.ITxnCreate.submit()
+        
+        self.payout_plans[challenge_id] = plan._replace(
+            cursor=arc4.UInt64(cursor),
+            last_tasks=arc4.UInt64(last_tasks),
+            last_rank=arc4.UInt64(last_rank)
+        )
+
+    @abimethod
+    def op_up(self) -> None:
+        """No-op call; each one in a group adds to the pooled opcode budget."""
+
+    @abimethod(readonly=True)
+    def get_payout_plan(self, challenge_id: arc4.UInt64) -> PayoutPlan:
+        """Get the payout plan and progress of a challenge."""
+        return self.payout_plans[challenge_id]
 
     @abimethod(readonly=True)
     def get_challenge_info(self, challenge_id: arc4.UInt64) -> Challenge:
         """Get challenge information."""
-        return self.challenges[challenge_id]
+        metadata = self.challenge_metadata[challenge_id]
+        state = self.challenge_states[challenge_id]
+        return Challenge(
+            challenge_id=challenge_id,
+            name=metadata.name,
+            description=metadata.description,
+            stake_amount=metadata.stake_amount,
+            max_participants=metadata.max_participants,
+            creator=metadata.creator,
+            start_time=metadata.start_time,
+            end_time=metadata.end_time,
+            total_staked=state.total_staked,
+            is_active=state.is_active,
+            current_week=state.current_week
+        )
 
     @abimethod(readonly=True)
     def get_participants(self, challenge_id: arc4.UInt64) -> arc4.DynamicArray[Participant]:
         """Get all participants for a challenge."""
-        return self.participants[challenge_id]
+        return self._load_participants(challenge_id)
+
+    @abimethod(readonly=True)
+    def get_participants_range(
+        self,
+        challenge_id: arc4.UInt64,
+        offset: arc4.UInt64,
+        limit: arc4.UInt64
+    ) -> arc4.DynamicArray[Participant]:
+        """Get up to limit participants in join order, starting at offset."""
+        participants = arc4.DynamicArray[Participant]()
+        index_box = self.participant_index.box(challenge_id)
+        start, end = self._page_bounds(
+            offset.native,
+            limit.native,
+            self.participant_counts.get(challenge_id, default=arc4.UInt64(0)).native
+        )
+        for i in urange(start, end):
+            address = arc4.Address.from_bytes(index_box.extract(i * ADDRESS_SIZE, ADDRESS_SIZE))
+            participants.append(self.participants[ParticipantKey(challenge_id=challenge_id, address=address)])
+        return participants
+
+    @abimethod(readonly=True)
+    def get_participant(self, challenge_id: arc4.UInt64, participant_address: arc4.Address) -> Participant:
+        """Get a single participant of a challenge."""
+        return self.participants[ParticipantKey(challenge_id=challenge_id, address=participant_address)]
+
+    @abimethod(readonly=True)
+    def get_weekly_completions(
+        self,
+        challenge_id: arc4.UInt64,
+        participant_address: arc4.Address,
+        week: arc4.UInt64
+    ) -> WeeklyCompletions:
+        """Get a participant's completion count and proof commitment for a week."""
+        counter_key = WeeklyCompletionKey(
+            challenge_id=challenge_id,
+            participant_address=participant_address,
+            week=week
+        )
+        return self.weekly_completions.get(
+            counter_key,
+            default=WeeklyCompletions(count=arc4.UInt64(0), proof_commitment=Hash32.from_bytes(op.bzero(32)))
+        )
+
+    @abimethod(readonly=True)
+    def get_elimination_tracker(self, challenge_id: arc4.UInt64) -> EliminationTracker:
+        """Get the active participant count and lowest task count bound of a challenge."""
+        return self.elimination_trackers[challenge_id]
+
+    @abimethod(readonly=True)
+    def get_leaderboard_summary(self, challenge_id: arc4.UInt64) -> LeaderboardSummary:
+        """Get the leaderboard totals of a challenge in one call."""
+        state = self.challenge_states[challenge_id]
+        tracker = self.elimination_trackers[challenge_id]
+        return LeaderboardSummary(
+            participant_count=self.participant_counts.get(challenge_id, default=arc4.UInt64(0)),
+            active_count=tracker.active_count,
+            min_tasks=tracker.min_tasks,
+            total_staked=state.total_staked,
+            current_week=state.current_week,
+            is_active=state.is_active,
+            ranking_count=arc4.UInt64(self._array_box_length(self.weekly_rankings.box(challenge_id).key)),
+            task_count=arc4.UInt64(self._array_box_length(self.tasks.box(challenge_id).key)),
+            message_count=self.message_counters.get(challenge_id, default=arc4.UInt64(0))
+        )
+
+    @abimethod(readonly=True)
+    def get_participant_count(self, challenge_id: arc4.UInt64) -> arc4.UInt64:
+        """Get the number of participants that joined a challenge."""
+        return self.participant_counts.get(challenge_id, default=arc4.UInt64(0))
 
     @abimethod(readonly=True)
     def get_weekly_rankings(self, challenge_id: arc4.UInt64) -> arc4.DynamicArray[WeeklyRanking]:
         """Get weekly rankings for a challenge."""
         return self.weekly_rankings[challenge_id]
 
+    @abimethod(readonly=True)
+    def get_weekly_rankings_range(
+        self,
+        challenge_id: arc4.UInt64,
+        offset: arc4.UInt64,
+        limit: arc4.UInt64
+    ) -> arc4.DynamicArray[WeeklyRanking]:
+        """Get up to limit weekly rankings in week order, starting at offset."""
+        rankings = arc4.DynamicArray[WeeklyRanking]()
+        box_key = self.weekly_rankings.box(challenge_id).key
+        start, end = self._page_bounds(offset.native, limit.native, self._array_box_length(box_key))
+        for i in urange(start, end):
+            # Rankings are fixed width, so each one is read straight from the box
+            rankings.append(WeeklyRanking.from_bytes(
+                op.Box.extract(box_key, ARRAY_LENGTH_SIZE + i * WEEKLY_RANKING_SIZE, WEEKLY_RANKING_SIZE)
+            ))
+        return rankings
+
     @abimethod(readonly=True)
     def get_participant_stake(self, participant_address: arc4.Address) -> arc4.UInt64:
         """Get participant's deposited amount."""
         return self.deposited.get(participant_address, default=arc4.UInt64(0))
 
+    @subroutine
+    def _is_active_participant(self, challenge_id: arc4.UInt64, address: arc4.Address) -> bool:
+        participant_key = ParticipantKey(challenge_id=challenge_id, address=address)
+        if participant_key not in self.participants:
+            return False
+        return self.participants[participant_key].is_active.native
+
+    @subroutine
+    def _load_participants(self, challenge_id: arc4.UInt64) -> arc4.DynamicArray[Participant]:
+        # Walks the index box; only used where every participant is needed
+        participants = arc4.DynamicArray[Participant]()
+        index_box = self.participant_index.box(challenge_id)
+        for i in urange(self.participant_counts[challenge_id].native):
+            address = arc4.Address.from_bytes(index_box.extract(i * ADDRESS_SIZE, ADDRESS_SIZE))
+            participants.append(self.participants[ParticipantKey(challenge_id=challenge_id, address=address)])
+        return participants
+
+    @subroutine
+    def _elimination_week(self, challenge_id: arc4.UInt64) -> UInt64:
+        # Weeks completed since the challenge started
+        time_since_start = Global.latest_timestamp() - self.challenge_metadata[challenge_id].start_time.native
+        return time_since_start // self.week_duration.native
+
+    @subroutine
+    def _elimination_due(self, challenge_id: arc4.UInt64) -> bool:
+        if challenge_id not in self.challenge_states:
+            return False
+        state = self.challenge_states[challenge_id]
+        if not state.is_active:
+            return False
+        if self._elimination_week(challenge_id) <= state.current_week.native:
+            return False
+        return self.elimination_trackers[challenge_id].active_count.native > 1
+
+    @subroutine
+    def _is_lowest_performer(self, challenge_id: arc4.UInt64, address: arc4.Address) -> bool:
+        # min_tasks is kept exact, so one comparison suffices
+        participant = self.participants[ParticipantKey(challenge_id=challenge_id, address=address)]
+        return participant.tasks_completed.native == self.elimination_trackers[challenge_id].min_tasks.native
+
+    @subroutine
+    def _eliminate(self, challenge_id: arc4.UInt64, lowest_performer: arc4.Address) -> None:
+        state = self.challenge_states[challenge_id]
+        current_time = Global.latest_timestamp()
+        expected_week = self._elimination_week(challenge_id)
+        
+        # Mark as eliminated
+        participant_key = ParticipantKey(challenge_id=challenge_id, address=lowest_performer)
+        participant = self.participants[participant_key]
+        tasks_completed = participant.tasks_completed.native
+        self.participants[participant_key] = participant._replace(is_active=arc4.Bool(False))
+        self._remove_active(challenge_id, tasks_completed)
+        
+        # Create weekly ranking
+        ranking = WeeklyRanking(
+            week=arc4.UInt64(expected_week),
+            eliminated_participant=lowest_performer,
+            timestamp=arc4.UInt64(current_time)
+        )
+        
+        rankings = self.weekly_rankings.get(challenge_id, default=arc4.DynamicArray[WeeklyRanking]())
+        rankings.append(ranking)
+        self.weekly_rankings[challenge_id] = rankings.copy()
+        
+        # Update challenge week, closing the challenge once 21 days are completed
+        self.challenge_states[challenge_id] = state._replace(
+            current_week=arc4.UInt64(expected_week),
+            is_active=arc4.Bool(current_time < self.challenge_metadata[challenge_id].end_time.native)
+        )
+        
+        arc4.emit(ParticipantEliminated(
+            challenge_id=challenge_id,
+            participant=lowest_performer,
+            week=arc4.UInt64(expected_week),
+            tasks_completed=arc4.UInt64(tasks_completed),
+            timestamp=arc4.UInt64(current_time)
+        ))
+
+    @subroutine
+    def _page_bounds(self, offset: UInt64, limit: UInt64, count: UInt64) -> tuple[UInt64, UInt64]:
+        # [start, end) of a range read, capped at READ_PAGE_LIMIT entries
+        if offset >= count:
+            return count, count
+        size = count - offset
+        if limit < size:
+            size = limit
+        if size > READ_PAGE_LIMIT:
+            size = UInt64(READ_PAGE_LIMIT)
+        return offset, offset + size
+
+    @subroutine
+    def _array_box_length(self, box_key: Bytes) -> UInt64:
+        # Length prefix of a DynamicArray box; a missing box is an empty array
+        _box_size, exists = op.Box.length(box_key)
+        if not exists:
+            return UInt64(0)
+        return op.btoi(op.Box.extract(box_key, 0, ARRAY_LENGTH_SIZE))
+
+    @subroutine
+    def _array_box_element(self, box_key: Bytes, index: UInt64, count: UInt64) -> Bytes:
+        # Element of a DynamicArray box of dynamic structs, located through its
+        # head offsets so the rest of the box is never loaded
+        start = op.btoi(op.Box.extract(box_key, ARRAY_LENGTH_SIZE + index * 2, 2))
+        if index + 1 < count:
+            end = op.btoi(op.Box.extract(box_key, ARRAY_LENGTH_SIZE + (index + 1) * 2, 2))
+        else:
+            box_size, _exists = op.Box.length(box_key)
+            end = box_size - ARRAY_LENGTH_SIZE
+        return op.Box.extract(box_key, ARRAY_LENGTH_SIZE + start, end - start)
+
+    @subroutine
+    def _read_chat_messages(self, challenge_id: arc4.UInt64, start: UInt64, end: UInt64) -> ChatMessagePage:
+        # Messages [start, end) in id order, stopping before the first one
+        # that would take the return value past READ_BYTE_LIMIT
+        messages = arc4.DynamicArray[ChatMessage]()
+        size = UInt64(0)
+        message_id = start
+        while message_id < end:
+            page_key = ChatPageKey(challenge_id=challenge_id, page_no=arc4.UInt64(message_id // CHAT_PAGE_SIZE))
+            box_key = self.chat_messages.box(page_key).key
+            message = self._array_box_element(box_key, message_id % CHAT_PAGE_SIZE, self._array_box_length(box_key))
+            size += message.length + 2
+            if size > READ_BYTE_LIMIT:
+                break
+            messages.append(ChatMessage.from_bytes(message))
+            message_id += 1
+        return ChatMessagePage(next_offset=arc4.UInt64(message_id), messages=messages.copy())
+
+    @subroutine
+    def _bucket_add(self, challenge_id: arc4.UInt64, tasks_completed: UInt64, lower: UInt64) -> None:
+        # Add an active participant to a bucket. An empty bucket is linked in
+        # right above `lower`, the highest non-empty count below it (NO_BUCKET
+        # if it becomes the lowest count)
+        bucket_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(tasks_completed))
+        bucket = self.completion_buckets.get(bucket_key, default=CompletionBucket(
+            count=arc4.UInt64(0), lower=arc4.UInt64(NO_BUCKET), higher=arc4.UInt64(NO_BUCKET)
+        ))
+        if bucket.count.native != 0:
+            self.completion_buckets[bucket_key] = bucket._replace(count=arc4.UInt64(bucket.count.native + 1))
+            return
+        
+        if lower == NO_BUCKET:
+            tracker = self.elimination_trackers[challenge_id]
+            higher = tracker.min_tasks.native if tracker.active_count.native != 0 else UInt64(NO_BUCKET)
+            self.elimination_trackers[challenge_id] = tracker._replace(min_tasks=arc4.UInt64(tasks_completed))
+        else:
+            lower_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(lower))
+            lower_bucket = self.completion_buckets[lower_key]
+            higher = lower_bucket.higher.native
+            self.completion_buckets[lower_key] = lower_bucket._replace(higher=arc4.UInt64(tasks_completed))
+        if higher != NO_BUCKET:
+            higher_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(higher))
+            self.completion_buckets[higher_key] = self.completion_buckets[higher_key]._replace(
+                lower=arc4.UInt64(tasks_completed)
+            )
+        self.completion_buckets[bucket_key] = CompletionBucket(
+            count=arc4.UInt64(1), lower=arc4.UInt64(lower), higher=arc4.UInt64(higher)
+        )
+
+    @subroutine
+    def _bucket_remove(self, challenge_id: arc4.UInt64, tasks_completed: UInt64) -> None:
+        # Remove an active participant from a bucket, unlinking the bucket once
+        # it is empty; when the lowest bucket empties, the next one up is the lowest
+        bucket_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(tasks_completed))
+        bucket = self.completion_buckets[bucket_key]
+        if bucket.count.native != 1:
+            self.completion_buckets[bucket_key] = bucket._replace(count=arc4.UInt64(bucket.count.native - 1))
+            return
+        
+        lower = bucket.lower.native
+        higher = bucket.higher.native
+        if lower == NO_BUCKET:
+            # Left as is when the last active participant goes; _bucket_add
+            # checks active_count before linking to it
+            if higher != NO_BUCKET:
+                tracker = self.elimination_trackers[challenge_id]
+                self.elimination_trackers[challenge_id] = tracker._replace(min_tasks=arc4.UInt64(higher))
+        else:
+            lower_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(lower))
+            self.completion_buckets[lower_key] = self.completion_buckets[lower_key]._replace(
+                higher=arc4.UInt64(higher)
+            )
+        if higher != NO_BUCKET:
+            higher_key = CompletionBucketKey(challenge_id=challenge_id, tasks_completed=arc4.UInt64(higher))
+            self.completion_buckets[higher_key] = self.completion_buckets[higher_key]._replace(
+                lower=arc4.UInt64(lower)
+            )
+        # The empty box stays, so its MBR is not refunded and charged again
+        self.completion_buckets[bucket_key] = CompletionBucket(
+            count=arc4.UInt64(0), lower=arc4.UInt64(NO_BUCKET), higher=arc4.UInt64(NO_BUCKET)
+        )
+
+    @subroutine
+    def _start_payout(self, challenge_id: arc4.UInt64) -> None:
+        # Fix the pool, winner count and multiplier sum once for all payout pages
+        state = self.challenge_states[challenge_id]
+        total_pool = state.total_staked.native
+        platform_fee = (total_pool * self.platform_fee_percentage.native) // 10000
+        winner_count = self.elimination_trackers[challenge_id].active_count.native
+        
+        # The pool stops earning interest once it is paid out
+        self._accrue_interest()
+        self.total_active_staked -= total_pool
+        self.challenge_states[challenge_id] = state._replace(total_staked=arc4.UInt64(0))
+        
+        # Update platform revenue
+        self.total_fees_collected += platform_fee
+        
+        self.payout_plans[challenge_id] = PayoutPlan(
+            distribution_pool=arc4.UInt64(total_pool - platform_fee),
+            winner_count=arc4.UInt64(winner_count),
+            total_multiplier=arc4.UInt64(winner_count * (winner_count + 1) // 2),
+            cursor=arc4.UInt64(0),
+            last_tasks=arc4.UInt64(MAX_UINT64),
+            last_rank=arc4.UInt64(0)
+        )
+
+    @subroutine
+    def _add_active(self, challenge_id: arc4.UInt64) -> None:
+        # Joins start with no completed tasks, the lowest possible count
+        self._bucket_add(challenge_id, UInt64(0), UInt64(NO_BUCKET))
+        tracker = self.elimination_trackers[challenge_id]
+        self.elimination_trackers[challenge_id] = tracker._replace(
+            active_count=arc4.UInt64(tracker.active_count.native + 1)
+        )
+
+    @subroutine
+    def _remove_active(self, challenge_id: arc4.UInt64, tasks_completed: UInt64) -> None:
+        self._bucket_remove(challenge_id, tasks_completed)
+        tracker = self.elimination_trackers[challenge_id]
+        self.elimination_trackers[challenge_id] = tracker._replace(
+            active_count=arc4.UInt64(tracker.active_count.native - 1)
+        )
+
     # ===== CHAT SYSTEM =====
     
     @abimethod
@@ -453,18 +875,10 @@ class ChallengePlatform(ARC4Contract):
         content: arc4.String
     ) -> None:
         """Send a message to challenge chat room."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
+        assert self.challenge_states[challenge_id].is_active, CHALLENGE_NOT_ACTIVE
         
         # Check if user is participating
-        participants = self.participants[challenge_id]
-        is_participant = False
-        for participant in participants:
-            if participant.address.native == Txn.sender and participant.is_active:
-                is_participant = True
-                break
-        
-        assert is_participant, NOT_PARTICIPATING
+        assert self._is_active_participant(challenge_id, arc4.Address(Txn.sender)), NOT_PARTICIPATING
         
         # Create message
         message_id = self.message_counters.get(challenge_id, default=arc4.UInt64(0))
@@ -475,12 +889,26 @@ class ChallengePlatform(ARC4Contract):
             timestamp=arc4.UInt64(Global.latest_timestamp()),
             is_system_message=arc4.Bool(False)
         )
+        assert message.bytes.length <= MAX_ENTRY_SIZE, ENTRY_TOO_LARGE
         
-        # Store message
+        # Store message in its page, so only one bounded page box is rewritten
+        page_key = ChatPageKey(
+            challenge_id=challenge_id,
+            page_no=arc4.UInt64(message_id.native // CHAT_PAGE_SIZE)
+        )
         mbr_baseline = Global.current_application_address.min_balance
-        messages = self.chat_messages.get(challenge_id, default=arc4.DynamicArray[ChatMessage]())
-        self.chat_messages[challenge_id] = messages.append(message)
-        self.message_counters[challenge_id] = message_id + arc4.UInt64(1)
+        messages = self.chat_messages.get(page_key, default=arc4.DynamicArray[ChatMessage]())
+        messages.append(message)
+        self.chat_messages[page_key] = messages.copy()
+        self.message_counters[challenge_id] = arc4.UInt64(message_id.native + 1)
+        
+        arc4.emit(ChatMessageSent(
+            challenge_id=challenge_id,
+            message_id=message_id,
+            sender=arc4.Address(Txn.sender),
+            timestamp=message.timestamp,
+            content=content
+        ))
         
         mbr_diff = Global.current_application_address.min_balance - mbr_baseline
         self.deposited[arc4.Address(Txn.sender)] = arc4.UInt64(
@@ -488,59 +916,110 @@ class ChallengePlatform(ARC4Contract):
         )
 
     @abimethod(readonly=True)
-    def get_chat_messages(self, challenge_id: arc4.UInt64) -> arc4.DynamicArray[ChatMessage]:
-        """Get all chat messages for a challenge."""
-        return self.chat_messages.get(challenge_id, default=arc4.DynamicArray[ChatMessage]())
+    def get_chat_messages(
+        self,
+        challenge_id: arc4.UInt64,
+        page_no: arc4.UInt64
+    ) -> ChatMessagePage:
+        """Get the messages of one chat page (CHAT_PAGE_SIZE per page) that fit in one return value.
+        
+        next_offset is the id of the first message not returned; the rest of
+        the page is read from there with get_chat_messages_range.
+        """
+        page_key = ChatPageKey(challenge_id=challenge_id, page_no=page_no)
+        box_key = self.chat_messages.box(page_key).key
+        first_id = page_no.native * CHAT_PAGE_SIZE
+        return self._read_chat_messages(challenge_id, first_id, first_id + self._array_box_length(box_key))
+
+    @abimethod(readonly=True)
+    def get_chat_messages_range(
+        self,
+        challenge_id: arc4.UInt64,
+        offset: arc4.UInt64,
+        limit: arc4.UInt64
+    ) -> ChatMessagePage:
+        """Get up to limit chat messages by message id, starting at offset.
+        
+        Stops early where the next message would not fit in the return
+        value; next_offset is the id to read on from.
+        """
+        start, end = self._page_bounds(
+            offset.native,
+            limit.native,
+            self.message_counters.get(challenge_id, default=arc4.UInt64(0)).native
+        )
+        return self._read_chat_messages(challenge_id, start, end)
+
+    @abimethod(readonly=True)
+    def get_chat_message_count(self, challenge_id: arc4.UInt64) -> arc4.UInt64:
+        """Get the number of chat messages sent in a challenge."""
+        return self.message_counters.get(challenge_id, default=arc4.UInt64(0))
 
     # ===== HEALTH DATA VERIFICATION =====
     
     @abimethod
-    def submit_health_data(
+    def commit_health_root(
         self,
         challenge_id: arc4.UInt64,
-        data_type: arc4.String,
-        value: arc4.UInt64,
-        source: arc4.String,
-        verification_hash: arc4.String
+        participant_address: arc4.Address,
+        day: arc4.UInt64,
+        root: Hash32,
+        sample_count: arc4.UInt64
     ) -> None:
-        """Submit health data for verification."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
-        
-        # Check if user is participating
-        participants = self.participants[challenge_id]
-        is_participant = False
-        for participant in participants:
-            if participant.address.native == Txn.sender and participant.is_active:
-                is_participant = True
-                break
+        """Commit the Merkle root of a participant's health samples for one day (platform only)."""
+        assert Txn.sender == Global.creator_address, UNAUTHORIZED
         
-        assert is_participant, NOT_PARTICIPATING
+        assert self.challenge_states[challenge_id].is_active, CHALLENGE_NOT_ACTIVE
+        assert ParticipantKey(challenge_id=challenge_id, address=participant_address) in self.participants, NOT_PARTICIPATING
         
-        # Create health data record
-        health_record = HealthData(
-            participant_address=arc4.Address(Txn.sender),
-            data_type=data_type,
-            value=value,
-            timestamp=arc4.UInt64(Global.latest_timestamp()),
-            source=source,
-            verification_hash=verification_hash
-        )
+        # A day may be re-committed as late samples arrive, but never with fewer samples
+        root_key = HealthRootKey(challenge_id=challenge_id, participant_address=participant_address, day=day)
+        if root_key in self.health_roots:
+            assert sample_count.native >= self.health_roots[root_key].sample_count.native, INVALID_ARGUMENTS
         
-        # Store health data
         mbr_baseline = Global.current_application_address.min_balance
-        health_data = self.health_data.get(challenge_id, default=arc4.DynamicArray[HealthData]())
-        self.health_data[challenge_id] = health_data.append(health_record)
+        self.health_roots[root_key] = HealthRoot(
+            root=root,
+            sample_count=sample_count,
+            committed_at=arc4.UInt64(Global.latest_timestamp())
+        )
         
         mbr_diff = Global.current_application_address.min_balance - mbr_baseline
-        self.deposited[arc4.Address(Txn.sender)] = arc4.UInt64(
-            self.deposited.get(arc4.Address(Txn.sender), default=arc4.UInt64(0)).native - mbr_diff
+        self.deposited[participant_address] = arc4.UInt64(
+            self.deposited.get(participant_address, default=arc4.UInt64(0)).native - mbr_diff
         )
 
     @abimethod(readonly=True)
-    def get_health_data(self, challenge_id: arc4.UInt64) -> arc4.DynamicArray[HealthData]:
-        """Get health data for a challenge."""
-        return self.health_data.get(challenge_id, default=arc4.DynamicArray[HealthData]())
+    def get_health_root(
+        self,
+        challenge_id: arc4.UInt64,
+        participant_address: arc4.Address,
+        day: arc4.UInt64
+    ) -> HealthRoot:
+        """Get the committed health data root of a participant for one day."""
+        return self.health_roots[HealthRootKey(challenge_id=challenge_id, participant_address=participant_address, day=day)]
+
+    @abimethod(readonly=True)
+    def get_health_roots_range(
+        self,
+        challenge_id: arc4.UInt64,
+        participant_address: arc4.Address,
+        first_day: arc4.UInt64,
+        limit: arc4.UInt64
+    ) -> arc4.DynamicArray[HealthRoot]:
+        """Get the health data roots of up to limit consecutive days; uncommitted days are zero."""
+        roots = arc4.DynamicArray[HealthRoot]()
+        start, end = self._page_bounds(first_day.native, limit.native, UInt64(MAX_UINT64))
+        for day in urange(start, end):
+            roots.append(self.health_roots.get(
+                HealthRootKey(challenge_id=challenge_id, participant_address=participant_address, day=arc4.UInt64(day)),
+                default=HealthRoot(
+                    root=Hash32.from_bytes(op.bzero(32)),
+                    sample_count=arc4.UInt64(0),
+                    committed_at=arc4.UInt64(0)
+                )
+            ))
+        return roots
 
     # ===== TASK MANAGEMENT =====
     
@@ -555,9 +1034,8 @@ class ChallengePlatform(ARC4Contract):
         points: arc4.UInt64
     ) -> None:
         """Create a new task for a challenge (only creator can do this)."""
-        challenge = self.challenges[challenge_id]
-        assert challenge.creator.native == Txn.sender, UNAUTHORIZED
-        assert challenge.is_active, CHALLENGE_NOT_ACTIVE
+        assert self.challenge_metadata[challenge_id].creator.native == Txn.sender, UNAUTHORIZED
+        assert self.challenge_states[challenge_id].is_active, CHALLENGE_NOT_ACTIVE
         
         # Create task
         task_id = arc4.UInt64(len(self.tasks.get(challenge_id, default=arc4.DynamicArray[Task]())))
@@ -571,11 +1049,13 @@ class ChallengePlatform(ARC4Contract):
             points=points,
             is_active=arc4.Bool(True)
         )
+        assert task.bytes.length <= MAX_ENTRY_SIZE, ENTRY_TOO_LARGE
         
         # Store task
         mbr_baseline = Global.current_application_address.min_balance
         tasks = self.tasks.get(challenge_id, default=arc4.DynamicArray[Task]())
-        self.tasks[challenge_id] = tasks.append(task)
+        tasks.append(task)
+        self.tasks[challenge_id] = tasks.copy()
         
         mbr_diff = Global.current_application_address.min_balance - mbr_baseline
         self.deposited[arc4.Address(Txn.sender)] = arc4.UInt64(
@@ -587,51 +1067,57 @@ class ChallengePlatform(ARC4Contract):
         """Get all tasks for a challenge."""
         return self.tasks.get(challenge_id, default=arc4.DynamicArray[Task]())
 
+    @abimethod(readonly=True)
+    def get_tasks_range(
+        self,
+        challenge_id: arc4.UInt64,
+        offset: arc4.UInt64,
+        limit: arc4.UInt64
+    ) -> TaskPage:
+        """Get up to limit tasks by task id, starting at offset.
+        
+        Stops early where the next task would not fit in the return value;
+        next_offset is the id to read on from.
+        """
+        tasks = arc4.DynamicArray[Task]()
+        box_key = self.tasks.box(challenge_id).key
+        count = self._array_box_length(box_key)
+        start, end = self._page_bounds(offset.native, limit.native, count)
+        size = UInt64(0)
+        task_id = start
+        while task_id < end:
+            task = self._array_box_element(box_key, task_id, count)
+            size += task.length + 2
+            if size > READ_BYTE_LIMIT:
+                break
+            tasks.append(Task.from_bytes(task))
+            task_id += 1
+        return TaskPage(next_offset=arc4.UInt64(task_id), tasks=tasks.copy())
+
     # ===== PLATFORM REVENUE =====
     
     @abimethod
     def calculate_platform_revenue(self) -> None:
-        """Calculate platform revenue from interest on staked funds."""
-        current_time = Global.latest_timestamp()
-        last_update = self.platform_revenue.last_updated.native
-        
-        if last_update == 0:
-            self.platform_revenue = PlatformRevenue(
-                total_fees_collected=self.platform_revenue.total_fees_collected,
-                interest_earned=self.platform_revenue.interest_earned,
-                last_updated=arc4.UInt64(current_time)
-            )
-            return
-        
-        # Calculate interest for all active challenges
-        total_staked = UInt64(0)
-        for challenge_id in self.challenges:
-            challenge = self.challenges[challenge_id]
-            if challenge.is_active:
-                total_staked += challenge.total_staked.native
-        
-        # Calculate daily interest
-        days_elapsed = (current_time - last_update) // 86400  # 86400 seconds = 1 day
-        if days_elapsed > 0:
-            daily_interest = (total_staked * self.interest_rate.native * days_elapsed) // 10000
-            self.platform_revenue = PlatformRevenue(
-                total_fees_collected=self.platform_revenue.total_fees_collected,
-                interest_earned=arc4.UInt64(self.platform_revenue.interest_earned.native + daily_interest),
-                last_updated=arc4.UInt64(current_time)
-            )
+        """Accrue interest on staked funds up to now (constant cost in the number of challenges)."""
+        self._accrue_interest()
 
     @abimethod(readonly=True)
     def get_platform_revenue(self) -> PlatformRevenue:
         """Get platform revenue information."""
-        return self.platform_revenue
+        return PlatformRevenue(
+            total_fees_collected=arc4.UInt64(self.total_fees_collected),
+            interest_earned=arc4.UInt64(self.interest_earned),
+            last_updated=arc4.UInt64(self.revenue_updated_at)
+        )
 
     @abimethod
     def withdraw_platform_revenue(self) -> None:
         """Withdraw platform revenue (only platform owner)."""
         # Only creator can withdraw
         assert Txn.sender == Global.creator_address, UNAUTHORIZED
+        self._accrue_interest()
         
-        total_revenue = self.platform_revenue.total_fees_collected.native + self.platform_revenue.interest_earned.native
+        total_revenue = self.total_fees_collected + self.interest_earned
         
         if total_revenue > 0:
             itxn.Payment(
@@ -639,8 +1125,30 @@ class ChallengePlatform(ARC4Contract):
                 amount=total_revenue
             ).submit()
             
-            self.platform_revenue = PlatformRevenue(
-                total_fees_collected=arc4.UInt64(0),
-                interest_earned=arc4.UInt64(0),
-                last_updated=arc4.UInt64(Global.latest_timestamp())
-            )
+            self.total_fees_collected = UInt64(0)
+            self.interest_earned = UInt64(0)
+
+    @subroutine
+    def _accrue_interest(self) -> None:
+        """Advance the interest index by whole days elapsed and book the interest earned."""
+        current_time = Global.latest_timestamp()
+        last_update = self.revenue_updated_at
+        
+        if last_update == 0:
+            self.revenue_updated_at = current_time
+            return
+        
+        days_elapsed = (current_time - last_update) // SECONDS_PER_DAY
+        if days_elapsed == 0:
+            return
+        
+        index_delta = (self.interest_rate.native * days_elapsed * INTEREST_INDEX_SCALE) // 10000
+        self.interest_index += index_delta
+        
+        # interest = total_active_staked * index_delta / scale, in 128-bit intermediate math
+        high, low = op.mulw(self.total_active_staked, index_delta)
+        interest = op.divw(high, low, UInt64(INTEREST_INDEX_SCALE))
+        
+        # Partial days keep accruing towards the next whole day
+        self.interest_earned += interest
+        self.revenue_updated_at = last_update + days_elapsed * SECONDS_PER_DAY
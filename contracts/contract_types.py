@@ -1,9 +1,14 @@
 # Smart contract types for challenge platform
+import typing
+
 from algopy import UInt64, arc4
 
+# 32-byte hash value (e.g. a sha256 commitment)
+Hash32 = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
 
 class Challenge(arc4.Struct, frozen=True):
-    """Challenge data structure stored on-chain."""
+    """Challenge view returned by get_challenge_info (metadata and state combined)."""
     challenge_id: arc4.UInt64
     name: arc4.String
     description: arc4.String
@@ -17,6 +22,24 @@ class Challenge(arc4.Struct, frozen=True):
     current_week: arc4.UInt64
 
 
+class ChallengeMetadata(arc4.Struct, frozen=True):
+    """Challenge fields fixed at creation, written once."""
+    name: arc4.String
+    description: arc4.String
+    stake_amount: arc4.UInt64
+    max_participants: arc4.UInt64
+    creator: arc4.Address
+    start_time: arc4.UInt64
+    end_time: arc4.UInt64
+
+
+class ChallengeState(arc4.Struct, frozen=True):
+    """Challenge fields that change while it runs (fixed width)."""
+    total_staked: arc4.UInt64
+    current_week: arc4.UInt64
+    is_active: arc4.Bool
+
+
 class Participant(arc4.Struct, frozen=True):
     """Participant data structure stored on-chain."""
     address: arc4.Address
@@ -27,6 +50,50 @@ class Participant(arc4.Struct, frozen=True):
     current_rank: arc4.UInt64
 
 
+class ParticipantKey(arc4.Struct, frozen=True):
+    """Key of a participant box: one box per participant per challenge."""
+    challenge_id: arc4.UInt64
+    address: arc4.Address
+
+
+class EliminationTracker(arc4.Struct, frozen=True):
+    """Active participant count and their lowest task count."""
+    active_count: arc4.UInt64
+    min_tasks: arc4.UInt64
+
+
+class EliminationRequest(arc4.Struct, frozen=True):
+    """One challenge of a process_due_eliminations batch and its lowest performer."""
+    challenge_id: arc4.UInt64
+    lowest_performer: arc4.Address
+
+
+class LeaderboardSummary(arc4.Struct, frozen=True):
+    """Leaderboard totals of a challenge returned by get_leaderboard_summary."""
+    participant_count: arc4.UInt64
+    active_count: arc4.UInt64
+    min_tasks: arc4.UInt64  # lowest active task count
+    total_staked: arc4.UInt64
+    current_week: arc4.UInt64
+    is_active: arc4.Bool
+    ranking_count: arc4.UInt64
+    task_count: arc4.UInt64
+    message_count: arc4.UInt64
+
+
+class CompletionBucketKey(arc4.Struct, frozen=True):
+    """Key of the number of active participants with a given task count."""
+    challenge_id: arc4.UInt64
+    tasks_completed: arc4.UInt64
+
+
+class CompletionBucket(arc4.Struct, frozen=True):
+    """Active participants with one task count, linked to the neighbouring non-empty counts."""
+    count: arc4.UInt64
+    lower: arc4.UInt64  # next lower non-empty task count, NO_BUCKET if none
+    higher: arc4.UInt64  # next higher non-empty task count, NO_BUCKET if none
+
+
 class WeeklyRanking(arc4.Struct, frozen=True):
     """Weekly ranking data structure."""
     week: arc4.UInt64
@@ -34,12 +101,17 @@ class WeeklyRanking(arc4.Struct, frozen=True):
     timestamp: arc4.UInt64
 
 
-class TaskCompletion(arc4.Struct, frozen=True):
-    """Task completion record."""
+class WeeklyCompletionKey(arc4.Struct, frozen=True):
+    """Key of a participant's completion counter for one challenge week."""
+    challenge_id: arc4.UInt64
     participant_address: arc4.Address
-    task_id: arc4.UInt64
-    completed_at: arc4.UInt64
-    proof_data: arc4.String  # Placeholder for health data verification
+    week: arc4.UInt64
+
+
+class WeeklyCompletions(arc4.Struct, frozen=True):
+    """Completions in a week and a rolling sha256 commitment of their proofs."""
+    count: arc4.UInt64
+    proof_commitment: Hash32
 
 
 class PoolDistribution(arc4.Struct, frozen=True):
@@ -50,6 +122,16 @@ class PoolDistribution(arc4.Struct, frozen=True):
     timestamp: arc4.UInt64
 
 
+class PayoutPlan(arc4.Struct, frozen=True):
+    """Pool payout fixed when distribution starts, resumed by cursor."""
+    distribution_pool: arc4.UInt64
+    winner_count: arc4.UInt64
+    total_multiplier: arc4.UInt64
+    cursor: arc4.UInt64  # winners paid so far
+    last_tasks: arc4.UInt64  # ranking key of the last paid winner
+    last_rank: arc4.UInt64
+
+
 class ChatMessage(arc4.Struct, frozen=True):
     """Chat message in challenge room."""
     message_id: arc4.UInt64
@@ -59,8 +141,20 @@ class ChatMessage(arc4.Struct, frozen=True):
     is_system_message: arc4.Bool
 
 
+class ChatMessagePage(arc4.Struct, frozen=True):
+    """Chat messages that fit in one return value, and the message id to read on from."""
+    next_offset: arc4.UInt64
+    messages: arc4.DynamicArray[ChatMessage]
+
+
+class ChatPageKey(arc4.Struct, frozen=True):
+    """Key of a fixed-capacity chat message page."""
+    challenge_id: arc4.UInt64
+    page_no: arc4.UInt64
+
+
 class HealthData(arc4.Struct, frozen=True):
-    """Health data verification for tasks."""
+    """Health data sample; hashed off-chain into a daily Merkle root, not stored."""
     participant_address: arc4.Address
     data_type: arc4.String  # "steps", "calories", "heart_rate", etc.
     value: arc4.UInt64
@@ -69,8 +163,22 @@ class HealthData(arc4.Struct, frozen=True):
     verification_hash: arc4.String
 
 
+class HealthRootKey(arc4.Struct, frozen=True):
+    """Box key for a participant's health data root of one day."""
+    challenge_id: arc4.UInt64
+    participant_address: arc4.Address
+    day: arc4.UInt64  # days since the unix epoch
+
+
+class HealthRoot(arc4.Struct, frozen=True):
+    """Merkle root over a participant's health samples of one day."""
+    root: Hash32
+    sample_count: arc4.UInt64
+    committed_at: arc4.UInt64
+
+
 class PlatformRevenue(arc4.Struct, frozen=True):
-    """Platform revenue tracking."""
+    """Platform revenue view returned by get_platform_revenue."""
     total_fees_collected: arc4.UInt64
     interest_earned: arc4.UInt64
     last_updated: arc4.UInt64
@@ -86,3 +194,59 @@ class Task(arc4.Struct, frozen=True):
     data_type: arc4.String  # "steps", "calories", "workout_duration"
     points: arc4.UInt64
     is_active: arc4.Bool
+
+
+class TaskPage(arc4.Struct, frozen=True):
+    """Tasks that fit in one return value, and the task id to read on from."""
+    next_offset: arc4.UInt64
+    tasks: arc4.DynamicArray[Task]
+
+
+# ===== ARC-28 EVENTS =====
+# Emitted with arc4.emit; the event name is the struct name and its
+# signature is "Name(field types)", e.g. "ParticipantJoined(uint64,address,uint64,uint64,uint64)"
+
+class ParticipantJoined(arc4.Struct, frozen=True):
+    """Emitted by join_challenge."""
+    challenge_id: arc4.UInt64
+    participant: arc4.Address
+    stake_amount: arc4.UInt64  # net of the platform fee
+    participant_count: arc4.UInt64
+    joined_at: arc4.UInt64
+
+
+class TaskCompleted(arc4.Struct, frozen=True):
+    """Emitted by complete_task; carries everything needed to replay the weekly proof commitment."""
+    challenge_id: arc4.UInt64
+    participant: arc4.Address
+    task_id: arc4.UInt64
+    week: arc4.UInt64
+    completed_at: arc4.UInt64
+    tasks_completed: arc4.UInt64  # total after this completion
+    proof_data: arc4.String  # Placeholder for health data verification
+
+
+class ChatMessageSent(arc4.Struct, frozen=True):
+    """Emitted by send_chat_message."""
+    challenge_id: arc4.UInt64
+    message_id: arc4.UInt64
+    sender: arc4.Address
+    timestamp: arc4.UInt64
+    content: arc4.String
+
+
+class ParticipantEliminated(arc4.Struct, frozen=True):
+    """Emitted by process_weekly_elimination and process_due_eliminations."""
+    challenge_id: arc4.UInt64
+    participant: arc4.Address
+    week: arc4.UInt64
+    tasks_completed: arc4.UInt64
+    timestamp: arc4.UInt64
+
+
+class PoolPaid(arc4.Struct, frozen=True):
+    """Emitted by distribute_pool for every winner paid."""
+    challenge_id: arc4.UInt64
+    winner: arc4.Address
+    amount: arc4.UInt64
+    rank: arc4.UInt64  # 1-based position in the final ranking
@@ -0,0 +1,791 @@
+# In-process Algorand ledger stand-in for tests and benchmarks
+#
+# Implements the subset of algosdk's AlgodClient used by the platform
+# (suggested params, submission, pending info, round waits, app/box reads,
+# simulate) against in-memory state, producing a block every `block_time`
+# seconds. App calls run the real ChallengePlatform contract through the
+# algopy testing framework when algorand-python-testing is installed;
+# without it only the box-backed read-only getters are served.
+
+from algosdk import abi, logic, transaction
+from algosdk.abi import Method
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.models import SimulateRequest
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import base64
+import contextvars
+import copy
+import hashlib
+import inspect
+import threading
+import time
+
+# Prefix of the log line carrying an ARC-4 method return value
+RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+DEFAULT_BLOCK_TIME = 2.8
+GENESIS_ID = "local-ledger-v1"
+MIN_FEE = 1000
+MAX_TXN_LIFE = 1000
+FIRST_APP_ID = 1001
+# algod holds wait-for-block requests open for up to a minute
+STATUS_AFTER_BLOCK_TIMEOUT = 60.0
+# Bytes an app call may log in total
+MAX_LOG_SIZE = 1024
+
+# ABI of the ChallengePlatform contract in contracts/challenge_contract.py
+CHALLENGE_PLATFORM_METHODS = [
+    "create_challenge(uint64,string,string,uint64,uint64,pay)void",
+    "join_challenge(uint64,pay)void",
+    "leave_challenge(uint64)void",
+    "complete_task(uint64,uint64,address,string)void",
+    "process_weekly_elimination(uint64,address)void",
+    "process_due_eliminations((uint64,address)[])uint64[]",
+    "distribute_pool(uint64,address[])void",
+    "op_up()void",
+    "get_payout_plan(uint64)(uint64,uint64,uint64,uint64,uint64,uint64)",
+    "get_challenge_info(uint64)(uint64,string,string,uint64,uint64,address,uint64,uint64,uint64,bool,uint64)",
+    "get_participants(uint64)(address,uint64,uint64,bool,uint64,uint64)[]",
+    "get_participants_range(uint64,uint64,uint64)(address,uint64,uint64,bool,uint64,uint64)[]",
+    "get_participant(uint64,address)(address,uint64,uint64,bool,uint64,uint64)",
+    "get_participant_count(uint64)uint64",
+    "get_elimination_tracker(uint64)(uint64,uint64)",
+    "get_leaderboard_summary(uint64)(uint64,uint64,uint64,uint64,uint64,bool,uint64,uint64,uint64)",
+    "get_weekly_completions(uint64,address,uint64)(uint64,byte[32])",
+    "get_weekly_rankings(uint64)(uint64,address,uint64)[]",
+    "get_weekly_rankings_range(uint64,uint64,uint64)(uint64,address,uint64)[]",
+    "get_participant_stake(address)uint64",
+    "send_chat_message(uint64,string)void",
+    "get_chat_messages(uint64,uint64)(uint64,(uint64,address,string,uint64,bool)[])",
+    "get_chat_messages_range(uint64,uint64,uint64)(uint64,(uint64,address,string,uint64,bool)[])",
+    "get_chat_message_count(uint64)uint64",
+    "commit_health_root(uint64,address,uint64,byte[32],uint64)void",
+    "get_health_root(uint64,address,uint64)(byte[32],uint64,uint64)",
+    "get_health_roots_range(uint64,address,uint64,uint64)(byte[32],uint64,uint64)[]",
+    "create_task(uint64,string,string,uint64,string,uint64)void",
+    "get_tasks(uint64)(uint64,uint64,string,string,uint64,string,uint64,bool)[]",
+    "get_tasks_range(uint64,uint64,uint64)(uint64,(uint64,uint64,string,string,uint64,string,uint64,bool)[])",
+    "calculate_platform_revenue()void",
+    "get_platform_revenue()(uint64,uint64,uint64)",
+    "withdraw_platform_revenue()void",
+]
+
+# Read-only getters that return a box as-is -> (box map prefix, default value)
+BOX_GETTERS = {
+    "get_participant": (b"participants", None),
+    "get_participant_count": (b"participant_counts", (0).to_bytes(8, "big")),
+    "get_elimination_tracker": (b"elimination_trackers", None),
+    "get_payout_plan": (b"payout_plans", None),
+    "get_weekly_completions": (b"weekly_completions", bytes(40)),
+    "get_weekly_rankings": (b"weekly_rankings", None),
+    "get_participant_stake": (b"deposited", (0).to_bytes(8, "big")),
+    "get_health_root": (b"health_roots", None),
+}
+
+CHALLENGE_METADATA_TYPE = abi.ABIType.from_string("(string,string,uint64,uint64,address,uint64,uint64)")
+CHALLENGE_STATE_TYPE = abi.ABIType.from_string("(uint64,uint64,bool)")
+CHALLENGE_TYPE = abi.ABIType.from_string(
+    "(uint64,string,string,uint64,uint64,address,uint64,uint64,uint64,bool,uint64)"
+)
+
+def read_challenge_info(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_challenge_info: the Challenge view combined from its metadata and state boxes."""
+    metadata = boxes.get(b"challenge_metadata" + args[0])
+    state = boxes.get(b"challenge_states" + args[0])
+    assert metadata is not None and state is not None, "Box not found"
+
+    name, description, stake_amount, max_participants, creator, start_time, end_time = (
+        CHALLENGE_METADATA_TYPE.decode(metadata)
+    )
+    total_staked, current_week, is_active = CHALLENGE_STATE_TYPE.decode(state)
+    return CHALLENGE_TYPE.encode([
+        int.from_bytes(args[0], "big"), name, description, stake_amount, max_participants,
+        creator, start_time, end_time, total_staked, is_active, current_week
+    ])
+
+# Most entries returned by a range getter (READ_PAGE_LIMIT in the contract)
+READ_PAGE_LIMIT = 12
+# Bytes of entries a variable-size read returns (READ_BYTE_LIMIT in the contract)
+READ_BYTE_LIMIT = 1008
+CHAT_PAGE_SIZE = 16
+ADDRESS_SIZE = 32
+
+WEEKLY_RANKING_ARRAY_TYPE = abi.ABIType.from_string("(uint64,address,uint64)[]")
+CHAT_MESSAGE_TYPE = abi.ABIType.from_string("(uint64,address,string,uint64,bool)")
+CHAT_MESSAGE_ARRAY_TYPE = abi.ABIType.from_string("(uint64,address,string,uint64,bool)[]")
+CHAT_MESSAGE_PAGE_TYPE = abi.ABIType.from_string("(uint64,(uint64,address,string,uint64,bool)[])")
+TASK_TYPE = abi.ABIType.from_string("(uint64,uint64,string,string,uint64,string,uint64,bool)")
+TASK_ARRAY_TYPE = abi.ABIType.from_string("(uint64,uint64,string,string,uint64,string,uint64,bool)[]")
+TASK_PAGE_TYPE = abi.ABIType.from_string("(uint64,(uint64,uint64,string,string,uint64,string,uint64,bool)[])")
+ELIMINATION_TRACKER_TYPE = abi.ABIType.from_string("(uint64,uint64)")
+LEADERBOARD_SUMMARY_TYPE = abi.ABIType.from_string(
+    "(uint64,uint64,uint64,uint64,uint64,bool,uint64,uint64,uint64)"
+)
+
+def _uint64(value: bytes) -> int:
+    return int.from_bytes(value, "big")
+
+def _array_length(value: Optional[bytes]) -> int:
+    return 0 if value is None else int.from_bytes(value[:2], "big")
+
+def _page_bounds(offset: int, limit: int, count: int) -> Tuple[int, int]:
+    start = min(offset, count)
+    return start, start + min(limit, count - start, READ_PAGE_LIMIT)
+
+def read_participants_range(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_participants_range: participants in join order through the index box."""
+    count = _uint64(boxes.get(b"participant_counts" + args[0], bytes(8)))
+    index = boxes.get(b"participant_index" + args[0], b"")
+    start, end = _page_bounds(_uint64(args[1]), _uint64(args[2]), count)
+    participants = []
+    for i in range(start, end):
+        value = boxes.get(b"participants" + args[0] + index[i * ADDRESS_SIZE:(i + 1) * ADDRESS_SIZE])
+        assert value is not None, "Box not found"
+        participants.append(value)
+    return len(participants).to_bytes(2, "big") + b"".join(participants)
+
+def read_weekly_rankings_range(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_weekly_rankings_range: a slice of the weekly_rankings box."""
+    rankings = WEEKLY_RANKING_ARRAY_TYPE.decode(boxes.get(b"weekly_rankings" + args[0], bytes(2)))
+    start, end = _page_bounds(_uint64(args[1]), _uint64(args[2]), len(rankings))
+    return WEEKLY_RANKING_ARRAY_TYPE.encode(rankings[start:end])
+
+def _read_chat_messages(boxes: Dict[bytes, bytes], challenge_id: bytes, start: int, end: int) -> bytes:
+    """Messages [start, end) that fit in READ_BYTE_LIMIT, with the id to read on from."""
+    messages, size = [], 0
+    for message_id in range(start, end):
+        page = boxes.get(b"chat_messages" + challenge_id + (message_id // CHAT_PAGE_SIZE).to_bytes(8, "big"))
+        assert page is not None, "Box not found"
+        message = CHAT_MESSAGE_ARRAY_TYPE.decode(page)[message_id % CHAT_PAGE_SIZE]
+        size += len(CHAT_MESSAGE_TYPE.encode(message)) + 2
+        if size > READ_BYTE_LIMIT:
+            return CHAT_MESSAGE_PAGE_TYPE.encode([message_id, messages])
+        messages.append(message)
+    return CHAT_MESSAGE_PAGE_TYPE.encode([max(start, end), messages])
+
+def read_chat_messages(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_chat_messages: one chat page, as far as it fits in one return value."""
+    first_id = _uint64(args[1]) * CHAT_PAGE_SIZE
+    page = boxes.get(b"chat_messages" + args[0] + args[1])
+    return _read_chat_messages(boxes, args[0], first_id, first_id + _array_length(page))
+
+def read_chat_messages_range(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_chat_messages_range: messages by id across chat page boxes, as far as they fit."""
+    count = _uint64(boxes.get(b"message_counters" + args[0], bytes(8)))
+    start, end = _page_bounds(_uint64(args[1]), _uint64(args[2]), count)
+    return _read_chat_messages(boxes, args[0], start, end)
+
+def read_health_roots_range(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_health_roots_range: one root per day, zero for uncommitted days."""
+    first_day = _uint64(args[2])
+    roots = [
+        boxes.get(b"health_roots" + args[0] + args[1] + day.to_bytes(8, "big"), bytes(48))
+        for day in range(first_day, first_day + min(_uint64(args[3]), READ_PAGE_LIMIT))
+    ]
+    return len(roots).to_bytes(2, "big") + b"".join(roots)
+
+def read_tasks_range(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_tasks_range: a slice of the tasks box, as far as it fits in READ_BYTE_LIMIT."""
+    tasks = TASK_ARRAY_TYPE.decode(boxes.get(b"tasks" + args[0], bytes(2)))
+    start, end = _page_bounds(_uint64(args[1]), _uint64(args[2]), len(tasks))
+    size = 0
+    for task_id in range(start, end):
+        size += len(TASK_TYPE.encode(tasks[task_id])) + 2
+        if size > READ_BYTE_LIMIT:
+            return TASK_PAGE_TYPE.encode([task_id, tasks[start:task_id]])
+    return TASK_PAGE_TYPE.encode([end, tasks[start:end]])
+
+def read_leaderboard_summary(boxes: Dict[bytes, bytes], args: List[bytes]) -> bytes:
+    """get_leaderboard_summary: totals from the counter, tracker and state boxes."""
+    state = boxes.get(b"challenge_states" + args[0])
+    tracker = boxes.get(b"elimination_trackers" + args[0])
+    assert state is not None and tracker is not None, "Box not found"
+
+    total_staked, current_week, is_active = CHALLENGE_STATE_TYPE.decode(state)
+    active_count, min_tasks = ELIMINATION_TRACKER_TYPE.decode(tracker)
+    return LEADERBOARD_SUMMARY_TYPE.encode([
+        _uint64(boxes.get(b"participant_counts" + args[0], bytes(8))),
+        active_count,
+        min_tasks,
+        total_staked,
+        current_week,
+        is_active,
+        _array_length(boxes.get(b"weekly_rankings" + args[0])),
+        _array_length(boxes.get(b"tasks" + args[0])),
+        _uint64(boxes.get(b"message_counters" + args[0], bytes(8))),
+    ])
+
+# Read-only getters combining several boxes -> reader(boxes, encoded args)
+COMPOSED_GETTERS: Dict[str, Callable[[Dict[bytes, bytes], List[bytes]], bytes]] = {
+    "get_challenge_info": read_challenge_info,
+    "get_participants_range": read_participants_range,
+    "get_leaderboard_summary": read_leaderboard_summary,
+    "get_weekly_rankings_range": read_weekly_rankings_range,
+    "get_chat_messages": read_chat_messages,
+    "get_chat_messages_range": read_chat_messages_range,
+    "get_health_roots_range": read_health_roots_range,
+    "get_tasks_range": read_tasks_range,
+}
+
+class BoxReadApp:
+    """Serves the box-backed read-only getters straight from box contents.
+
+    Used when algorand-python-testing is not installed; state-changing
+    calls are rejected because the contract cannot be executed.
+    """
+
+    def __init__(self, creator: str, boxes: Dict[bytes, bytes]):
+        self.creator = creator
+        self.boxes = boxes
+
+    def execute(
+        self,
+        sender: str,
+        method: Method,
+        args: List[bytes],
+        payments: List[transaction.PaymentTxn],
+        app_address: str,
+        timestamp: int,
+        round_num: int
+    ) -> Optional[bytes]:
+        if method.name in COMPOSED_GETTERS:
+            return COMPOSED_GETTERS[method.name](self.boxes, args)
+        if method.name not in BOX_GETTERS:
+            raise AssertionError(
+                f"{method.name} needs algorand-python-testing to execute the contract"
+            )
+
+        prefix, default = BOX_GETTERS[method.name]
+        # BoxMap keys are the ARC-4 encoded args, e.g. (uint64, address) structs
+        value = self.boxes.get(prefix + b"".join(args), default)
+        assert value is not None, "Box not found"
+        return value
+
+    def read_box(self, name: bytes) -> Optional[bytes]:
+        return self.boxes.get(name)
+
+    def write_box(self, name: bytes, value: Optional[bytes]) -> None:
+        if value is None:
+            self.boxes.pop(name, None)
+        else:
+            self.boxes[name] = value
+
+class AlgopyApp:
+    """Executes ChallengePlatform methods with the algopy testing framework."""
+
+    def __init__(self, creator: str, boxes: Dict[bytes, bytes]):
+        from algopy_testing import algopy_testing_context
+        from .challenge_contract import ChallengePlatform
+
+        # The testing context lives in a context variable; keep our own copy
+        # so calls from any thread or task see the same contract state
+        self._scope = contextvars.copy_context()
+        self._context_manager = algopy_testing_context(default_sender=creator)
+        self.context = self._scope.run(self._context_manager.__enter__)
+        self.contract = self._scope.run(ChallengePlatform)
+        self.app = self._scope.run(self.context.ledger.get_app, self.contract)
+
+        for name, value in boxes.items():
+            self.write_box(name, value)
+
+    def execute(
+        self,
+        sender: str,
+        method: Method,
+        args: List[bytes],
+        payments: List[transaction.PaymentTxn],
+        app_address: str,
+        timestamp: int,
+        round_num: int
+    ) -> Optional[bytes]:
+        return self._scope.run(
+            self._execute, sender, method, args, payments, app_address, timestamp, round_num
+        )
+
+    def read_box(self, name: bytes) -> Optional[bytes]:
+        return self._scope.run(self._read_box, name)
+
+    def write_box(self, name: bytes, value: Optional[bytes]) -> None:
+        self._scope.run(self._write_box, name, value)
+
+    def _execute(self, sender, method, args, payments, app_address, timestamp, round_num):
+        from algopy import Account, UInt64, gtxn
+
+        self.context.ledger.patch_global_fields(latest_timestamp=timestamp, round=round_num)
+
+        func = getattr(self.contract, method.name)
+        raw_args = iter(args)
+        pay_args = iter(payments)
+        values = []
+        for param in inspect.signature(func).parameters.values():
+            if param.annotation is gtxn.PaymentTransaction:
+                pay = next(pay_args)
+                # Payments to the ledger's app address go to the test app account
+                receiver = self.app.address if pay.receiver == app_address else Account(pay.receiver)
+                values.append(self.context.any.txn.payment(
+                    sender=Account(pay.sender), receiver=receiver, amount=UInt64(pay.amt)
+                ))
+            else:
+                values.append(param.annotation.from_bytes(next(raw_args)))
+
+        with self.context.txn.create_group(active_txn_overrides={"sender": Account(sender)}):
+            result = func(*values)
+
+        return None if result is None else bytes(result.bytes.value)
+
+    def _read_box(self, name: bytes) -> Optional[bytes]:
+        if not self.context.ledger.box_exists(self.app, name):
+            return None
+        return bytes(self.context.ledger.get_box(self.app, name))
+
+    def _write_box(self, name: bytes, value: Optional[bytes]) -> None:
+        if value is None:
+            if self.context.ledger.box_exists(self.app, name):
+                self.context.ledger.delete_box(self.app, name)
+        else:
+            self.context.ledger.set_box(self.app, name, value)
+
+def default_app_factory(creator: str, boxes: Dict[bytes, bytes]) -> Any:
+    """Run the real contract when the algopy testing framework is available."""
+    try:
+        import algopy_testing  # noqa: F401
+    except ImportError:
+        return BoxReadApp(creator, boxes)
+    return AlgopyApp(creator, boxes)
+
+class LocalApp:
+    def __init__(self, app_id: int, creator: str, executor: Any, boxes: Dict[bytes, bytes]):
+        self.app_id = app_id
+        self.creator = creator
+        self.address = logic.get_application_address(app_id)
+        self.executor = executor
+        # Mirror of the app's boxes, refreshed from every referenced box
+        self.boxes = boxes
+
+class LocalLedger:
+    """In-memory ledger answering the AlgodClient calls used by the platform.
+
+    Submitted groups are validated (validity window, genesis, group id,
+    duplicate txids, leases, balances), executed atomically and confirmed
+    in the next block. Signatures are not checked. Box references must be
+    declared as on a real node; only referenced boxes are mirrored and
+    rolled back when a group fails.
+    """
+
+    def __init__(
+        self,
+        block_time: float = DEFAULT_BLOCK_TIME,
+        genesis_id: str = GENESIS_ID,
+        start_timestamp: Optional[int] = None,
+        app_factory: Callable[[str, Dict[bytes, bytes]], Any] = default_app_factory
+    ):
+        if block_time <= 0:
+            raise ValueError("block_time must be positive")
+
+        self.block_time = block_time
+        self.genesis_id = genesis_id
+        self.genesis_hash = base64.b64encode(hashlib.sha256(genesis_id.encode()).digest()).decode()
+        self.app_factory = app_factory
+
+        self.round = 1
+        self.timestamp = int(start_timestamp if start_timestamp is not None else time.time())
+        self._next_block_at = time.monotonic() + block_time
+        self._last_block_at = time.monotonic()
+
+        self.balances: Dict[str, int] = {}
+        self.apps: Dict[int, LocalApp] = {}
+        self._next_app_id = FIRST_APP_ID
+
+        # Confirmed in the next block: (txid, block entry)
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._txn_info: Dict[str, Dict[str, Any]] = {}
+        # round -> block entries; rounds without transactions are absent
+        self._blocks: Dict[int, List[Dict[str, Any]]] = {}
+        # (sender, lease) -> last valid round
+        self._leases: Dict[Tuple[str, bytes], int] = {}
+        self._lock = threading.RLock()
+
+    # ===== TEST SETUP =====
+
+    def fund(self, address: str, amount: int) -> None:
+        """Credit an account with microAlgos."""
+        with self._lock:
+            self.balances[address] = self.balances.get(address, 0) + amount
+
+    def create_app(self, creator: str) -> int:
+        """Create a ChallengePlatform app without a creation transaction."""
+        with self._lock:
+            return self._create_app(creator)
+
+    def put_box(self, app_id: int, name: bytes, value: bytes) -> None:
+        """Create or overwrite an application box."""
+        with self._lock:
+            app = self._get_app(app_id)
+            app.executor.write_box(name, value)
+            app.boxes[name] = value
+
+    def advance_time(self, seconds: int) -> None:
+        """Move the latest block timestamp forward, e.g. to reach the next week."""
+        with self._lock:
+            self.timestamp += seconds
+
+    # ===== ALGOD CLIENT INTERFACE =====
+
+    def status(self, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._produce_blocks()
+            return {
+                "last-round": self.round,
+                "last-version": "local",
+                "time-since-last-round": int((time.monotonic() - self._last_block_at) * 1e9),
+                "catchup-time": 0,
+            }
+
+    def status_after_block(self, block_num: int, **kwargs: Any) -> Dict[str, Any]:
+        deadline = time.monotonic() + STATUS_AFTER_BLOCK_TIMEOUT
+        while True:
+            status = self.status()
+            if status["last-round"] > block_num or time.monotonic() >= deadline:
+                return status
+            time.sleep(min(self.block_time, max(0.0, self._next_block_at - time.monotonic())))
+
+    def suggested_params(self, **kwargs: Any) -> transaction.SuggestedParams:
+        with self._lock:
+            self._produce_blocks()
+            return transaction.SuggestedParams(
+                fee=0,
+                first=self.round,
+                last=self.round + MAX_TXN_LIFE,
+                gh=self.genesis_hash,
+                gen=self.genesis_id,
+                flat_fee=False,
+                consensus_version="local",
+                min_fee=MIN_FEE
+            )
+
+    def send_transaction(self, txn: Any, **kwargs: Any) -> str:
+        return self.send_transactions([txn])
+
+    def send_transactions(self, txns: List[Any], **kwargs: Any) -> str:
+        """Validate and execute a signed group; it confirms in the next block."""
+        signed = list(txns)
+        with self._lock:
+            self._produce_blocks()
+            results = self._apply_group(signed, self.round + 1)
+
+            for stxn, result in zip(signed, results):
+                txn = stxn.transaction
+                if txn.lease:
+                    self._leases[(txn.sender, txn.lease)] = txn.last_valid_round
+                self._txn_info[result["txid"]] = result["info"]
+                self._pending.append((result["txid"], result["entry"]))
+
+            return signed[0].transaction.get_txid()
+
+    def pending_transaction_info(self, transaction_id: str, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._produce_blocks()
+            info = self._txn_info.get(transaction_id)
+            if info is None:
+                raise AlgodHTTPError("txn does not exist", 404)
+            return info
+
+    def get_block_txids(self, block_num: int, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._produce_blocks()
+            self._check_round(block_num)
+            return {"blockTxids": [entry["txid"] for entry in self._blocks.get(block_num, [])]}
+
+    def block_info(self, block_num: int, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            self._produce_blocks()
+            self._check_round(block_num)
+            return {"block": {
+                "rnd": block_num,
+                "txns": [
+                    {key: value for key, value in entry.items() if key != "txid"}
+                    for entry in self._blocks.get(block_num, [])
+                ]
+            }}
+
+    def account_info(self, address: str, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            return {"address": address, "amount": self.balances.get(address, 0), "round": self.round}
+
+    def application_info(self, application_id: int, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            app = self._get_app(application_id)
+            return {"id": app.app_id, "params": {"creator": app.creator, "global-state": []}}
+
+    def application_boxes(self, application_id: int, limit: int = 0, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            names = list(self._get_app(application_id).boxes)
+            if limit:
+                names = names[:limit]
+            return {"boxes": [{"name": base64.b64encode(name).decode()} for name in names]}
+
+    def application_box_by_name(self, application_id: int, box_name: bytes, **kwargs: Any) -> Dict[str, Any]:
+        with self._lock:
+            value = self._get_app(application_id).boxes.get(box_name)
+            if value is None:
+                raise AlgodHTTPError("box not found", 404)
+            return {
+                "name": base64.b64encode(box_name).decode(),
+                "round": self.round,
+                "value": base64.b64encode(value).decode()
+            }
+
+    def simulate_transactions(self, request: SimulateRequest, **kwargs: Any) -> Dict[str, Any]:
+        """Evaluate groups against current state and discard their effects."""
+        with self._lock:
+            self._produce_blocks()
+            txn_groups = []
+            for group in request.txn_groups:
+                balances = dict(self.balances)
+                app_ids = set(self.apps)
+                next_app_id = self._next_app_id
+                snapshot = self._snapshot_boxes(group.txns)
+                try:
+                    results = self._apply_group(group.txns, self.round + 1, simulate=True)
+                    txn_groups.append({"txn-results": [
+                        {"txn-result": result["info"]} for result in results
+                    ]})
+                except AlgodHTTPError as e:
+                    txn_groups.append({
+                        "txn-results": [],
+                        "failure-message": str(e),
+                        "failed-at": getattr(e, "failed_at", [0])
+                    })
+                finally:
+                    self.balances = balances
+                    for app_id in set(self.apps) - app_ids:
+                        del self.apps[app_id]
+                    self._next_app_id = next_app_id
+                    self._restore_boxes(snapshot)
+
+            return {"last-round": self.round, "txn-groups": txn_groups, "version": 2}
+
+    # ===== INTERNALS =====
+
+    def _produce_blocks(self) -> None:
+        now = time.monotonic()
+        if now < self._next_block_at:
+            return
+
+        # Every elapsed block interval is a round; pending txns land in the first
+        elapsed = int((now - self._next_block_at) // self.block_time) + 1
+        first_round = self.round + 1
+        for txid, entry in self._pending:
+            self._txn_info[txid]["confirmed-round"] = first_round
+        if self._pending:
+            self._blocks[first_round] = [entry for _, entry in self._pending]
+        self._pending = []
+
+        self.round += elapsed
+        self.timestamp += int(elapsed * self.block_time)
+        self._next_block_at += elapsed * self.block_time
+        self._last_block_at = now
+
+        # Leases expire once their transaction's validity window has passed
+        self._leases = {key: last for key, last in self._leases.items() if last >= self.round}
+
+    def _check_round(self, block_num: int) -> None:
+        if block_num > self.round:
+            raise AlgodHTTPError(f"ledger does not have entry {block_num}", 404)
+
+    def _get_app(self, app_id: int) -> LocalApp:
+        app = self.apps.get(app_id)
+        if app is None:
+            raise AlgodHTTPError("application does not exist", 404)
+        return app
+
+    def _create_app(self, creator: str) -> int:
+        app_id = self._next_app_id
+        self._next_app_id += 1
+        boxes: Dict[bytes, bytes] = {}
+        self.apps[app_id] = LocalApp(app_id, creator, self.app_factory(creator, boxes), boxes)
+        return app_id
+
+    def _box_refs(self, txn: Any) -> List[Tuple[LocalApp, bytes]]:
+        if not isinstance(txn, transaction.ApplicationCallTxn):
+            return []
+
+        refs = []
+        for ref in txn.boxes or []:
+            app_id = txn.index if ref.app_index == 0 else txn.foreign_apps[ref.app_index - 1]
+            if app_id in self.apps:
+                refs.append((self.apps[app_id], ref.name))
+        return refs
+
+    def _snapshot_boxes(self, signed: List[Any]) -> List[Tuple[LocalApp, bytes, Optional[bytes]]]:
+        return [
+            (app, name, app.executor.read_box(name))
+            for stxn in signed
+            for app, name in self._box_refs(stxn.transaction)
+        ]
+
+    def _restore_boxes(self, snapshot: List[Tuple[LocalApp, bytes, Optional[bytes]]]) -> None:
+        for app, name, value in reversed(snapshot):
+            app.executor.write_box(name, value)
+            if value is None:
+                app.boxes.pop(name, None)
+            else:
+                app.boxes[name] = value
+
+    def _validate_group(self, signed: List[Any], round_num: int, simulate: bool) -> None:
+        txns = [stxn.transaction for stxn in signed]
+        if not txns or len(txns) > 16:
+            raise AlgodHTTPError("group size must be between 1 and 16", 400)
+
+        if len(txns) > 1:
+            ungrouped = [copy.copy(txn) for txn in txns]
+            for txn in ungrouped:
+                txn.group = None
+            group_id = transaction.calculate_group_id(ungrouped)
+            if any(txn.group != group_id for txn in txns):
+                raise AlgodHTTPError("transaction group has an incomplete or wrong group id", 400)
+
+        for index, txn in enumerate(txns):
+            txid = txn.get_txid()
+            error = None
+            if not txn.first_valid_round <= round_num <= txn.last_valid_round:
+                error = AlgodHTTPError(
+                    f"txn dead: round {round_num} outside of "
+                    f"{txn.first_valid_round}--{txn.last_valid_round}", 400
+                )
+            elif txn.genesis_hash and txn.genesis_hash != self.genesis_hash:
+                error = AlgodHTTPError("txn genesis hash does not match the ledger", 400)
+            elif not simulate and txid in self._txn_info:
+                error = AlgodHTTPError(f"transaction already in ledger: {txid}", 400)
+            elif txn.lease and self._leases.get((txn.sender, txn.lease), 0) >= round_num:
+                error = AlgodHTTPError(f"transaction {txid} using an overlapping lease", 400)
+            if error is not None:
+                error.failed_at = [index]
+                raise error
+
+        if sum(txn.fee for txn in txns) < MIN_FEE * len(txns):
+            raise AlgodHTTPError("group fees are below the minimum fee", 400)
+
+    def _apply_group(self, signed: List[Any], round_num: int, simulate: bool = False) -> List[Dict[str, Any]]:
+        self._validate_group(signed, round_num, simulate)
+
+        # Groups are atomic: restore balances, app ids and boxes if any call fails
+        balances = dict(self.balances)
+        next_app_id = self._next_app_id
+        created_apps: List[int] = []
+        snapshot = self._snapshot_boxes(signed)
+
+        try:
+            results = []
+            for index, stxn in enumerate(signed):
+                txn = stxn.transaction
+                self._debit(txn.sender, txn.fee)
+                info: Dict[str, Any] = {"pool-error": "", "txn": {"txn": {"type": txn.type}}}
+                entry = {"type": txn.type, "snd": txn.sender}
+
+                if isinstance(txn, transaction.PaymentTxn):
+                    self._debit(txn.sender, txn.amt)
+                    self.balances[txn.receiver] = self.balances.get(txn.receiver, 0) + txn.amt
+                    entry.update({"rcv": txn.receiver, "amt": txn.amt})
+                elif isinstance(txn, transaction.ApplicationCallTxn):
+                    if txn.index == 0:
+                        app_id = self._create_app(txn.sender)
+                        created_apps.append(app_id)
+                        info["application-index"] = app_id
+                    else:
+                        logs = self._call_app(txn, signed[:index], round_num)
+                        info["logs"] = [base64.b64encode(log).decode() for log in logs]
+                    entry.update(self._app_call_entry(txn))
+
+                block_entry = {"txid": txn.get_txid(), "txn": entry}
+                if info.get("logs"):
+                    # Apply data carries the logs, as in algod's JSON blocks
+                    block_entry["dt"] = {"lg": info["logs"]}
+                results.append({"txid": txn.get_txid(), "info": info, "entry": block_entry})
+        except (AssertionError, AlgodHTTPError) as e:
+            self.balances = balances
+            self._next_app_id = next_app_id
+            for app_id in created_apps:
+                self.apps.pop(app_id, None)
+            self._restore_boxes(snapshot)
+            error = e if isinstance(e, AlgodHTTPError) else AlgodHTTPError(f"logic eval error: {e}", 400)
+            # Position of the rejected transaction, reported by simulate as algod does
+            error.failed_at = [index]
+            raise error
+
+        # Refresh the box mirror from everything the group referenced
+        for app, name, _ in snapshot:
+            value = app.executor.read_box(name)
+            if value is None:
+                app.boxes.pop(name, None)
+            else:
+                app.boxes[name] = value
+
+        return results
+
+    def _call_app(self, txn: transaction.ApplicationCallTxn, preceding: List[Any], round_num: int) -> List[bytes]:
+        app = self._get_app(txn.index)
+        if txn.on_complete != transaction.OnComplete.NoOpOC or not txn.app_args:
+            raise AlgodHTTPError("only NoOp ABI method calls are supported", 400)
+
+        method = CHALLENGE_PLATFORM_SELECTORS.get(bytes(txn.app_args[0]))
+        if method is None:
+            raise AlgodHTTPError("logic eval error: unknown method selector", 400)
+
+        # Transaction arguments are the transactions right before the call
+        txn_arg_count = sum(1 for arg in method.args if arg.type == "pay")
+        payments = [stxn.transaction for stxn in preceding[len(preceding) - txn_arg_count:]]
+        if len(payments) != txn_arg_count or any(
+            not isinstance(pay, transaction.PaymentTxn) for pay in payments
+        ):
+            raise AlgodHTTPError("logic eval error: missing payment argument", 400)
+
+        value = app.executor.execute(
+            txn.sender,
+            method,
+            [bytes(arg) for arg in txn.app_args[1:]],
+            payments,
+            app.address,
+            self.timestamp,
+            round_num
+        )
+        logs = [] if value is None else [RETURN_PREFIX + value]
+        if sum(len(log) for log in logs) > MAX_LOG_SIZE:
+            raise AlgodHTTPError(f"logic eval error: logs exceed {MAX_LOG_SIZE} bytes", 400)
+        return logs
+
+    def _app_call_entry(self, txn: transaction.ApplicationCallTxn) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"apid": txn.index}
+        if txn.foreign_apps:
+            entry["apfa"] = list(txn.foreign_apps)
+        if txn.boxes:
+            entry["apbx"] = [
+                {"i": ref.app_index, "n": base64.b64encode(ref.name).decode()} for ref in txn.boxes
+            ]
+        return entry
+
+    def _debit(self, address: str, amount: int) -> None:
+        balance = self.balances.get(address, 0)
+        if balance < amount:
+            raise AlgodHTTPError(
+                f"overspend (account {address}, data {balance}, tried to spend {amount})", 400
+            )
+        self.balances[address] = balance - amount
+
+# selector -> method of the ChallengePlatform ABI
+CHALLENGE_PLATFORM_SELECTORS = {
+    method.get_selector(): method
+    for method in (Method.from_signature(signature) for signature in CHALLENGE_PLATFORM_METHODS)
+}
+
+# Shared ledger used by the contract scripts when ALGORAND_API_URL=local
+_shared_ledger: Optional[LocalLedger] = None
+
+def get_local_ledger() -> LocalLedger:
+    """Get the shared local ledger, creating it on first use."""
+    global _shared_ledger
+
+    if _shared_ledger is None:
+        _shared_ledger = LocalLedger()
+
+    return _shared_ledger
@@ -12,6 +12,10 @@ CHALLENGE_NOT_FOUND = "Challenge not found"
 ALREADY_PARTICIPATING = "Already participating in this challenge"
 NOT_PARTICIPATING = "Not participating in this challenge"
 INSUFFICIENT_PARTICIPANTS = "Insufficient participants for elimination"
+NOT_LOWEST_PERFORMER = "Another participant has fewer completed tasks"
+PAYOUT_OUT_OF_ORDER = "Winners are not in final ranking order"
+TOO_MANY_WINNERS = "Too many winners for this payout call"
+TOO_MANY_ELIMINATIONS = "Too many eliminations for this call"
 
 # Transaction-related errors
 DIFFERENT_SENDER = "Transaction sender does not match expected sender"
@@ -26,3 +30,4 @@ NOT_TIME_FOR_ELIMINATION = "Not time for weekly elimination"
 
 # General errors
 INVALID_ARGUMENTS = "Invalid arguments provided"
+ENTRY_TOO_LARGE = "Entry too large to be read back in one call"
@@ -4,28 +4,71 @@ Test script for Challenge Platform Smart Contract
 Tests all major functionality
 """
 
+import base64
+import hashlib
 import json
+import os
 import sys
+import time
 from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from algosdk import account, mnemonic
+from algosdk import account, logic, transaction
 from algosdk.v2client import algod
-from algosdk.transaction import ApplicationCallTxn, PaymentTxn
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer, TransactionWithSigner
-from algosdk.abi import Method
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+)
+from contracts.local_ledger import CHALLENGE_PLATFORM_SELECTORS, get_local_ledger
+
+# Set ALGORAND_API_URL=local to run against the in-process ledger
+ALGOD_ADDRESS = os.getenv("ALGORAND_API_URL", "https://testnet-api.algonode.cloud")
+
+METHODS = {method.name: method for method in CHALLENGE_PLATFORM_SELECTORS.values()}
+
+# A fresh challenge per run, so the tests can be rerun against one deployment
+CHALLENGE_ID = int(time.time())
+STAKE_AMOUNT = 1000000  # 1 ALGO
+# Covers a participant's stake and the fees of their calls
+PARTICIPANT_FUNDING = 2 * STAKE_AMOUNT
 
 def get_algod_client():
-    """Get Algorand client for testnet."""
-    algod_address = "https://testnet-api.algonode.cloud"
+    """Get Algorand client for testnet, or the local ledger."""
+    if ALGOD_ADDRESS == "local":
+        return get_local_ledger()
     algod_token = ""
-    return algod.AlgodClient(algod_token, algod_address)
+    return algod.AlgodClient(algod_token, ALGOD_ADDRESS)
+
+# Suggested params are reused for roughly one round instead of per transaction
+PARAMS_TTL = 4
+_cached_params = {"params": None, "fetched_at": 0.0}
+
+def get_suggested_params(client):
+    """Get suggested parameters, fetching from algod at most once per round."""
+    if _cached_params["params"] is None or time.monotonic() - _cached_params["fetched_at"] >= PARAMS_TTL:
+        _cached_params["params"] = client.suggested_params()
+        _cached_params["fetched_at"] = time.monotonic()
+    return _cached_params["params"]
+
+def create_local_deployment():
+    """Create a funded account and a fresh app on the local ledger."""
+    ledger = get_local_ledger()
+    private_key, address = account.generate_account()
+    ledger.fund(address, 100_000_000)
+    
+    return {
+        "account": {"address": address, "private_key": private_key},
+        "deployment": {"app_id": ledger.create_app(address)}
+    }
 
 def load_deployment_info():
     """Load deployment information."""
+    if ALGOD_ADDRESS == "local":
+        return create_local_deployment()
+    
     deployment_file = Path(__file__).parent / "deployment.json"
     if not deployment_file.exists():
         print("❌ Deployment file not found. Please run real_deploy.py first.")
@@ -34,55 +77,106 @@ def load_deployment_info():
     with open(deployment_file, 'r') as f:
         return json.load(f)
 
-def test_create_challenge(deployment_info):
+# ===== ABI CALLS =====
+
+def compose_call(client, app_id, sender, signer, method_name, args, payment=0, boxes=()):
+    """Compose an ABI method call, preceded by its payment argument if it takes one."""
+    method_args = list(args)
+    if payment:
+        method_args.append(TransactionWithSigner(
+            transaction.PaymentTxn(
+                sender, get_suggested_params(client), logic.get_application_address(app_id), payment
+            ),
+            signer
+        ))
+    
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=METHODS[method_name],
+        sender=sender,
+        sp=get_suggested_params(client),
+        signer=signer,
+        method_args=method_args,
+        boxes=[(app_id, name) for name in boxes]
+    )
+    return atc
+
+def simulate_call(client, atc):
+    """Simulate a composed call without signatures; raise with the contract's error if rejected."""
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=atc.gather_signatures())],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True
+    )
+    group = client.simulate_transactions(request)["txn-groups"][0]
+    if "failure-message" in group:
+        raise RuntimeError(group["failure-message"])
+    return group
+
+def unnamed_boxes(group):
+    """Box names a simulation accessed without them being referenced."""
+    reports = [group.get("unnamed-resources-accessed", {})] + [
+        result.get("unnamed-resources-accessed", {}) for result in group["txn-results"]
+    ]
+    names = []
+    for report in reports:
+        for box in report.get("boxes", []):
+            name = base64.b64decode(box["name"])
+            if name not in names:
+                names.append(name)
+    return names
+
+def call_method(client, app_id, caller, method_name, args, payment=0):
+    """Send an ABI method call and wait for it; returns the app call's transaction id."""
+    probe = compose_call(client, app_id, caller["address"], EmptySigner(), method_name, args, payment)
+    boxes = unnamed_boxes(simulate_call(client, probe))
+    
+    signer = AccountTransactionSigner(caller["private_key"])
+    atc = compose_call(client, app_id, caller["address"], signer, method_name, args, payment, boxes)
+    return atc.execute(client, 4).tx_ids[-1]
+
+def read_method(client, app_id, caller, method_name, args):
+    """Call a read-only method through simulate and decode its return value."""
+    atc = compose_call(client, app_id, caller["address"], EmptySigner(), method_name, args)
+    group = simulate_call(client, atc)
+    
+    # The app call returns its value in the last log, after the ARC-4 return prefix
+    log = base64.b64decode(group["txn-results"][-1]["txn-result"]["logs"][-1])
+    return METHODS[method_name].returns.type.decode(log[4:])
+
+def fund_account(client, funder, amount):
+    """Create an account and fund it from another one."""
+    private_key, address = account.generate_account()
+    payment = transaction.PaymentTxn(funder["address"], get_suggested_params(client), address, amount)
+    
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(TransactionWithSigner(payment, AccountTransactionSigner(funder["private_key"])))
+    atc.execute(client, 4)
+    return {"address": address, "private_key": private_key}
+
+# ===== TESTS =====
+
+def test_create_challenge(client, deployment_info):
     """Test creating a challenge."""
     print("🧪 Testing create_challenge...")
     
-    client = get_algod_client()
     account_info = deployment_info["account"]
     app_id = deployment_info["deployment"]["app_id"]
     
     try:
-        # Get suggested parameters
-        params = client.suggested_params()
-        
         # Create challenge data
-        challenge_id = 1
         name = "30-Day Fitness Challenge"
         description = "Complete daily workouts for 30 days"
-        stake_amount = 1000000  # 1 ALGO
         max_participants = 10
         
-        # Create payment transaction for stake
-        payment_txn = PaymentTxn(
-            sender=account_info["address"],
-            sp=params,
-            receiver=account_info["address"],  # Will be changed to contract address
-            amount=stake_amount
+        # The creator stakes with a payment to the app account
+        tx_id = call_method(
+            client, app_id, account_info, "create_challenge",
+            [CHALLENGE_ID, name, description, STAKE_AMOUNT, max_participants],
+            payment=STAKE_AMOUNT
         )
-        
-        # Create application call transaction
-        app_call_txn = ApplicationCallTxn(
-            sender=account_info["address"],
-            sp=params,
-            index=app_id,
-            on_complete=0,  # NoOp
-            app_args=[
-                challenge_id,
-                name,
-                description,
-                stake_amount,
-                max_participants
-            ]
-        )
-        
-        # Sign transactions
-        signed_payment = payment_txn.sign(account_info["private_key"])
-        signed_app_call = app_call_txn.sign(account_info["private_key"])
-        
-        # Submit transactions
-        tx_id = client.send_transactions([signed_payment, signed_app_call])
-        print(f"✅ Challenge creation transaction submitted: {tx_id}")
+        print(f"✅ Challenge creation transaction confirmed: {tx_id}")
         
         return True
         
@@ -90,43 +184,18 @@ def test_create_challenge(deployment_info):
         print(f"❌ Challenge creation failed: {str(e)}")
         return False
 
-def test_join_challenge(deployment_info):
+def test_join_challenge(client, deployment_info):
     """Test joining a challenge."""
     print("🧪 Testing join_challenge...")
     
-    client = get_algod_client()
-    account_info = deployment_info["account"]
     app_id = deployment_info["deployment"]["app_id"]
     
     try:
-        # Get suggested parameters
-        params = client.suggested_params()
-        
-        # Create payment transaction for stake
-        stake_amount = 1000000  # 1 ALGO
-        payment_txn = PaymentTxn(
-            sender=account_info["address"],
-            sp=params,
-            receiver=account_info["address"],  # Will be changed to contract address
-            amount=stake_amount
-        )
-        
-        # Create application call transaction
-        app_call_txn = ApplicationCallTxn(
-            sender=account_info["address"],
-            sp=params,
-            index=app_id,
-            on_complete=0,  # NoOp
-            app_args=[1]  # challenge_id
-        )
+        # The creator is already a participant, so a new account joins
+        participant = fund_account(client, deployment_info["account"], PARTICIPANT_FUNDING)
         
-        # Sign transactions
-        signed_payment = payment_txn.sign(account_info["private_key"])
-        signed_app_call = app_call_txn.sign(account_info["private_key"])
-        
-        # Submit transactions
-        tx_id = client.send_transactions([signed_payment, signed_app_call])
-        print(f"✅ Join challenge transaction submitted: {tx_id}")
+        tx_id = call_method(client, app_id, participant, "join_challenge", [CHALLENGE_ID], payment=STAKE_AMOUNT)
+        print(f"✅ Join challenge transaction confirmed: {tx_id}")
         
         return True
         
@@ -134,33 +203,21 @@ def test_join_challenge(deployment_info):
         print(f"❌ Join challenge failed: {str(e)}")
         return False
 
-def test_get_challenge_info(deployment_info):
+def test_get_challenge_info(client, deployment_info):
     """Test getting challenge information."""
     print("🧪 Testing get_challenge_info...")
     
-    client = get_algod_client()
     account_info = deployment_info["account"]
     app_id = deployment_info["deployment"]["app_id"]
     
     try:
-        # Get suggested parameters
-        params = client.suggested_params()
+        # Read-only, so it is simulated rather than sent
+        challenge = read_method(client, app_id, account_info, "get_challenge_info", [CHALLENGE_ID])
         
-        # Create application call transaction (readonly)
-        app_call_txn = ApplicationCallTxn(
-            sender=account_info["address"],
-            sp=params,
-            index=app_id,
-            on_complete=0,  # NoOp
-            app_args=[1]  # challenge_id
-        )
-        
-        # Sign transaction
-        signed_app_call = app_call_txn.sign(account_info["private_key"])
-        
-        # Submit transaction
-        tx_id = client.send_transaction(signed_app_call)
-        print(f"✅ Get challenge info transaction submitted: {tx_id}")
+        # (challenge_id, name, description, stake_amount, max_participants, creator, ...)
+        assert challenge[0] == CHALLENGE_ID, f"unexpected challenge id {challenge[0]}"
+        assert challenge[5] == account_info["address"], f"unexpected creator {challenge[5]}"
+        print(f"✅ Challenge info: {challenge[1]} ({challenge[4]} participants max)")
         
         return True
         
@@ -168,36 +225,19 @@ def test_get_challenge_info(deployment_info):
         print(f"❌ Get challenge info failed: {str(e)}")
         return False
 
-def test_send_chat_message(deployment_info):
+def test_send_chat_message(client, deployment_info):
     """Test sending a chat message."""
     print("🧪 Testing send_chat_message...")
     
-    client = get_algod_client()
     account_info = deployment_info["account"]
     app_id = deployment_info["deployment"]["app_id"]
     
     try:
-        # Get suggested parameters
-        params = client.suggested_params()
-        
-        # Create application call transaction
-        app_call_txn = ApplicationCallTxn(
-            sender=account_info["address"],
-            sp=params,
-            index=app_id,
-            on_complete=0,  # NoOp
-            app_args=[
-                1,  # challenge_id
-                "Hello everyone! Let's get fit together!"  # message content
-            ]
+        tx_id = call_method(
+            client, app_id, account_info, "send_chat_message",
+            [CHALLENGE_ID, "Hello everyone! Let's get fit together!"]
         )
-        
-        # Sign transaction
-        signed_app_call = app_call_txn.sign(account_info["private_key"])
-        
-        # Submit transaction
-        tx_id = client.send_transaction(signed_app_call)
-        print(f"✅ Send chat message transaction submitted: {tx_id}")
+        print(f"✅ Send chat message transaction confirmed: {tx_id}")
         
         return True
         
@@ -205,44 +245,35 @@ def test_send_chat_message(deployment_info):
         print(f"❌ Send chat message failed: {str(e)}")
         return False
 
-def test_submit_health_data(deployment_info):
-    """Test submitting health data."""
-    print("🧪 Testing submit_health_data...")
+def test_commit_health_root(client, deployment_info):
+    """Test committing a day's health data root."""
+    print("🧪 Testing commit_health_root...")
     
-    client = get_algod_client()
     account_info = deployment_info["account"]
     app_id = deployment_info["deployment"]["app_id"]
     
     try:
-        # Get suggested parameters
-        params = client.suggested_params()
+        # One sample, so the root is its leaf hash (backend/python-api/services/merkle_service.py)
+        sample = {"data_type": "steps", "value": 10000, "source": "google_fit"}
+        root = hashlib.sha256(b"\x00" + json.dumps(sample, sort_keys=True, separators=(",", ":")).encode()).digest()
+        day = int(time.time()) // 86400
         
-        # Create application call transaction
-        app_call_txn = ApplicationCallTxn(
-            sender=account_info["address"],
-            sp=params,
-            index=app_id,
-            on_complete=0,  # NoOp
-            app_args=[
-                1,  # challenge_id
-                "steps",  # data_type
-                10000,  # value
-                "google_fit",  # source
-                "hash_12345"  # verification_hash
-            ]
+        # Only the platform (the app creator) commits roots
+        tx_id = call_method(
+            client, app_id, account_info, "commit_health_root",
+            [CHALLENGE_ID, account_info["address"], day, root, 1]
         )
         
-        # Sign transaction
-        signed_app_call = app_call_txn.sign(account_info["private_key"])
-        
-        # Submit transaction
-        tx_id = client.send_transaction(signed_app_call)
-        print(f"✅ Submit health data transaction submitted: {tx_id}")
+        committed_root, sample_count, _ = read_method(
+            client, app_id, account_info, "get_health_root", [CHALLENGE_ID, account_info["address"], day]
+        )
+        assert bytes(committed_root) == root and sample_count == 1, "committed root does not match"
+        print(f"✅ Commit health root transaction confirmed: {tx_id}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Submit health data failed: {str(e)}")
+        print(f"❌ Commit health root failed: {str(e)}")
         return False
 
 def main():
@@ -258,20 +289,22 @@ def main():
     print(f"📋 Testing contract with App ID: {deployment_info['deployment']['app_id']}")
     print(f"👤 Using account: {deployment_info['account']['address']}")
     
+    client = get_algod_client()
+    
     # Run tests
     tests = [
         ("Create Challenge", test_create_challenge),
         ("Join Challenge", test_join_challenge),
         ("Get Challenge Info", test_get_challenge_info),
         ("Send Chat Message", test_send_chat_message),
-        ("Submit Health Data", test_submit_health_data)
+        ("Commit Health Root", test_commit_health_root)
     ]
     
     results = []
     for test_name, test_func in tests:
         print(f"\n{'='*20} {test_name} {'='*20}")
         try:
-            success = test_func(deployment_info)
+            success = test_func(client, deployment_info)
             results.append((test_name, success))
         except Exception as e:
             print(f"❌ {test_name} failed with exception: {str(e)}")
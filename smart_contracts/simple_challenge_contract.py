@@ -3,33 +3,49 @@
 Simple Challenge Platform Smart Contract in TEAL
 """
 
+import os
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from smart_contracts.teal_cost import cost_table
+from smart_contracts.teal_optimizer import optimize, optimization_report, print_optimization_report
+
+# ARC-4 signature of each NoOp method (as in deploy_real_contract.py) -> handler label
+METHODS = [
+    ("create_challenge(string,string,uint64,uint64,uint64)uint64", "create_challenge_method"),
+    ("join_challenge(uint64,uint64)void", "join_challenge_method"),
+    ("leave_challenge(uint64)void", "leave_challenge_method"),
+    ("complete_task(uint64,uint64)void", "complete_task_method"),
+    ("process_elimination(uint64)void", "process_elimination_method"),
+    ("distribute_pool(uint64)void", "distribute_pool_method"),
+]
+
+def create_method_dispatch():
+    """Route NoOp calls with one match on the ARC-4 method selector."""
+    selectors = "\n".join(f'    method "{signature}"' for signature, _ in METHODS)
+    labels = " ".join(label for _, label in METHODS)
+    return f"""{selectors}
+    txn ApplicationArgs 0
+    match {labels}"""
+
 def create_approval_program():
     """Create approval program TEAL code."""
-    teal = """
-#pragma version 6
+    teal = f"""
+#pragma version 8
 
-// Global state keys
-byte "challenge_count"
-byte "platform_fee"
-byte "interest_rate"
+// Global state keys: "challenge_count", "platform_fee", "interest_rate"
 
-// Application arguments
+// Application arguments (ARC-4: the selector, then one per method argument)
 // 0: method selector
-// 1: challenge_id (for join/leave)
-// 2: stake_amount (for join)
-// 3: name (for create)
-// 4: description (for create)
-// 5: max_participants (for create)
-// 6: start_time (for create)
-// 7: end_time (for create)
-
-// Method selectors
-byte "create_challenge"
-byte "join_challenge"
-byte "leave_challenge"
-byte "complete_task"
-byte "process_elimination"
-byte "distribute_pool"
+// create: 1 name, 2 description (strings with a 2-byte length prefix),
+//         3 max_participants, 4 start_time, 5 end_time
+// join: 1 challenge_id, 2 stake_amount
+// leave: 1 challenge_id
+// Integers are 8-byte big-endian uint64s
 
 // Main approval program
 txn ApplicationID
@@ -76,36 +92,8 @@ creation:
 
 // Handle NoOp calls
 handle_noop:
-    // Get method selector
-    txn ApplicationArgs 0
-    byte "create_challenge"
-    ==
-    bnz create_challenge_method
-    
-    txn ApplicationArgs 0
-    byte "join_challenge"
-    ==
-    bnz join_challenge_method
-    
-    txn ApplicationArgs 0
-    byte "leave_challenge"
-    ==
-    bnz leave_challenge_method
-    
-    txn ApplicationArgs 0
-    byte "complete_task"
-    ==
-    bnz complete_task_method
-    
-    txn ApplicationArgs 0
-    byte "process_elimination"
-    ==
-    bnz process_elimination_method
-    
-    txn ApplicationArgs 0
-    byte "distribute_pool"
-    ==
-    bnz distribute_pool_method
+    // Every method pays the same dispatch cost, whatever its position
+{create_method_dispatch()}
     
     // Unknown method
     err
@@ -114,7 +102,7 @@ handle_noop:
 create_challenge_method:
     // Validate arguments
     txn NumAppArgs
-    int 8
+    int 6
     >=
     bz invalid_args
     
@@ -132,7 +120,8 @@ create_challenge_method:
     concat
     byte "_name"
     concat
-    txn ApplicationArgs 3
+    txn ApplicationArgs 1
+    extract 2 0  // drop the length prefix
     app_global_put
     
     byte "challenge_"
@@ -141,7 +130,8 @@ create_challenge_method:
     concat
     byte "_description"
     concat
-    txn ApplicationArgs 4
+    txn ApplicationArgs 2
+    extract 2 0
     app_global_put
     
     byte "challenge_"
@@ -150,7 +140,7 @@ create_challenge_method:
     concat
     byte "_max_participants"
     concat
-    txn ApplicationArgs 5
+    txn ApplicationArgs 3
     btoi
     app_global_put
     
@@ -160,7 +150,7 @@ create_challenge_method:
     concat
     byte "_start_time"
     concat
-    txn ApplicationArgs 6
+    txn ApplicationArgs 4
     btoi
     app_global_put
     
@@ -170,7 +160,7 @@ create_challenge_method:
     concat
     byte "_end_time"
     concat
-    txn ApplicationArgs 7
+    txn ApplicationArgs 5
     btoi
     app_global_put
     
@@ -206,6 +196,13 @@ create_challenge_method:
     load 0
     app_global_put
     
+    // Return the challenge_id as an ARC-4 return value log
+    byte 0x151f7c75
+    load 0
+    itob
+    concat
+    log
+    
     int 1
     return
 
@@ -213,7 +210,7 @@ create_challenge_method:
 join_challenge_method:
     // Validate arguments
     txn NumAppArgs
-    int 2
+    int 3
     >=
     bz invalid_args
     
@@ -256,18 +253,15 @@ join_challenge_method:
     load 2
     app_global_put
     
-    // Store participant info
-    byte "participant_"
+    // Store the participant's stake in their local state
     txn Sender
-    concat
-    byte "_challenge_"
-    concat
+    byte "challenge_"
     load 1
     itob
     concat
-    app_local_put
     txn ApplicationArgs 2
     btoi
+    app_local_put
     
     int 1
     return
@@ -286,11 +280,8 @@ leave_challenge_method:
     store 1  // challenge_id
     
     // Check if participant exists
-    byte "participant_"
     txn Sender
-    concat
-    byte "_challenge_"
-    concat
+    byte "challenge_"
     load 1
     itob
     concat
@@ -341,22 +332,48 @@ challenge_not_found:
 def create_clear_program():
     """Create clear program TEAL code."""
     teal = """
-#pragma version 6
+#pragma version 8
 int 1
 return
 """
     return teal.strip()
 
+def method_paths():
+    """Labels taken by each call path through the approval program."""
+    paths = {"create (app creation)": ["creation"]}
+    for signature, label in METHODS:
+        paths[signature.split("(")[0]] = ["handle_noop", label]
+    paths["opt_in"] = ["handle_optin"]
+    paths["close_out"] = ["handle_closeout"]
+    return paths
+
+def method_costs(approval_teal):
+    """Static opcode cost of each call path through the approval program."""
+    return cost_table(approval_teal, method_paths())
+
+def compile_client():
+    """An algod client for assembling programs, or None when algod is unreachable."""
+    from algosdk.v2client import algod
+
+    client = algod.AlgodClient(
+        os.getenv("ALGOD_TOKEN", ""), os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+    )
+    try:
+        client.compile("#pragma version 8\nint 1")
+    except Exception:
+        return None
+    return client
+
 def main():
     """Main function to generate TEAL files."""
     print("Generating Challenge Platform Smart Contract TEAL...")
     
     # Create artifacts directory
-    import os
     os.makedirs("artifacts", exist_ok=True)
     
-    # Generate approval program
-    approval_teal = create_approval_program()
+    # Generate approval program, deployed after the peephole passes
+    approval_source = create_approval_program()
+    approval_teal = optimize(approval_source)
     with open("artifacts/approval.teal", "w") as f:
         f.write(approval_teal)
     
@@ -369,6 +386,9 @@ def main():
     print("Files saved to: artifacts/")
     print(f"Approval program: {len(approval_teal)} characters")
     print(f"Clear program: {len(clear_teal)} characters")
+    print_optimization_report(
+        optimization_report(approval_source, approval_teal, method_paths(), compile_client())
+    )
     
     return {
         "approval_teal": approval_teal,
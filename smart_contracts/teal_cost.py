@@ -0,0 +1,113 @@
+"""
+Static opcode cost of TEAL programs
+
+Walks a program from its first instruction the way one call would: a
+conditional branch is taken only when its label is listed as taken, and
+`match` / `switch` jump to the listed target among their labels. Every
+instruction on the way is charged its AVM opcode cost.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Opcodes that cost more than 1 (AVM v8)
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "b+": 10,
+    "b-": 10,
+    "b/": 20,
+    "b*": 20,
+    "b%": 20,
+    "bsqrt": 40,
+}
+
+# Instructions that end a walk
+TERMINATORS = {"return", "err", "retsub"}
+
+# Walks longer than this are assumed to loop
+MAX_STEPS = 100_000
+
+Instruction = Tuple[str, List[str]]
+
+def strip_comment(line: str) -> str:
+    """Remove a // comment, leaving string literals that contain // intact."""
+    in_string = False
+    for index, char in enumerate(line):
+        if char == '"' and (index == 0 or line[index - 1] != "\\"):
+            in_string = not in_string
+        elif not in_string and line.startswith("//", index):
+            return line[:index]
+    return line
+
+def tokenize(line: str) -> List[str]:
+    """Split an instruction into opcode and immediates, keeping quoted strings whole."""
+    return re.findall(r'"(?:[^"\\]|\\.)*"|\S+', line)
+
+def parse_program(teal: str) -> Tuple[List[Instruction], Dict[str, int]]:
+    """Parse TEAL into instructions and a label -> instruction index map.
+
+    Pragmas, comments and blank lines are dropped.
+    """
+    instructions: List[Instruction] = []
+    labels: Dict[str, int] = {}
+    for raw in teal.splitlines():
+        line = strip_comment(raw).strip()
+        if not line or line.startswith("#pragma"):
+            continue
+        if line.endswith(":") and " " not in line:
+            labels[line[:-1]] = len(instructions)
+            continue
+        opcode, *immediates = tokenize(line)
+        instructions.append((opcode, immediates))
+    return instructions, labels
+
+def opcode_cost(opcode: str) -> int:
+    return OPCODE_COSTS.get(opcode, 1)
+
+def path_cost(teal: str, taken: Iterable[str], start: Optional[str] = None) -> int:
+    """Opcode cost of the walk from `start` (program start by default) to return or err.
+
+    `taken` lists the labels of conditional branches that are taken and the
+    targets chosen by match / switch; all other branches fall through.
+    """
+    instructions, labels = parse_program(teal)
+    taken = set(taken)
+    pc = labels[start] if start else 0
+    cost = 0
+    for _ in range(MAX_STEPS):
+        if pc >= len(instructions):
+            return cost
+        opcode, immediates = instructions[pc]
+        cost += opcode_cost(opcode)
+        pc += 1
+
+        if opcode in TERMINATORS:
+            return cost
+        if opcode == "b":
+            pc = labels[immediates[0]]
+        elif opcode in ("bnz", "bz") and immediates[0] in taken:
+            pc = labels[immediates[0]]
+        elif opcode in ("match", "switch"):
+            target = next((label for label in immediates if label in taken), None)
+            if target is not None:
+                pc = labels[target]
+
+    raise ValueError(f"No return within {MAX_STEPS} steps, the path loops")
+
+def cost_table(teal: str, paths: Dict[str, Iterable[str]]) -> Dict[str, int]:
+    """Opcode cost of each named path, e.g. method name -> taken labels."""
+    return {name: path_cost(teal, taken) for name, taken in paths.items()}
+
+def print_cost_table(costs: Dict[str, int], title: str = "Opcode cost per method") -> None:
+    width = max(len(name) for name in costs)
+    print(title)
+    for name, cost in costs.items():
+        print(f"  {name:<{width}}  {cost:>4}")
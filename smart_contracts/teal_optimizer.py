@@ -0,0 +1,408 @@
+"""
+Peephole optimizer for generated TEAL programs
+
+Rewrites the text of a TEAL program without changing what it does:
+
+- labelled blocks with the same tail (`int 1; return`, `err`) are merged,
+  `bz` / `b` to an `err` block become `assert` / `err`, and code no path
+  reaches is dropped
+- a value loaded and converted more than once in a straight-line block
+  (`load 0; itob`, `txn ApplicationArgs 2; btoi`) is computed once and kept
+  in a free scratch slot, where that saves opcodes; a `callsub` ends a block,
+  since the subroutine may store to the slots read around it
+- every constant is pushed with `pushint` / `pushbytes`, so the program
+  has no constant block to execute on each call
+
+Comments are not kept in the output.
+"""
+
+import base64
+import codecs
+import hashlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from smart_contracts.teal_cost import path_cost, strip_comment, tokenize
+
+Instruction = Tuple[str, List[str]]
+
+# Label lines are kept in the instruction list under this opcode
+LABEL = ":label"
+
+# Instructions after which control never falls through
+UNCONDITIONAL = {"return", "err", "retsub", "b"}
+
+BRANCHES = {"b", "bz", "bnz", "callsub", "match", "switch"}
+
+# Unary conversions a repeated load is usually followed by
+CONVERSIONS = {"btoi", "itob", "len"}
+
+NAMED_INTS = {
+    "NoOp": 0, "OptIn": 1, "CloseOut": 2, "ClearState": 3,
+    "UpdateApplication": 4, "DeleteApplication": 5,
+    "unknown": 0, "pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6,
+}
+
+BYTE_CONSTANTS = {"byte", "pushbytes", "addr", "method"}
+
+# Program parsing and rendering
+
+def parse(teal: str) -> Tuple[int, List[Instruction]]:
+    """Parse TEAL into its version and an ordered list of labels and instructions."""
+    version = 1
+    items: List[Instruction] = []
+    for raw in teal.splitlines():
+        line = strip_comment(raw).strip()
+        if not line:
+            continue
+        if line.startswith("#pragma"):
+            _, key, value = line.split()
+            if key == "version":
+                version = int(value)
+            continue
+        if line.endswith(":") and " " not in line:
+            items.append((LABEL, [line[:-1]]))
+            continue
+        opcode, *immediates = tokenize(line)
+        items.append((opcode, immediates))
+    return version, items
+
+def render(version: int, items: List[Instruction]) -> str:
+    lines = [f"#pragma version {version}"]
+    for opcode, immediates in items:
+        if opcode == LABEL:
+            lines.append(f"{immediates[0]}:")
+        else:
+            lines.append("    " + " ".join([opcode, *immediates]))
+    return "\n".join(lines)
+
+# Constant values and assembled sizes
+
+def int_value(token: str) -> int:
+    if token in NAMED_INTS:
+        return NAMED_INTS[token]
+    if token.startswith("0") and token.isdigit() and len(token) > 1:
+        return int(token, 8)
+    return int(token, 0)
+
+def byte_literals(tokens: List[str]) -> List[bytes]:
+    """Decode the byte literals of `byte` / `bytecblock` immediates."""
+    values = []
+    rest = list(tokens)
+    while rest:
+        token = rest.pop(0)
+        if token.startswith('"'):
+            values.append(codecs.escape_decode(token[1:-1].encode("utf-8"))[0])
+        elif token.startswith("0x"):
+            values.append(bytes.fromhex(token[2:]))
+        elif token in ("base64", "b64"):
+            values.append(base64.b64decode(rest.pop(0)))
+        elif token in ("base32", "b32"):
+            encoded = rest.pop(0)
+            values.append(base64.b32decode(encoded + "=" * (-len(encoded) % 8)))
+        elif token.startswith(("base64(", "b64(")):
+            values.append(base64.b64decode(token[token.index("(") + 1:-1]))
+        else:
+            raise ValueError(f"Unsupported byte literal: {token}")
+    return values
+
+def byte_value(opcode: str, immediates: List[str]) -> bytes:
+    if opcode == "method":
+        signature = immediates[0][1:-1]
+        return hashlib.new("sha512_256", signature.encode()).digest()[:4]
+    if opcode == "addr":
+        return base64.b32decode(immediates[0] + "=" * (-len(immediates[0]) % 8))[:32]
+    return byte_literals(immediates)[0]
+
+def varuint_size(value: int) -> int:
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+def instruction_size(opcode: str, immediates: List[str]) -> int:
+    """Assembled size of one instruction in bytes."""
+    if opcode == LABEL:
+        return 0
+    if opcode in ("int", "pushint"):
+        return 1 + varuint_size(int_value(immediates[0]))
+    if opcode in BYTE_CONSTANTS:
+        value = byte_value(opcode, immediates)
+        return 1 + varuint_size(len(value)) + len(value)
+    if opcode == "intcblock":
+        return 1 + varuint_size(len(immediates)) + sum(varuint_size(int_value(v)) for v in immediates)
+    if opcode == "bytecblock":
+        values = byte_literals(immediates)
+        return 1 + varuint_size(len(values)) + sum(varuint_size(len(v)) + len(v) for v in values)
+    if opcode in ("match", "switch"):
+        return 2 + 2 * len(immediates)
+    if opcode in ("b", "bz", "bnz", "callsub"):
+        return 3
+    # Field and slot immediates take one byte each, `txn F N` assembles to txna
+    return 1 + len(immediates)
+
+def program_size(teal: str) -> int:
+    """Estimated assembled size in bytes.
+
+    `int` / `byte` pseudo-ops are sized as pushint / pushbytes, i.e. without
+    the constant blocks the assembler may build on its own.
+    """
+    version, items = parse(teal)
+    return varuint_size(version) + sum(instruction_size(*item) for item in items)
+
+# Control flow passes
+
+def _label_names(items: List[Instruction], index: int) -> List[str]:
+    names = []
+    while index < len(items) and items[index][0] == LABEL:
+        names.append(items[index][1][0])
+        index += 1
+    return names
+
+def _tail_at(items: List[Instruction], index: int) -> Optional[Tuple[Instruction, ...]]:
+    """Instructions from index up to the first return / err, if no label comes first."""
+    tail = []
+    for opcode, immediates in items[index:]:
+        if opcode == LABEL:
+            return None
+        tail.append((opcode, tuple(immediates)))
+        if opcode in ("return", "err"):
+            return tuple(tail)
+    return None
+
+def _falls_into(items: List[Instruction], index: int) -> bool:
+    """Whether the instruction before a label group can fall through into it."""
+    while index > 0 and items[index - 1][0] == LABEL:
+        index -= 1
+    return index == 0 or items[index - 1][0] not in UNCONDITIONAL
+
+def merge_tails(items: List[Instruction]) -> List[Instruction]:
+    """Keep one copy of identical labelled tails and move the other labels onto it."""
+    # tail -> index of the last label in front of its first copy
+    first_tail: Dict[Tuple[Instruction, ...], int] = {}
+    moved: Dict[int, List[str]] = {}
+    dropped = set()
+
+    index = 0
+    while index < len(items):
+        if items[index][0] != LABEL:
+            index += 1
+            continue
+        names = _label_names(items, index)
+        body = index + len(names)
+        tail = _tail_at(items, body)
+        if tail is None:
+            index = body
+            continue
+        if tail not in first_tail:
+            first_tail[tail] = body - 1
+        elif not _falls_into(items, index):
+            moved.setdefault(first_tail[tail], []).extend(names)
+            dropped.update(range(index, body + len(tail)))
+        index = body + len(tail)
+
+    merged: List[Instruction] = []
+    for index, item in enumerate(items):
+        if index in dropped:
+            continue
+        merged.append(item)
+        merged.extend((LABEL, [name]) for name in moved.get(index, []))
+    return merged
+
+def branches_to_err(items: List[Instruction]) -> List[Instruction]:
+    """`bz L` where L only errs becomes `assert`, `b L` becomes `err`."""
+    labels = {immediates[0]: index for index, (opcode, immediates) in enumerate(items) if opcode == LABEL}
+
+    def errs(label: str) -> bool:
+        index = labels[label]
+        while items[index][0] == LABEL:
+            index += 1
+        return items[index][0] == "err"
+
+    rewritten = []
+    for opcode, immediates in items:
+        if opcode == "bz" and errs(immediates[0]):
+            rewritten.append(("assert", []))
+        elif opcode == "b" and errs(immediates[0]):
+            rewritten.append(("err", []))
+        else:
+            rewritten.append((opcode, immediates))
+    return rewritten
+
+def remove_dead_code(items: List[Instruction]) -> List[Instruction]:
+    """Drop labels nothing jumps to and instructions no path reaches."""
+    while True:
+        referenced = {
+            label
+            for opcode, immediates in items if opcode in BRANCHES
+            for label in immediates
+        }
+        live: List[Instruction] = []
+        reachable = True
+        for opcode, immediates in items:
+            if opcode == LABEL:
+                if immediates[0] in referenced:
+                    live.append((opcode, immediates))
+                    reachable = True
+                continue
+            if reachable:
+                live.append((opcode, immediates))
+                reachable = opcode not in UNCONDITIONAL
+        if live == items:
+            return live
+        items = live
+
+# Load deduplication
+
+def _load_runs(items: List[Instruction], start: int, end: int) -> List[Tuple[tuple, int, int]]:
+    """(key, start, end) of each load followed by conversions in a straight-line block.
+
+    Scratch loads are keyed by how many times their slot was stored before,
+    so a run read after a store is not confused with one read before it.
+    """
+    stores: Counter = Counter()
+    runs = []
+    index = start
+    while index < end:
+        opcode, immediates = items[index]
+        if opcode == "store":
+            stores[immediates[0]] += 1
+        if opcode in ("txn", "txna", "load"):
+            run_end = index + 1
+            while run_end < end and items[run_end][0] in CONVERSIONS:
+                run_end += 1
+            if run_end - index > 1:
+                generation = stores[immediates[0]] if opcode == "load" else 0
+                key = (generation, tuple((op, tuple(imm)) for op, imm in items[index:run_end]))
+                runs.append((key, index, run_end))
+                index = run_end
+                continue
+        index += 1
+    return runs
+
+def dedup_loads(items: List[Instruction]) -> List[Instruction]:
+    """Keep a value loaded more than once in a block in a free scratch slot."""
+    if any(opcode in ("loads", "stores") for opcode, _ in items):
+        return items
+    used = {
+        int(immediates[0])
+        for opcode, immediates in items if opcode in ("load", "store")
+    }
+    free_slots = [slot for slot in range(256) if slot not in used]
+
+    # Straight-line blocks: nothing can jump into the middle of one, and no
+    # subroutine runs in between, so no store is hidden inside a block
+    bounds = [index for index, (opcode, _) in enumerate(items) if opcode in (LABEL, "callsub")]
+    blocks = zip([0] + [b + 1 for b in bounds], bounds + [len(items)])
+
+    replacements: Dict[int, Tuple[int, List[Instruction]]] = {}
+    for start, end in blocks:
+        groups: Dict[tuple, List[Tuple[int, int]]] = {}
+        for key, run_start, run_end in _load_runs(items, start, end):
+            groups.setdefault(key, []).append((run_start, run_end))
+
+        slots = iter(free_slots)
+        for runs in groups.values():
+            first_start, first_end = runs[0]
+            ops = first_end - first_start
+            size = sum(instruction_size(*item) for item in items[first_start:first_end])
+            # First run pays dup + store, every later run becomes one load
+            saved_ops = (len(runs) - 1) * (ops - 1) - 2
+            saved_bytes = (len(runs) - 1) * (size - 2) - 3
+            if saved_ops <= 0 or saved_bytes < 0:
+                continue
+            slot = next(slots, None)
+            if slot is None:
+                break
+            replacements[first_start] = (first_end, items[first_start:first_end] + [
+                ("dup", []), ("store", [str(slot)])
+            ])
+            for run_start, run_end in runs[1:]:
+                replacements[run_start] = (run_end, [("load", [str(slot)])])
+
+    deduped: List[Instruction] = []
+    index = 0
+    while index < len(items):
+        if index in replacements:
+            index, replacement = replacements[index]
+            deduped.extend(replacement)
+        else:
+            deduped.append(items[index])
+            index += 1
+    return deduped
+
+# Constant pushing
+
+def push_constants(version: int, items: List[Instruction]) -> List[Instruction]:
+    """Push every constant with pushint / pushbytes.
+
+    The assembler gathers repeated `int` / `byte` constants into an
+    intcblock / bytecblock at the program start, which every call then
+    executes. A pushed constant costs the same one opcode as an intc / bytec
+    reference, so pushing them all saves the block opcodes on every path at
+    the price of a larger program.
+    """
+    if version < 3 or any(
+        opcode.startswith(("intc", "bytec")) for opcode, _ in items
+    ):
+        return items
+
+    pushed: List[Instruction] = []
+    for opcode, immediates in items:
+        if opcode == "int":
+            pushed.append(("pushint", [str(int_value(immediates[0]))]))
+        elif opcode in ("method", "addr"):
+            value = byte_value(opcode, immediates)
+            pushed.append(("pushbytes", ["0x" + value.hex(), "//", " ".join(immediates)]))
+        elif opcode == "byte":
+            pushed.append(("pushbytes", immediates))
+        else:
+            pushed.append((opcode, immediates))
+    return pushed
+
+# Entry points
+
+def optimize(teal: str) -> str:
+    """Apply every pass and return the optimized program."""
+    version, items = parse(teal)
+    items = merge_tails(items)
+    items = branches_to_err(items)
+    items = remove_dead_code(items)
+    items = dedup_loads(items)
+    items = push_constants(version, items)
+    return render(version, items)
+
+def assembled_size(teal: str, algod_client) -> int:
+    """Size in bytes of the program as assembled by algod."""
+    return len(base64.b64decode(algod_client.compile(teal)["result"]))
+
+def optimization_report(
+    before: str, after: str, paths: Dict[str, Iterable[str]], algod_client=None
+) -> Dict:
+    """Program size and opcode cost of each path, before and after optimizing.
+
+    Sizes are assembled by `algod_client` when one is given and estimated
+    with program_size otherwise. Costs count the instructions in the text,
+    so they leave out any constant block the assembler adds to `before`.
+    """
+    if algod_client is not None:
+        size = (assembled_size(before, algod_client), assembled_size(after, algod_client))
+    else:
+        size = (program_size(before), program_size(after))
+    return {
+        "size": size,
+        "assembled": algod_client is not None,
+        "costs": {
+            name: (path_cost(before, taken), path_cost(after, taken))
+            for name, taken in paths.items()
+        }
+    }
+
+def print_optimization_report(report: Dict) -> None:
+    before, after = report["size"]
+    print(f"Program size: {before} -> {after} bytes ({'assembled' if report['assembled'] else 'estimated'})")
+    width = max(len(name) for name in report["costs"])
+    print("Opcode cost per method (before -> after)")
+    for name, (before, after) in report["costs"].items():
+        print(f"  {name:<{width}}  {before:>4} -> {after:>4}")
@@ -0,0 +1,76 @@
+"""
+Fixtures running backend services against the in-process local ledger.
+
+backend/python-api is not a valid package name, so it is registered as
+`python_api` for the services' relative imports to resolve. The services
+import without algopy; the local ledger lives in the contracts package,
+which needs algopy, so only the ledger fixtures skip without it.
+"""
+
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+BACKEND_DIR = REPO_ROOT / "backend" / "python-api"
+
+sys.path.insert(0, str(REPO_ROOT))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+if "python_api" not in sys.modules:
+    package = types.ModuleType("python_api")
+    package.__path__ = [str(BACKEND_DIR)]
+    sys.modules["python_api"] = package
+
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from python_api.services.chain_indexer import ChainStateStore
+from python_api.services.confirmation_tracker import ConfirmationTracker
+from python_api.services.contract_service import ContractService
+from python_api.services.local_algod import LocalAlgodClient
+from python_api.services.params_cache import SuggestedParamsCache
+from python_api.services.resource_planner import ResourcePlanner
+
+BLOCK_TIME = 0.05
+
+def local_ledger(**kwargs):
+    """A fast local ledger; skips the test where the contracts package cannot import."""
+    pytest.importorskip("algopy")
+    from contracts.local_ledger import LocalLedger
+
+    return LocalLedger(block_time=BLOCK_TIME, **kwargs)
+
+def local_contract_service(ledger) -> ContractService:
+    """A ContractService with its own client, caches and platform account on the ledger."""
+    client = LocalAlgodClient(ledger)
+    service = ContractService()
+    service.algod = client
+    service.algod_client = ledger
+    service.params_cache = SuggestedParamsCache(client)
+    service.confirmation_tracker = ConfirmationTracker(client)
+    service.chain_state = ChainStateStore()
+    service.resource_planner = ResourcePlanner(service.chain_state)
+
+    private_key, address = account.generate_account()
+    ledger.fund(address, 10**12)
+    service.app_id = ledger.create_app(address)
+    service.platform_address = address
+    service.signer = AccountTransactionSigner(private_key)
+    return service
+
+@pytest.fixture
+def box_read_service():
+    """Serves the box-backed getters only, no contract execution needed."""
+    pytest.importorskip("algopy")
+    from contracts.local_ledger import BoxReadApp
+
+    return local_contract_service(local_ledger(app_factory=BoxReadApp))
+
+@pytest.fixture
+def contract_service():
+    """Executes the real contract, which needs algorand-python-testing."""
+    pytest.importorskip("algopy_testing")
+    return local_contract_service(local_ledger())
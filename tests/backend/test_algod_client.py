@@ -0,0 +1,137 @@
+"""
+Pooled async algod client: one connection pool, bounded concurrency.
+
+Requests go to an httpx mock transport instead of a node.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from python_api.services.algod_client import AlgodHTTPError, AsyncAlgodClient
+
+PARAMS = {
+    "min-fee": 1000,
+    "last-round": 50,
+    "genesis-hash": "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+    "genesis-id": "testnet-v1.0",
+    "consensus-version": "future",
+    "fee": 0,
+}
+
+class Node:
+    """Mock algod answering every request after a delay, counting concurrent ones."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    async def handle(self, request):
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if request.url.path == "/v2/transactions/params":
+            return httpx.Response(200, json=PARAMS)
+        if request.url.path == "/v2/status":
+            return httpx.Response(200, json={"last-round": 50})
+        return httpx.Response(404, json={"message": "not found"})
+
+def _client(node, **kwargs):
+    return AsyncAlgodClient(
+        "http://algod.test", "token", transport=httpx.MockTransport(node.handle), **kwargs
+    )
+
+def test_requests_share_the_pool_and_token():
+    node = Node(delay=0)
+
+    async def run():
+        client = _client(node)
+        try:
+            return await client.status(), await client.status()
+        finally:
+            await client.close()
+
+    first, second = asyncio.run(run())
+
+    assert first == second == {"last-round": 50}
+    assert [r.headers["X-Algo-API-Token"] for r in node.requests] == ["token", "token"]
+
+def test_concurrent_requests_are_bounded_by_the_semaphore():
+    node = Node()
+
+    async def run():
+        client = _client(node, max_concurrency=3)
+        try:
+            return await asyncio.gather(*[client.status() for _ in range(10)])
+        finally:
+            await client.close()
+
+    results = asyncio.run(run())
+
+    assert len(results) == 10
+    assert node.max_in_flight == 3
+
+def test_run_sync_shares_the_concurrency_limit():
+    node = Node(delay=0.05)
+    threads = {"in_flight": 0, "max": 0}
+    lock = threading.Lock()
+
+    def blocking_call():
+        with lock:
+            threads["in_flight"] += 1
+            threads["max"] = max(threads["max"], threads["in_flight"] + node.in_flight)
+        time.sleep(0.05)
+        with lock:
+            threads["in_flight"] -= 1
+
+    async def run():
+        client = _client(node, max_concurrency=2)
+        try:
+            await asyncio.gather(
+                *[client.run_sync(blocking_call) for _ in range(3)],
+                *[client.status() for _ in range(3)]
+            )
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+
+    assert threads["max"] <= 2
+    assert node.max_in_flight <= 2
+
+def test_suggested_params_are_built_from_the_node_response():
+    async def run():
+        client = _client(Node(delay=0))
+        try:
+            return await client.suggested_params()
+        finally:
+            await client.close()
+
+    params = asyncio.run(run())
+
+    assert (params.first, params.last) == (50, 1050)
+    assert params.fee == params.min_fee == 1000
+    assert params.flat_fee
+    assert params.gen == "testnet-v1.0"
+
+def test_error_status_raises_with_its_code():
+    async def run():
+        client = _client(Node(delay=0))
+        try:
+            await client.pending_transaction_info("MISSING")
+        finally:
+            await client.close()
+
+    with pytest.raises(AlgodHTTPError) as error:
+        asyncio.run(run())
+    assert error.value.status_code == 404
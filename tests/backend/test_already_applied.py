@@ -0,0 +1,65 @@
+"""
+Submission errors for calls that already took effect.
+
+algod rejects a whole group when one of its transactions is already in
+the ledger or reuses a lease held by an earlier attempt; only the
+transaction it names counts as applied.
+"""
+
+import asyncio
+
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, TransactionWithSigner
+)
+
+from python_api.services.contract_service import ContractService, SubmissionAlreadyApplied
+
+class RejectingAlgod:
+    def __init__(self, message):
+        self.message = message
+
+    async def send_transactions(self, signed_txns):
+        raise Exception(self.message(signed_txns))
+
+def _group(count):
+    private_key, address = account.generate_account()
+    signer = AccountTransactionSigner(private_key)
+    params = transaction.SuggestedParams(fee=1000, first=1, last=1000, gh="A" * 44, flat_fee=True)
+    atc = AtomicTransactionComposer()
+    for i in range(count):
+        atc.add_transaction(TransactionWithSigner(
+            transaction.PaymentTxn(address, params, address, 0, note=f"call {i}".encode()), signer
+        ))
+    return atc
+
+def _submit(message):
+    service = ContractService()
+    service.algod = RejectingAlgod(message)
+    atc = _group(3)
+    with pytest.raises(Exception) as raised:
+        asyncio.run(service._submit_group(atc))
+    return raised.value, atc.tx_ids
+
+def test_lease_conflict_names_one_transaction():
+    error, tx_ids = _submit(lambda txns: f"transaction {txns[1].get_txid()} using an overlapping lease")
+
+    assert isinstance(error, SubmissionAlreadyApplied)
+    assert error.transaction_id == tx_ids[1]
+    assert not error.in_ledger
+
+def test_transaction_in_ledger_is_applied_itself():
+    error, tx_ids = _submit(lambda txns: f"transaction already in ledger: {txns[2].get_txid()}")
+
+    assert isinstance(error, SubmissionAlreadyApplied)
+    assert error.transaction_id == tx_ids[2]
+    assert error.in_ledger
+
+def test_error_naming_no_transaction_of_the_group_is_not_applied():
+    other = _group(1)
+    other.gather_signatures()
+    error, _ = _submit(lambda txns: f"transaction {other.tx_ids[0]} using an overlapping lease")
+
+    assert not isinstance(error, SubmissionAlreadyApplied)
+    assert "overlapping lease" in str(error)
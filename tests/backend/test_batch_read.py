@@ -0,0 +1,162 @@
+"""
+ContractService reads against the local ledger.
+
+Boxes are written in the contract's layouts, then read back through
+batch_read, get_challenge_state and the range readers, which go through
+LocalAlgodClient's simulate, and checked after decoding.
+"""
+
+import asyncio
+
+from algosdk import abi, account, encoding
+
+from python_api.services.contract_service import READ_PAGE_LIMIT
+
+CHALLENGE_ID = 7
+
+METADATA_TYPE = abi.ABIType.from_string("(string,string,uint64,uint64,address,uint64,uint64)")
+STATE_TYPE = abi.ABIType.from_string("(uint64,uint64,bool)")
+PARTICIPANT_TYPE = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)")
+TRACKER_TYPE = abi.ABIType.from_string("(uint64,uint64)")
+CHAT_MESSAGE_ARRAY_TYPE = abi.ABIType.from_string("(uint64,address,string,uint64,bool)[]")
+TASK_ARRAY_TYPE = abi.ABIType.from_string("(uint64,uint64,string,string,uint64,string,uint64,bool)[]")
+HEALTH_ROOT_TYPE = abi.ABIType.from_string("(byte[32],uint64,uint64)")
+CHAT_PAGE_SIZE = 16
+
+def _uint64(value):
+    return value.to_bytes(8, "big")
+
+def _put_challenge(service, participant_count):
+    """Write the boxes of one challenge and return its participants as get_challenge_state dicts."""
+    creator = service.platform_address
+    cid = _uint64(CHALLENGE_ID)
+    put = service.algod.put_box
+
+    put(service.app_id, b"challenge_metadata" + cid, METADATA_TYPE.encode(
+        ["Run", "5k a day", 100_000, 50, creator, 1_000, 2_000]
+    ))
+    put(service.app_id, b"challenge_states" + cid, STATE_TYPE.encode([95_000 * participant_count, 2, True]))
+
+    participants = []
+    for rank in range(1, participant_count + 1):
+        address = account.generate_account()[1]
+        participant = {
+            "address": address,
+            "stake_amount": 95_000,
+            "joined_at": 1_000 + rank,
+            "is_active": rank % 3 != 0,
+            "tasks_completed": rank % 4,
+            "current_rank": rank,
+        }
+        put(service.app_id, b"participants" + cid + encoding.decode_address(address),
+            PARTICIPANT_TYPE.encode(list(participant.values())))
+        participants.append(participant)
+
+    put(service.app_id, b"participant_counts" + cid, _uint64(participant_count))
+    put(service.app_id, b"participant_index" + cid,
+        b"".join(encoding.decode_address(p["address"]) for p in participants))
+    put(service.app_id, b"elimination_trackers" + cid, TRACKER_TYPE.encode(
+        [sum(p["is_active"] for p in participants), 0]
+    ))
+    return participants
+
+def test_batch_read_decodes_boxes_in_one_simulate(box_read_service):
+    participants = _put_challenge(box_read_service, 3)
+
+    calls = [("get_challenge_info", [CHALLENGE_ID]), ("get_participant_count", [CHALLENGE_ID])]
+    calls += [("get_participant", [CHALLENGE_ID, p["address"]]) for p in participants]
+    calls.append(("get_leaderboard_summary", [CHALLENGE_ID]))
+
+    challenge, count, *rest = asyncio.run(box_read_service.batch_read(calls))
+    *decoded_participants, summary = rest
+
+    assert box_read_service.algod.simulate_calls == 1
+    assert challenge["challenge_id"] == CHALLENGE_ID
+    assert challenge["name"] == "Run"
+    assert challenge["description"] == "5k a day"
+    assert challenge["creator"] == box_read_service.platform_address
+    assert challenge["total_staked"] == 95_000 * 3
+    assert challenge["current_week"] == 2
+    assert challenge["is_active"] is True
+    assert count == 3
+    for participant, decoded in zip(participants, decoded_participants):
+        assert encoding.encode_address(bytes(decoded["address"])) == participant["address"]
+        assert int(decoded["tasks_completed"]) == participant["tasks_completed"]
+        assert int(decoded["current_rank"]) == participant["current_rank"]
+    assert summary["participant_count"] == 3
+    assert summary["active_count"] == 2
+    assert summary["min_tasks"] == 0
+
+def test_get_challenge_state_reads_unindexed_challenge_page_by_page(box_read_service):
+    # More participants than one range getter page returns
+    participants = _put_challenge(box_read_service, READ_PAGE_LIMIT + 5)
+
+    state = asyncio.run(box_read_service.get_challenge_state(CHALLENGE_ID))
+
+    # Leaderboard summary first, then every participant page in one request
+    assert box_read_service.algod.simulate_calls == 2
+    assert state["challenge_id"] == CHALLENGE_ID
+    assert state["total_staked"] == 95_000 * len(participants)
+    assert state["current_week"] == 2
+    assert state["is_active"] is True
+    assert state["participants"] == participants
+
+def test_get_challenge_state_serves_indexed_boxes_without_reads(box_read_service):
+    participants = _put_challenge(box_read_service, 4)
+    ledger = box_read_service.algod.ledger
+    for name, value in ledger.apps[box_read_service.app_id].boxes.items():
+        box_read_service.chain_state.put(name, value)
+
+    state = asyncio.run(box_read_service.get_challenge_state(CHALLENGE_ID))
+
+    assert box_read_service.algod.simulate_calls == 0
+    assert state["total_staked"] == 95_000 * 4
+    assert sorted(state["participants"], key=lambda p: p["current_rank"]) == participants
+
+def test_get_chat_messages_reads_on_where_long_messages_fill_a_page(box_read_service):
+    _put_challenge(box_read_service, 2)
+    sender = box_read_service.platform_address
+    messages = [
+        {"message_id": i, "sender": sender, "content": f"{i:03d}" + "x" * 297,
+         "timestamp": 1_000 + i, "is_system_message": False}
+        for i in range(CHAT_PAGE_SIZE + 4)
+    ]
+    cid = _uint64(CHALLENGE_ID)
+    for page_no in range(2):
+        page = messages[page_no * CHAT_PAGE_SIZE:(page_no + 1) * CHAT_PAGE_SIZE]
+        box_read_service.algod.put_box(box_read_service.app_id, b"chat_messages" + cid + _uint64(page_no),
+                                       CHAT_MESSAGE_ARRAY_TYPE.encode([list(m.values()) for m in page]))
+    box_read_service.algod.put_box(box_read_service.app_id, b"message_counters" + cid, _uint64(len(messages)))
+
+    assert asyncio.run(box_read_service.get_chat_messages(CHALLENGE_ID)) == messages
+    # Two 300-byte messages fit per read: the summary, then the first read of
+    # both ranges and five rounds reading on from where the longer one stopped
+    assert box_read_service.algod.simulate_calls == 7
+
+def test_get_tasks_reads_every_task(box_read_service):
+    _put_challenge(box_read_service, 2)
+    tasks = [
+        {"task_id": i, "challenge_id": CHALLENGE_ID, "name": f"Task {i}", "description": "d" * 100 * (i % 3),
+         "required_value": 10_000, "data_type": "steps", "points": i, "is_active": True}
+        for i in range(READ_PAGE_LIMIT + 3)
+    ]
+    box_read_service.algod.put_box(box_read_service.app_id, b"tasks" + _uint64(CHALLENGE_ID),
+                                   TASK_ARRAY_TYPE.encode([list(t.values()) for t in tasks]))
+
+    assert asyncio.run(box_read_service.get_tasks(CHALLENGE_ID)) == tasks
+
+def test_get_health_roots_reads_consecutive_days(box_read_service):
+    address = account.generate_account()[1]
+    root = bytes(range(32))
+    box_read_service.algod.put_box(
+        box_read_service.app_id,
+        b"health_roots" + _uint64(CHALLENGE_ID) + encoding.decode_address(address) + _uint64(20),
+        HEALTH_ROOT_TYPE.encode([list(root), 144, 5_000])
+    )
+
+    roots = asyncio.run(box_read_service.get_health_roots(CHALLENGE_ID, address, 5, READ_PAGE_LIMIT + 8))
+
+    assert [r["day"] for r in roots] == list(range(5, 5 + READ_PAGE_LIMIT + 8))
+    assert roots[15] == {"day": 20, "root": root.hex(), "sample_count": 144, "committed_at": 5_000}
+    assert all(r["sample_count"] == 0 for r in roots if r["day"] != 20)
+    assert box_read_service.algod.simulate_calls == 1
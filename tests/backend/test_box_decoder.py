@@ -0,0 +1,137 @@
+"""
+Box decoders against struct bytes encoded by the algosdk ABI types.
+"""
+
+from algosdk import abi, account
+
+from python_api.services import box_decoder
+
+PARTICIPANTS = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)[]")
+PARTICIPANT = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)")
+WEEKLY_RANKINGS = abi.ABIType.from_string("(uint64,address,uint64)[]")
+CHALLENGE = abi.ABIType.from_string(
+    "(uint64,string,string,uint64,uint64,address,uint64,uint64,uint64,bool,uint64)"
+)
+CHALLENGE_METADATA = abi.ABIType.from_string("(string,string,uint64,uint64,address,uint64,uint64)")
+CHALLENGE_STATE = abi.ABIType.from_string("(uint64,uint64,bool)")
+ELIMINATION_TRACKER = abi.ABIType.from_string("(uint64,uint64)")
+LEADERBOARD_SUMMARY = abi.ABIType.from_string(
+    "(uint64,uint64,uint64,uint64,uint64,bool,uint64,uint64,uint64)"
+)
+CHAT_MESSAGES = abi.ABIType.from_string("(uint64,address,string,uint64,bool)[]")
+
+ADDRESSES = [account.generate_account()[1] for _ in range(3)]
+
+def _participant_dict(row):
+    keys = ("address", "stake_amount", "joined_at", "is_active", "tasks_completed", "current_rank")
+    return dict(zip(keys, row))
+
+def test_participants_array():
+    rows = [
+        [ADDRESSES[0], 950000, 1700000000, True, 4, 1],
+        [ADDRESSES[1], 950000, 1700000001, False, 0, 3],
+        [ADDRESSES[2], 2**64 - 1, 1700000002, True, 2, 2],
+    ]
+    decoded = box_decoder.decode_participants(PARTICIPANTS.encode(rows))
+
+    assert box_decoder.PARTICIPANT_DTYPE.itemsize == 65
+    assert box_decoder.participants_to_dicts(decoded) == [_participant_dict(row) for row in rows]
+    assert box_decoder.is_true(decoded["is_active"]).tolist() == [True, False, True]
+
+def test_empty_participants_array():
+    assert len(box_decoder.decode_participants(PARTICIPANTS.encode([]))) == 0
+
+def test_single_participant():
+    row = [ADDRESSES[0], 1000000, 1700000000, True, 7, 2]
+    record = box_decoder.decode_participant(PARTICIPANT.encode(row))
+
+    assert box_decoder.participants_to_dicts([record]) == [_participant_dict(row)]
+
+def test_weekly_rankings():
+    rows = [[1, ADDRESSES[0], 1700600000], [2, ADDRESSES[1], 1701200000]]
+    decoded = box_decoder.decode_weekly_rankings(WEEKLY_RANKINGS.encode(rows))
+
+    assert box_decoder.weekly_rankings_to_dicts(decoded) == [
+        {"week": week, "eliminated_participant": address, "timestamp": timestamp}
+        for week, address, timestamp in rows
+    ]
+
+def test_challenge():
+    row = [42, "Run daily", "Ünïcode description", 1000000, 10, ADDRESSES[0],
+           1700000000, 1702592000, 3000000, True, 2]
+    decoded = box_decoder.decode_challenge(CHALLENGE.encode(row))
+
+    assert decoded == {
+        "challenge_id": 42,
+        "name": "Run daily",
+        "description": "Ünïcode description",
+        "stake_amount": 1000000,
+        "max_participants": 10,
+        "creator": ADDRESSES[0],
+        "start_time": 1700000000,
+        "end_time": 1702592000,
+        "total_staked": 3000000,
+        "is_active": True,
+        "current_week": 2,
+    }
+
+def test_challenge_metadata():
+    row = ["Read", "", 500000, 4, ADDRESSES[1], 1700000000, 1700600000]
+    decoded = box_decoder.decode_challenge_metadata(CHALLENGE_METADATA.encode(row))
+
+    assert decoded == {
+        "name": "Read",
+        "description": "",
+        "stake_amount": 500000,
+        "max_participants": 4,
+        "creator": ADDRESSES[1],
+        "start_time": 1700000000,
+        "end_time": 1700600000,
+    }
+
+def test_challenge_state():
+    assert box_decoder.decode_challenge_state(CHALLENGE_STATE.encode([2000000, 3, True])) == {
+        "total_staked": 2000000, "current_week": 3, "is_active": True
+    }
+    assert box_decoder.decode_challenge_state(CHALLENGE_STATE.encode([0, 0, False]))["is_active"] is False
+
+def test_elimination_tracker():
+    assert box_decoder.decode_elimination_tracker(ELIMINATION_TRACKER.encode([5, 2])) == {
+        "active_count": 5, "min_tasks": 2
+    }
+
+def test_leaderboard_summary():
+    data = LEADERBOARD_SUMMARY.encode([6, 4, 1, 6000000, 2, True, 2, 9, 31])
+
+    assert box_decoder.decode_leaderboard_summary(data) == {
+        "participant_count": 6,
+        "active_count": 4,
+        "eliminated_count": 2,
+        "min_tasks": 1,
+        "total_staked": 6000000,
+        "current_week": 2,
+        "is_active": True,
+        "ranking_count": 2,
+        "task_count": 9,
+        "message_count": 31,
+    }
+
+def test_chat_messages():
+    rows = [
+        [1, ADDRESSES[0], "hello", 1700000000, False],
+        [2, ADDRESSES[1], "x" * 300, 1700000060, False],
+        [3, ADDRESSES[2], "", 1700000120, True],
+    ]
+    heads, contents = box_decoder.decode_chat_messages(CHAT_MESSAGES.encode(rows))
+
+    assert heads["message_id"].tolist() == [1, 2, 3]
+    assert [bytes(sender) for sender in heads["sender"]] == [
+        abi.AddressType().encode(address) for address in ADDRESSES
+    ]
+    assert heads["timestamp"].tolist() == [1700000000, 1700000060, 1700000120]
+    assert box_decoder.is_true(heads["is_system_message"]).tolist() == [False, False, True]
+    assert contents == ["hello", "x" * 300, ""]
+
+def test_empty_chat_messages():
+    heads, contents = box_decoder.decode_chat_messages(CHAT_MESSAGES.encode([]))
+    assert len(heads) == 0 and contents == []
@@ -0,0 +1,171 @@
+"""
+Chain indexer: box names and values decoded into the local state store.
+
+A fake algod serves boxes and blocks; the mirror lives in in-memory SQLite.
+"""
+
+import asyncio
+import base64
+
+import pytest
+from algosdk import abi, account, encoding
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from python_api.models import ChainBox, ChainCursor
+from python_api.services.algod_client import AlgodHTTPError
+from python_api.services.chain_indexer import (
+    ChainIndexer, ChainStateStore, decode_box_key, decode_box_value, split_box_name
+)
+
+APP_ID = 1001
+ADDRESS = account.generate_account()[1]
+OTHER_ADDRESS = account.generate_account()[1]
+
+PARTICIPANT = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)")
+CHALLENGE_STATE = abi.ABIType.from_string("(uint64,uint64,bool)")
+ELIMINATION_TRACKER = abi.ABIType.from_string("(uint64,uint64)")
+COMPLETION_BUCKET = abi.ABIType.from_string("(uint64,uint64,uint64)")
+NO_BUCKET = 2**64 - 1
+
+def _uint64(value):
+    return value.to_bytes(8, "big")
+
+def _participant_name(challenge_id, address):
+    return b"participants" + _uint64(challenge_id) + encoding.decode_address(address)
+
+def _participant_box(address, tasks_completed, is_active=True):
+    return PARTICIPANT.encode([address, 1000000, 1700000000, is_active, tasks_completed, 0])
+
+class Node:
+    def __init__(self, boxes):
+        self.boxes = dict(boxes)
+        self.blocks = {}
+        self.last_round = 10
+        self.box_reads = 0
+
+    async def status(self):
+        return {"last-round": self.last_round}
+
+    async def application_boxes(self, app_id):
+        return {"boxes": [{"name": base64.b64encode(name).decode()} for name in self.boxes]}
+
+    async def application_box_by_name(self, app_id, name):
+        self.box_reads += 1
+        if name not in self.boxes:
+            raise AlgodHTTPError(404, "box not found")
+        return {"name": base64.b64encode(name).decode(), "value": base64.b64encode(self.boxes[name]).decode()}
+
+    async def block(self, round_num):
+        return {"block": {"txns": self.blocks.get(round_num, [])}}
+
+def _app_call(*names, app_id=APP_ID):
+    return {"txn": {"type": "appl", "apid": app_id, "apbx": [
+        {"i": 0, "n": base64.b64encode(name).decode()} for name in names
+    ]}}
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ChainBox.__table__.create(engine)
+    ChainCursor.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+def test_split_box_name():
+    name = _participant_name(7, ADDRESS)
+    assert split_box_name(name) == ("participants", "participant", name[len(b"participants"):])
+    assert split_box_name(b"challenge_states" + _uint64(7)) == ("challenge_states", "uint64", _uint64(7))
+    assert split_box_name(b"deposited" + encoding.decode_address(ADDRESS))[0] == "deposited"
+    assert split_box_name(b"completion_buckets" + _uint64(7) + _uint64(3))[:2] == ("completion_buckets", "bucket")
+
+    # Unindexed maps and keys of the wrong size are skipped
+    assert split_box_name(b"chat_messages" + _uint64(7)) is None
+    assert split_box_name(b"challenge_states" + _uint64(7) + b"x") is None
+
+def test_decode_box_key():
+    assert decode_box_key("uint64", _uint64(2**40)) == 2**40
+    assert decode_box_key("address", encoding.decode_address(ADDRESS)) == ADDRESS
+    assert decode_box_key("participant", _uint64(7) + encoding.decode_address(ADDRESS)) == (7, ADDRESS)
+    assert decode_box_key("bucket", _uint64(7) + _uint64(3)) == (7, 3)
+
+def test_decode_box_value():
+    assert decode_box_value("challenge_states", CHALLENGE_STATE.encode([3000000, 1, True])) == {
+        "total_staked": 3000000, "current_week": 1, "is_active": True
+    }
+    assert decode_box_value("elimination_trackers", ELIMINATION_TRACKER.encode([3, 1])) == {
+        "active_count": 3, "min_tasks": 1
+    }
+    assert decode_box_value("completion_buckets", COMPLETION_BUCKET.encode([2, NO_BUCKET, 5])) == {
+        "count": 2, "lower": None, "higher": 5
+    }
+    assert decode_box_value("deposited", _uint64(2500000)) == 2500000
+
+    participant = decode_box_value("participants", _participant_box(ADDRESS, 4))
+    assert int(participant["tasks_completed"]) == 4
+
+def test_store_groups_participants_by_challenge():
+    store = ChainStateStore()
+    store.put(_participant_name(7, ADDRESS), _participant_box(ADDRESS, 1))
+    store.put(_participant_name(7, OTHER_ADDRESS), _participant_box(OTHER_ADDRESS, 2))
+    store.put(_participant_name(8, ADDRESS), _participant_box(ADDRESS, 5))
+    store.put(b"challenge_states" + _uint64(7), CHALLENGE_STATE.encode([2000000, 0, True]))
+
+    challenge = store.get("participants", 7)
+    assert sorted(challenge) == sorted([ADDRESS, OTHER_ADDRESS])
+    assert int(challenge[OTHER_ADDRESS]["tasks_completed"]) == 2
+    assert int(store.get("participants", 8)[ADDRESS]["tasks_completed"]) == 5
+    assert store.get("challenge_states", 7)["total_staked"] == 2000000
+
+    store.delete(_participant_name(7, ADDRESS))
+    assert list(store.get("participants", 7)) == [OTHER_ADDRESS]
+
+    # Unindexed boxes are ignored
+    store.put(b"chat_messages" + _uint64(7), b"\x00\x00")
+    assert store.get("participants", 9, {}) == {}
+
+def test_bootstrap_mirrors_boxes_and_resumes_from_cursor(db):
+    participant = _participant_name(7, ADDRESS)
+    node = Node({
+        participant: _participant_box(ADDRESS, 1),
+        b"elimination_trackers" + _uint64(7): ELIMINATION_TRACKER.encode([1, 1]),
+        b"chat_messages" + _uint64(7): b"\x00\x00",
+    })
+    indexer = ChainIndexer(APP_ID, store=ChainStateStore(), client=node)
+
+    assert asyncio.run(indexer.bootstrap(db)) == 10
+    assert node.box_reads == 2
+    assert db.query(ChainBox).count() == 2
+    assert indexer.store.round == 10
+
+    # A restart loads the mirror from the database without scanning boxes
+    restarted = ChainIndexer(APP_ID, store=ChainStateStore(), client=node)
+    assert asyncio.run(restarted.bootstrap(db)) == 10
+    assert node.box_reads == 2
+    assert restarted.store.get("elimination_trackers", 7) == {"active_count": 1, "min_tasks": 1}
+    assert int(restarted.store.get("participants", 7)[ADDRESS]["tasks_completed"]) == 1
+
+def test_index_round_refreshes_referenced_boxes(db):
+    participant = _participant_name(7, ADDRESS)
+    tracker = b"elimination_trackers" + _uint64(7)
+    node = Node({participant: _participant_box(ADDRESS, 1), tracker: ELIMINATION_TRACKER.encode([1, 1])})
+    indexer = ChainIndexer(APP_ID, store=ChainStateStore(), client=node)
+    asyncio.run(indexer.bootstrap(db))
+
+    # Round 11 completes a task; another app's reference to the tracker is ignored
+    node.boxes[participant] = _participant_box(ADDRESS, 2)
+    node.boxes[tracker] = ELIMINATION_TRACKER.encode([0, 2])
+    node.blocks[11] = [_app_call(participant), _app_call(tracker, app_id=APP_ID + 1)]
+    assert asyncio.run(indexer.index_round(db, 11)) == 1
+    assert int(indexer.store.get("participants", 7)[ADDRESS]["tasks_completed"]) == 2
+    assert indexer.store.get("elimination_trackers", 7)["active_count"] == 1
+
+    # Round 12 deletes the participant box
+    del node.boxes[participant]
+    node.blocks[12] = [_app_call(participant, tracker)]
+    asyncio.run(indexer.index_round(db, 12))
+    assert indexer.store.get("participants", 7) == {}
+    assert indexer.store.get("elimination_trackers", 7)["active_count"] == 0
+    assert db.query(ChainBox).filter(ChainBox.name == participant).count() == 0
+    assert db.query(ChainCursor).one().round == 12
@@ -0,0 +1,58 @@
+"""
+Chat page reads against the local ledger.
+
+A page holds CHAT_PAGE_SIZE messages of any length, but a return value is
+a single log line of at most 1024 bytes, so get_chat_messages returns as
+much of the page as fits and the id to read on from.
+"""
+
+import asyncio
+
+from algosdk import abi, account
+
+CHALLENGE_ID = 7
+CHAT_PAGE_SIZE = 16
+MAX_LOG_SIZE = 1024
+
+CHAT_MESSAGE_ARRAY_TYPE = abi.ABIType.from_string("(uint64,address,string,uint64,bool)[]")
+CHAT_MESSAGE_PAGE_TYPE = abi.ABIType.from_string("(uint64,(uint64,address,string,uint64,bool)[])")
+
+def _uint64(value):
+    return value.to_bytes(8, "big")
+
+def _put_messages(service, contents):
+    """Write chat pages and the message counter; returns the stored messages."""
+    sender = account.generate_account()[1]
+    messages = [
+        [message_id, sender, content, 1_000 + message_id, False]
+        for message_id, content in enumerate(contents)
+    ]
+    for page_no in range(0, len(messages), CHAT_PAGE_SIZE):
+        page = messages[page_no:page_no + CHAT_PAGE_SIZE]
+        service.algod.put_box(
+            service.app_id,
+            b"chat_messages" + _uint64(CHALLENGE_ID) + _uint64(page_no // CHAT_PAGE_SIZE),
+            CHAT_MESSAGE_ARRAY_TYPE.encode(page)
+        )
+    service.algod.put_box(service.app_id, b"message_counters" + _uint64(CHALLENGE_ID), _uint64(len(messages)))
+    return messages
+
+def test_short_messages_return_the_whole_page(box_read_service):
+    messages = _put_messages(box_read_service, [f"hi {i}" for i in range(CHAT_PAGE_SIZE + 2)])
+
+    (first, second) = asyncio.run(box_read_service.batch_read([
+        ("get_chat_messages", [CHALLENGE_ID, 0]), ("get_chat_messages", [CHALLENGE_ID, 1])
+    ]))
+
+    assert first[0] == CHAT_PAGE_SIZE
+    assert first[1] == messages[:CHAT_PAGE_SIZE]
+    assert second == [CHAT_PAGE_SIZE + 2, messages[CHAT_PAGE_SIZE:]]
+
+def test_long_messages_stop_before_the_log_limit(box_read_service):
+    messages = _put_messages(box_read_service, ["x" * 300] * CHAT_PAGE_SIZE)
+
+    next_offset, page = asyncio.run(box_read_service.batch_read([("get_chat_messages", [CHALLENGE_ID, 0])]))[0]
+
+    # Each message takes 355 bytes of the return value, so two fit
+    assert (next_offset, page) == (2, messages[:2])
+    assert 4 + len(CHAT_MESSAGE_PAGE_TYPE.encode([next_offset, page])) <= MAX_LOG_SIZE
@@ -0,0 +1,118 @@
+"""
+ContractService.complete_tasks_batch against the contract on the local ledger.
+
+The challenge is set up with plain ABI calls, then completions are
+submitted as one group; a completion the contract rejects must not take
+the others down with it.
+"""
+
+import asyncio
+
+import pytest
+from algosdk import account, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, TransactionWithSigner
+)
+
+pytest.importorskip("algopy")
+
+from contracts.smart_contracts.challenge_platform.errors import NOT_PARTICIPATING
+from contracts.local_ledger import CHALLENGE_PLATFORM_SELECTORS
+
+METHODS = {method.name: method for method in CHALLENGE_PLATFORM_SELECTORS.values()}
+
+CHALLENGE_ID = 1
+STAKE_AMOUNT = 100_000
+
+def _call(service, address, signer, method_name, args, payment=0):
+    """Send one ABI call on the ledger, with its payment argument if it takes one."""
+    ledger = service.algod_client
+    method_args = list(args)
+    if payment:
+        pay = transaction.PaymentTxn(
+            address, ledger.suggested_params(), logic.get_application_address(service.app_id), payment
+        )
+        method_args.append(TransactionWithSigner(pay, signer))
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=service.app_id, method=METHODS[method_name], sender=address,
+        sp=ledger.suggested_params(), signer=signer, method_args=method_args
+    )
+    atc.execute(ledger, 4)
+
+def _participant(service):
+    private_key, address = account.generate_account()
+    service.algod_client.fund(address, 10 * STAKE_AMOUNT)
+    return address, AccountTransactionSigner(private_key)
+
+def _completion(address, task_id):
+    return {
+        "challenge_id": CHALLENGE_ID,
+        "task_id": task_id,
+        "participant_address": address,
+        "proof_data": f"proof {task_id}",
+    }
+
+def test_complete_tasks_batch_leaves_out_rejected_completion(contract_service):
+    service = contract_service
+    _call(service, service.platform_address, service.signer, "create_challenge",
+          [CHALLENGE_ID, "Run", "5k a day", STAKE_AMOUNT, 10], payment=STAKE_AMOUNT)
+    member, member_signer = _participant(service)
+    _call(service, member, member_signer, "join_challenge", [CHALLENGE_ID], payment=STAKE_AMOUNT)
+    outsider, _ = _participant(service)
+
+    completions = [_completion(member, 0), _completion(outsider, 1), _completion(member, 2)]
+
+    async def complete():
+        tracker = service.confirmation_tracker
+        await tracker.start()
+        # Let the tracker see the current round before the group is sent
+        await asyncio.sleep(service.algod_client.block_time)
+        try:
+            results = await service.complete_tasks_batch(service.app_id, completions)
+            (participant,) = await service.batch_read([("get_participant", [CHALLENGE_ID, member])])
+        finally:
+            await tracker.stop()
+        return results, participant
+
+    results, participant = asyncio.run(complete())
+
+    assert [result["success"] for result in results] == [True, False, True]
+    assert [result["task_id"] for result in results] == [0, 1, 2]
+    assert NOT_PARTICIPATING in results[1]["error"]
+    assert results[0]["transaction_id"] != results[2]["transaction_id"]
+    assert results[0]["confirmed_round"] == results[2]["confirmed_round"]
+    assert int(participant["tasks_completed"]) == 2
+
+def test_complete_tasks_batch_counts_lease_conflict_only_for_its_completion(contract_service):
+    service = contract_service
+    _call(service, service.platform_address, service.signer, "create_challenge",
+          [CHALLENGE_ID, "Run", "5k a day", STAKE_AMOUNT, 10], payment=STAKE_AMOUNT)
+    member, member_signer = _participant(service)
+    _call(service, member, member_signer, "join_challenge", [CHALLENGE_ID], payment=STAKE_AMOUNT)
+
+    landed = {**_completion(member, 0), "idempotency_key": "complete_task:0"}
+    retry = [landed, {**_completion(member, 1), "idempotency_key": "complete_task:1"}]
+
+    async def complete():
+        tracker = service.confirmation_tracker
+        await tracker.start()
+        await asyncio.sleep(service.algod_client.block_time)
+        try:
+            first = await service.complete_tasks_batch(service.app_id, [landed])
+            # The same completion again, grouped with one that never went out
+            results = await service.complete_tasks_batch(service.app_id, retry)
+            (participant,) = await service.batch_read([("get_participant", [CHALLENGE_ID, member])])
+        finally:
+            await tracker.stop()
+        return first, results, participant
+
+    first, results, participant = asyncio.run(complete())
+
+    assert first[0]["success"]
+    assert [result["success"] for result in results] == [True, True]
+    # Only the leased completion is taken as applied, the other one is sent
+    assert "confirmed_round" not in results[0]
+    assert results[1]["confirmed_round"]
+    assert int(participant["tasks_completed"]) == 2
@@ -0,0 +1,110 @@
+"""
+Confirmation tracker: one round follower resolving every waiter.
+
+A fake client confirms transactions in rounds released by the test.
+"""
+
+import asyncio
+
+from python_api.services.algod_client import AlgodHTTPError
+from python_api.services.confirmation_tracker import ConfirmationTracker
+
+class Node:
+    def __init__(self, last_round=10):
+        self.last_round = last_round
+        self.blocks = {}
+        self.block_reads = 0
+        self.new_block = asyncio.Event()
+
+    def confirm(self, *txids):
+        self.last_round += 1
+        self.blocks[self.last_round] = list(txids)
+        self.new_block.set()
+
+    async def status(self):
+        return {"last-round": self.last_round}
+
+    async def status_after_block(self, round_num):
+        while self.last_round <= round_num:
+            self.new_block.clear()
+            await self.new_block.wait()
+        return {"last-round": self.last_round}
+
+    async def block_txids(self, round_num):
+        self.block_reads += 1
+        return self.blocks.get(round_num, [])
+
+    async def pending_transaction_info(self, txid):
+        for round_num, txids in self.blocks.items():
+            if txid in txids:
+                return {"confirmed-round": round_num}
+        raise AlgodHTTPError(404, "txn does not exist")
+
+def test_resolves_waiters_from_one_block_read():
+    async def run():
+        node = Node()
+        tracker = ConfirmationTracker(node)
+        await tracker.start()
+        await asyncio.sleep(0)
+
+        waiters = asyncio.gather(tracker.wait("a"), tracker.wait("b"), tracker.wait("a"))
+        await asyncio.sleep(0)
+        node.confirm("a", "b")
+        rounds = await asyncio.wait_for(waiters, 1)
+        await tracker.stop()
+        return rounds, node.block_reads
+
+    assert asyncio.run(run()) == ([11, 11, 11], 1)
+
+def test_late_waiter_sees_recent_round():
+    async def run():
+        node = Node()
+        tracker = ConfirmationTracker(node)
+        await tracker.start()
+        await asyncio.sleep(0)
+
+        node.confirm("a")
+        await asyncio.sleep(0.01)
+        confirmed_round = await asyncio.wait_for(tracker.wait("a"), 1)
+        await tracker.stop()
+        return confirmed_round
+
+    assert asyncio.run(run()) == 11
+
+def test_transaction_confirmed_before_the_follower_starts():
+    async def run():
+        node = Node()
+        # Sent and confirmed before anyone waits; the follower starts after it
+        node.confirm("a")
+        tracker = ConfirmationTracker(node)
+        confirmed_round = await asyncio.wait_for(tracker.wait("a", timeout=0.5), 1)
+        await tracker.stop()
+        return confirmed_round
+
+    assert asyncio.run(run()) == 11
+
+def test_transaction_unknown_at_start_confirms_later():
+    async def run():
+        node = Node()
+        tracker = ConfirmationTracker(node)
+        waiter = asyncio.ensure_future(tracker.wait("a"))
+        await asyncio.sleep(0.01)
+        node.confirm("a")
+        confirmed_round = await asyncio.wait_for(waiter, 1)
+        await tracker.stop()
+        return confirmed_round
+
+    assert asyncio.run(run()) == 11
+
+def test_times_out():
+    async def run():
+        tracker = ConfirmationTracker(Node())
+        try:
+            await tracker.wait("a", timeout=0.05)
+        except asyncio.TimeoutError:
+            return True
+        finally:
+            await tracker.stop()
+        return False
+
+    assert asyncio.run(run())
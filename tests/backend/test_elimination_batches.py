@@ -0,0 +1,54 @@
+"""
+ContractService.elimination_batches: due eliminations split into calls
+that fit one call's log budget and one group's reference slots.
+"""
+
+from algosdk import abi, account
+
+from python_api.services.contract_service import ELIMINATION_BATCH_SIZE, MAX_GROUP_SIZE, ContractService
+from python_api.services.resource_planner import box_name
+
+NO_BUCKET = 2**64 - 1
+PARTICIPANT = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)")
+ELIMINATION_TRACKER = abi.ABIType.from_string("(uint64,uint64)")
+COMPLETION_BUCKET = abi.ABIType.from_string("(uint64,uint64,uint64)")
+
+def _eliminations(count):
+    return [
+        {"challenge_id": challenge_id, "lowest_performer": account.generate_account()[1]}
+        for challenge_id in range(1, count + 1)
+    ]
+
+def _index_lone_lowest(service, elimination):
+    """Index the performer as the only participant at its task count, below one at 3."""
+    challenge_id, address = elimination["challenge_id"], elimination["lowest_performer"]
+    store = service.chain_state
+    store.put(box_name("elimination_trackers", challenge_id), ELIMINATION_TRACKER.encode([2, 1]))
+    store.put(
+        box_name("participants", challenge_id, address),
+        PARTICIPANT.encode([address, 1000000, 1700000000, True, 1, 0])
+    )
+    store.put(box_name("completion_buckets", challenge_id, 1), COMPLETION_BUCKET.encode([1, NO_BUCKET, 3]))
+    store.put(box_name("completion_buckets", challenge_id, 3), COMPLETION_BUCKET.encode([1, 1, NO_BUCKET]))
+
+def test_batches_stop_at_the_log_budget():
+    service = ContractService()
+    eliminations = _eliminations(2 * ELIMINATION_BATCH_SIZE + 4)
+
+    batches = service.elimination_batches(eliminations)
+    assert [len(batch) for batch in batches] == [ELIMINATION_BATCH_SIZE, ELIMINATION_BATCH_SIZE, 4]
+    assert [e for batch in batches for e in batch] == eliminations
+
+def test_full_batch_references_fit_one_group():
+    service = ContractService()
+    eliminations = _eliminations(ELIMINATION_BATCH_SIZE)
+    for elimination in eliminations:
+        _index_lone_lowest(service, elimination)
+
+    # Each elimination also relinks the next bucket up
+    (batch,) = service.elimination_batches(eliminations)
+    plan = service._plan([
+        ("process_due_eliminations", [[(e["challenge_id"], e["lowest_performer"]) for e in batch]])
+    ])
+    assert len(plan.boxes) == 7 * ELIMINATION_BATCH_SIZE
+    assert plan.transactions_needed() <= MAX_GROUP_SIZE
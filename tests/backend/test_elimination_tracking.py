@@ -0,0 +1,132 @@
+"""
+Lowest performer tracking against the contract on the local ledger.
+
+The elimination tracker keeps the lowest active task count exact as
+participants complete tasks, leave and are eliminated, including across
+task counts nobody holds. Batched eliminations stay within one call's
+log budget.
+"""
+
+import pytest
+from algosdk import abi, account, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, TransactionWithSigner
+)
+
+pytest.importorskip("algopy")
+
+from contracts.smart_contracts.challenge_platform.errors import NOT_LOWEST_PERFORMER, TOO_MANY_ELIMINATIONS
+from contracts.challenge_contract import ELIMINATION_BATCH_SIZE
+from contracts.local_ledger import CHALLENGE_PLATFORM_SELECTORS
+
+METHODS = {method.name: method for method in CHALLENGE_PLATFORM_SELECTORS.values()}
+
+CHALLENGE_ID = 1
+STAKE_AMOUNT = 100_000
+WEEK = 7 * 86400
+# Bytes an app call may log, and the ParticipantEliminated event with its selector
+MAX_LOG_BYTES = 1024
+ELIMINATED_EVENT_SIZE = 4 + abi.ABIType.from_string("(uint64,address,uint64,uint64,uint64)").byte_len()
+
+def _call(service, address, signer, method_name, args, payment=0):
+    """Send one ABI call on the ledger and return its result."""
+    ledger = service.algod_client
+    method_args = list(args)
+    if payment:
+        pay = transaction.PaymentTxn(
+            address, ledger.suggested_params(), logic.get_application_address(service.app_id), payment
+        )
+        method_args.append(TransactionWithSigner(pay, signer))
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=service.app_id, method=METHODS[method_name], sender=address,
+        sp=ledger.suggested_params(), signer=signer, method_args=method_args
+    )
+    return atc.execute(ledger, 4).abi_results[0].return_value
+
+def _participant(service):
+    private_key, address = account.generate_account()
+    service.algod_client.fund(address, 10 * STAKE_AMOUNT)
+    return address, AccountTransactionSigner(private_key)
+
+def _complete_tasks(service, participant, count):
+    address, signer = participant
+    for task_id in range(count):
+        _call(service, address, signer, "complete_task", [CHALLENGE_ID, task_id, address, f"proof {task_id}"])
+
+def _tracker(service):
+    """(active_count, min_tasks)"""
+    return tuple(_call(
+        service, service.platform_address, service.signer, "get_elimination_tracker", [CHALLENGE_ID]
+    ))
+
+def _eliminate(service, participant):
+    _call(service, service.platform_address, service.signer,
+          "process_weekly_elimination", [CHALLENGE_ID, participant[0]])
+
+def test_lowest_task_count_stays_exact(contract_service):
+    service = contract_service
+    ledger = service.algod_client
+    creator = (service.platform_address, service.signer)
+    _call(service, *creator, "create_challenge",
+          [CHALLENGE_ID, "Run", "5k a day", STAKE_AMOUNT, 10], payment=STAKE_AMOUNT)
+    joiners = [_participant(service) for _ in range(4)]
+    for address, signer in joiners:
+        _call(service, address, signer, "join_challenge", [CHALLENGE_ID], payment=STAKE_AMOUNT)
+
+    # Task counts 5, 1, 0, 0 and a participant who leaves at 0
+    most, middle, least, last, leaver = creator, *joiners
+    _complete_tasks(service, most, 5)
+    _complete_tasks(service, middle, 1)
+    assert _tracker(service) == (5, 0)
+    _call(service, *leaver, "leave_challenge", [CHALLENGE_ID])
+    assert _tracker(service) == (4, 0)
+
+    # Week 1: only a participant with no tasks can go; another one is left at 0
+    ledger.advance_time(WEEK + 60)
+    for named in (most, middle):
+        with pytest.raises(Exception, match=NOT_LOWEST_PERFORMER):
+            _eliminate(service, named)
+    _eliminate(service, least)
+    assert _tracker(service) == (3, 0)
+
+    # Week 2: the last participant at 0 goes, so the lowest count moves up to 1
+    ledger.advance_time(WEEK)
+    _eliminate(service, last)
+    assert _tracker(service) == (2, 1)
+
+    # Nobody holds 4, the lowest count follows the participant from 1 to 3
+    _complete_tasks(service, middle, 2)
+    assert _tracker(service) == (2, 3)
+
+    # Week 3: the lowest count jumps over the gap straight to 5
+    ledger.advance_time(WEEK)
+    with pytest.raises(Exception, match=NOT_LOWEST_PERFORMER):
+        _eliminate(service, most)
+    _eliminate(service, middle)
+    assert _tracker(service) == (1, 5)
+
+def test_due_eliminations_fill_at_most_the_log_budget(contract_service):
+    service = contract_service
+    creator = (service.platform_address, service.signer)
+    joiners = []
+    for challenge_id in range(1, ELIMINATION_BATCH_SIZE + 1):
+        _call(service, *creator, "create_challenge",
+              [challenge_id, "Run", "5k a day", STAKE_AMOUNT, 10], payment=STAKE_AMOUNT)
+        joiner = _participant(service)
+        _call(service, *joiner, "join_challenge", [challenge_id], payment=STAKE_AMOUNT)
+        joiners.append((challenge_id, joiner[0]))
+    service.algod_client.advance_time(WEEK + 60)
+
+    # One event per elimination plus the returned ids (length prefix and 8 bytes each)
+    def log_bytes(count):
+        return count * ELIMINATED_EVENT_SIZE + 4 + 2 + 8 * count
+    assert log_bytes(ELIMINATION_BATCH_SIZE) <= MAX_LOG_BYTES < log_bytes(ELIMINATION_BATCH_SIZE + 1)
+
+    with pytest.raises(Exception, match=TOO_MANY_ELIMINATIONS):
+        _call(service, *creator, "process_due_eliminations", [joiners + joiners[:1]])
+
+    # A full batch eliminates in every challenge
+    processed = _call(service, *creator, "process_due_eliminations", [joiners])
+    assert processed == [challenge_id for challenge_id, _ in joiners]
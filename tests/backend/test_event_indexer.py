@@ -0,0 +1,145 @@
+"""
+ARC-28 event decoding and the append-only event index.
+
+Blocks are built in algod's JSON form from ABI-encoded event structs; the
+index lives in in-memory SQLite.
+"""
+
+import asyncio
+import base64
+import hashlib
+
+import pytest
+from algosdk import abi, account
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from python_api.models import ChainCursor, ChainEvent
+from python_api.services.event_decoder import (
+    EVENT_TYPES, block_events, decode_event, event_selector, event_signature,
+    replay_proof_commitment
+)
+from python_api.services.event_indexer import EventIndexer
+
+APP_ID = 5
+ADDRESS = account.generate_account()[1]
+RETURN_LOG = bytes.fromhex("151f7c75") + (3).to_bytes(8, "big")
+
+def _event(name, values):
+    _, _, tuple_type = EVENT_TYPES[event_selector(name)]
+    return event_selector(name) + tuple_type.encode(values)
+
+def _b64(log):
+    return base64.b64encode(log).decode()
+
+def _app_call(app_id, *logs, inner=()):
+    apply_data = {"lg": [_b64(log) for log in logs]}
+    if inner:
+        apply_data["itx"] = list(inner)
+    return {"txn": {"type": "appl", "apid": app_id}, "dt": apply_data}
+
+BLOCK = {"block": {"txns": [
+    {"txn": {"type": "pay"}},
+    _app_call(APP_ID, _event("ParticipantJoined", [7, ADDRESS, 95, 3, 100]), RETURN_LOG),
+    # Another app calling the platform logs through an inner transaction
+    _app_call(9, inner=[_app_call(APP_ID, _event("PoolPaid", [7, ADDRESS, 1000, 1]))]),
+    _app_call(6, _event("PoolPaid", [8, ADDRESS, 1, 1])),
+    _app_call(APP_ID, RETURN_LOG, _event("ChatMessageSent", [8, 0, ADDRESS, 200, "hi"])),
+]}}
+
+class Node:
+    def __init__(self, blocks, last_round=10):
+        self.blocks = blocks
+        self.last_round = last_round
+
+    async def status(self):
+        return {"last-round": self.last_round}
+
+    async def block(self, round_num):
+        return self.blocks.get(round_num, {"block": {}})
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ChainEvent.__table__.create(engine)
+    ChainCursor.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+def test_event_selector():
+    assert event_signature("PoolPaid") == "PoolPaid(uint64,address,uint64,uint64)"
+    assert event_selector("PoolPaid") == hashlib.new(
+        "sha512_256", b"PoolPaid(uint64,address,uint64,uint64)"
+    ).digest()[:4]
+    assert len(EVENT_TYPES) == 5
+
+def test_decode_event():
+    log = _event("TaskCompleted", [7, ADDRESS, 2, 1, 1700000000, 3, "proof"])
+    assert decode_event(log) == {"name": "TaskCompleted", "fields": {
+        "challenge_id": 7, "participant": ADDRESS, "task_id": 2, "week": 1,
+        "completed_at": 1700000000, "tasks_completed": 3, "proof_data": "proof",
+    }}
+
+    assert decode_event(RETURN_LOG) is None
+    # A known selector followed by bytes that do not decode is not an event
+    assert decode_event(event_selector("TaskCompleted") + b"\x00") is None
+
+def test_block_events_in_block_order():
+    events = [(e["name"], e["fields"]["challenge_id"], e["position"], e["log_index"])
+              for e in block_events(BLOCK, APP_ID)]
+
+    # Log indexes count every log of the transaction, return values included
+    assert events == [
+        ("ParticipantJoined", 7, 1, 0),
+        ("PoolPaid", 7, 2, 0),
+        ("ChatMessageSent", 8, 4, 1),
+    ]
+
+def test_replay_proof_commitment():
+    completions = [
+        {"task_id": 1, "completed_at": 500, "proof_data": "p1"},
+        {"task_id": 2, "completed_at": 600, "proof_data": "ünïcode"},
+    ]
+    expected = bytes(32)
+    for completion in completions:
+        expected = hashlib.sha256(
+            expected
+            + abi.UintType(64).encode(completion["task_id"])
+            + abi.UintType(64).encode(completion["completed_at"])
+            + abi.StringType().encode(completion["proof_data"])
+        ).digest()
+
+    assert replay_proof_commitment(completions) == expected
+    assert replay_proof_commitment([]) == bytes(32)
+
+def test_index_round_appends_once(db):
+    indexer = EventIndexer(APP_ID, client=Node({11: BLOCK}))
+
+    assert asyncio.run(indexer.bootstrap(db)) == 10
+    assert asyncio.run(indexer.index_round(db, 11)) == 3
+    # Re-indexing a round after a crash leaves the index unchanged
+    assert asyncio.run(indexer.index_round(db, 11)) == 3
+    assert db.query(ChainEvent).count() == 3
+    assert db.query(ChainCursor).one().round == 11
+
+    # A restart resumes from the cursor instead of the current round
+    indexer.client.last_round = 20
+    assert asyncio.run(indexer.bootstrap(db)) == 11
+
+def test_list_events(db):
+    indexer = EventIndexer(APP_ID, client=Node({11: BLOCK, 12: BLOCK}))
+    asyncio.run(indexer.bootstrap(db))
+    asyncio.run(indexer.index_round(db, 11))
+    asyncio.run(indexer.index_round(db, 12))
+
+    events = indexer.list_events(db, 7)
+    assert [(e["name"], e["round"], e["position"]) for e in events] == [
+        ("ParticipantJoined", 11, 1), ("PoolPaid", 11, 2),
+        ("ParticipantJoined", 12, 1), ("PoolPaid", 12, 2),
+    ]
+    assert events[1]["fields"] == {"challenge_id": 7, "winner": ADDRESS, "amount": 1000, "rank": 1}
+
+    assert [e["round"] for e in indexer.list_events(db, 7, name="PoolPaid", after_round=11)] == [12]
+    assert len(indexer.list_events(db, 7, limit=1)) == 1
+    assert [e["fields"]["content"] for e in indexer.list_events(db, 8)] == ["hi", "hi"]
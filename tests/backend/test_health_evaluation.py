@@ -0,0 +1,56 @@
+"""
+HealthEvaluationService.evaluate: task thresholds against aggregated samples.
+"""
+
+import numpy as np
+
+from python_api.services.health_evaluation_service import HealthEvaluationService
+
+# Data type indexes: 0 = heart_rate (peak), 1 = steps (sum)
+HEART_RATE, STEPS = 0, 1
+MAX_TYPES = np.array([True, False])
+
+def _evaluate(samples, task_types, task_required, num_participants):
+    participants = np.array([p for p, _, _ in samples], dtype=np.int64)
+    types = np.array([t for _, t, _ in samples], dtype=np.int64)
+    values = np.array([v for _, _, v in samples], dtype=np.int64)
+    return HealthEvaluationService.evaluate(
+        participants, types, values,
+        np.array(task_types, dtype=np.int64), np.array(task_required, dtype=np.int64),
+        num_participants=num_participants, max_types=MAX_TYPES
+    )
+
+def test_sums_steps_and_takes_peak_heart_rate():
+    samples = [(0, STEPS, 6000), (0, STEPS, 4000), (0, HEART_RATE, 120), (0, HEART_RATE, 150)]
+    satisfied = _evaluate(samples, [STEPS, STEPS, HEART_RATE, HEART_RATE], [10000, 10001, 150, 151], 1)
+
+    assert satisfied.dtype == np.bool_
+    assert satisfied.tolist() == [[True, False, True, False]]
+
+def test_multiple_participants():
+    samples = [
+        (0, STEPS, 12000),
+        (1, STEPS, 3000), (1, STEPS, 3000), (1, HEART_RATE, 170),
+        (2, HEART_RATE, 90),
+    ]
+    satisfied = _evaluate(samples, [STEPS, HEART_RATE], [5000, 160], 4)
+
+    assert satisfied.tolist() == [
+        [True, False],
+        [True, True],
+        [False, False],
+        # A participant without samples satisfies nothing
+        [False, False],
+    ]
+
+def test_no_samples():
+    satisfied = _evaluate([], [STEPS, HEART_RATE], [1, 1], 2)
+    assert satisfied.tolist() == [[False, False], [False, False]]
+
+def test_zero_threshold_is_met_without_samples():
+    assert _evaluate([], [STEPS], [0], 1).tolist() == [[True]]
+
+def test_sums_exactly_beyond_float_precision():
+    # 2**53 + 1 is not representable as a float64
+    samples = [(0, STEPS, 2**53), (0, STEPS, 1)]
+    assert _evaluate(samples, [STEPS], [2**53 + 1], 1).tolist() == [[True]]
@@ -0,0 +1,85 @@
+"""
+Platform interest accrual against the contract on the local ledger.
+
+Interest is booked per whole day on the total active stake through the
+cumulative interest index; partial days carry over to the next accrual.
+"""
+
+import pytest
+from algosdk import account, logic, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, TransactionWithSigner
+)
+
+pytest.importorskip("algopy")
+
+from contracts.challenge_contract import INTEREST_INDEX_SCALE, SECONDS_PER_DAY
+from contracts.local_ledger import CHALLENGE_PLATFORM_SELECTORS
+
+METHODS = {method.name: method for method in CHALLENGE_PLATFORM_SELECTORS.values()}
+
+CHALLENGE_ID = 1
+STAKE_AMOUNT = 100_000
+# 5% platform fee, 1% daily interest
+NET_STAKE = STAKE_AMOUNT - STAKE_AMOUNT * 500 // 10000
+DAILY_INDEX_DELTA = 100 * INTEREST_INDEX_SCALE // 10000
+
+def _call(service, address, signer, method_name, args=(), payment=0):
+    """Send one ABI call on the ledger and return its result."""
+    ledger = service.algod_client
+    method_args = list(args)
+    if payment:
+        pay = transaction.PaymentTxn(
+            address, ledger.suggested_params(), logic.get_application_address(service.app_id), payment
+        )
+        method_args.append(TransactionWithSigner(pay, signer))
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=service.app_id, method=METHODS[method_name], sender=address,
+        sp=ledger.suggested_params(), signer=signer, method_args=method_args
+    )
+    return atc.execute(ledger, 4).abi_results[0].return_value
+
+def _interest(staked, days):
+    return staked * days * DAILY_INDEX_DELTA // INTEREST_INDEX_SCALE
+
+def _revenue(service):
+    fees, interest, last_updated = _call(
+        service, service.platform_address, service.signer, "get_platform_revenue"
+    )
+    return fees, interest, last_updated
+
+def test_interest_accrues_on_active_stake_by_whole_days(contract_service):
+    service = contract_service
+    ledger = service.algod_client
+    platform, signer = service.platform_address, service.signer
+
+    _call(service, platform, signer, "create_challenge",
+          [CHALLENGE_ID, "Run", "5k a day", STAKE_AMOUNT, 10], payment=STAKE_AMOUNT)
+    _, interest, started_at = _revenue(service)
+    assert interest == 0
+
+    # Three days and an hour: three days of interest, the hour carries over
+    ledger.advance_time(3 * SECONDS_PER_DAY + 3600)
+    _call(service, platform, signer, "calculate_platform_revenue")
+    _, interest, last_updated = _revenue(service)
+    assert interest == _interest(NET_STAKE, 3)
+    assert last_updated == started_at + 3 * SECONDS_PER_DAY
+
+    # Accruing again within the same day books nothing
+    _call(service, platform, signer, "calculate_platform_revenue")
+    assert _revenue(service)[1] == _interest(NET_STAKE, 3)
+
+    # A join settles the old total first, then the next day accrues on both stakes
+    private_key, member = account.generate_account()
+    ledger.fund(member, 10 * STAKE_AMOUNT)
+    _call(service, member, AccountTransactionSigner(private_key), "join_challenge",
+          [CHALLENGE_ID], payment=STAKE_AMOUNT)
+    ledger.advance_time(SECONDS_PER_DAY - 3600)
+    _call(service, platform, signer, "calculate_platform_revenue")
+
+    fees, interest, last_updated = _revenue(service)
+    assert interest == _interest(NET_STAKE, 3) + _interest(2 * NET_STAKE, 1)
+    assert last_updated == started_at + 4 * SECONDS_PER_DAY
+    assert fees == 2 * (STAKE_AMOUNT - NET_STAKE)
@@ -0,0 +1,108 @@
+"""
+Suggested params cache: one fetch per round, shared by every builder.
+
+A fake client counts the fetches and serves rounds on demand.
+"""
+
+import asyncio
+
+from algosdk.transaction import SuggestedParams
+
+from python_api.services import params_cache
+from python_api.services.contract_service import ContractService
+from python_api.services.params_cache import SuggestedParamsCache
+
+class Node:
+    def __init__(self, round_num=100):
+        self.round = round_num
+        self.fetches = 0
+        self.rounds = asyncio.Queue()
+
+    async def suggested_params(self):
+        self.fetches += 1
+        # Give concurrent callers the chance to queue on the cache lock
+        await asyncio.sleep(0)
+        return SuggestedParams(
+            fee=1000, first=self.round, last=self.round + 1000,
+            gh="genesis", gen="test-v1", flat_fee=True, min_fee=1000
+        )
+
+    async def status_after_block(self, round_num):
+        self.round = await self.rounds.get()
+        return {"last-round": self.round}
+
+def test_params_are_fetched_once_while_fresh():
+    node = Node()
+    cache = SuggestedParamsCache(node, ttl=60)
+
+    async def run():
+        return await asyncio.gather(*[cache.get() for _ in range(5)])
+
+    results = asyncio.run(run())
+
+    assert node.fetches == 1
+    assert {params.first for params in results} == {100}
+    # Callers get copies, so one builder cannot change another's params
+    results[0].fee = 5000
+    assert cache.peek().fee == 1000
+
+def test_stale_params_are_fetched_again(monkeypatch):
+    node = Node()
+    cache = SuggestedParamsCache(node, ttl=4)
+    now = [1000.0]
+    monkeypatch.setattr(params_cache.time, "monotonic", lambda: now[0])
+
+    asyncio.run(cache.get())
+    now[0] += 3.9
+    asyncio.run(cache.get())
+    assert node.fetches == 1
+
+    node.round = 102
+    now[0] += 0.2
+    assert asyncio.run(cache.get()).first == 102
+    assert node.fetches == 2
+
+def test_peek_is_empty_before_the_first_load():
+    cache = SuggestedParamsCache(Node())
+
+    assert cache.peek() is None
+    assert cache.genesis_id is None
+
+def test_background_refresh_moves_the_validity_window_without_fetching():
+    node = Node()
+    cache = SuggestedParamsCache(node, ttl=60)
+
+    async def advance_to(round_num):
+        await node.rounds.put(round_num)
+        # Let the refresh task take the round and apply it
+        for _ in range(5):
+            await asyncio.sleep(0)
+        params = cache.peek()
+        return params.first, params.last, node.fetches
+
+    async def run():
+        await cache.start()
+        try:
+            return [
+                await advance_to(round_num)
+                for round_num in (101, 102, 100 + params_cache.PARAMS_FULL_REFRESH_ROUNDS)
+            ]
+        finally:
+            await cache.stop()
+
+    steps = asyncio.run(run())
+
+    assert steps[0] == (101, 101 + params_cache.VALIDITY_ROUNDS, 1)
+    assert steps[1] == (102, 102 + params_cache.VALIDITY_ROUNDS, 1)
+    # Every PARAMS_FULL_REFRESH_ROUNDS rounds fee and genesis are re-read
+    assert steps[2][2] == 2
+
+def test_contract_service_loads_params_on_first_use():
+    node = Node()
+    service = ContractService()
+    service.params_cache = SuggestedParamsCache(node, ttl=60)
+
+    params = asyncio.run(service._cached_params())
+
+    assert params.first == 100
+    assert node.fetches == 1
@@ -0,0 +1,95 @@
+"""
+Resource planner: completion bucket keys follow the indexed bucket links.
+
+The chain state store is filled with encoded boxes, as the indexer would.
+"""
+
+import pytest
+from algosdk import abi, account
+
+from python_api.services.chain_indexer import ChainStateStore
+from python_api.services.contract_service import ContractService
+from python_api.services.resource_planner import PlannedCall, ResourcePlanner, box_name
+
+CHALLENGE_ID = 7
+NO_BUCKET = 2**64 - 1
+PARTICIPANT = abi.ABIType.from_string("(address,uint64,uint64,bool,uint64,uint64)")
+ELIMINATION_TRACKER = abi.ABIType.from_string("(uint64,uint64)")
+COMPLETION_BUCKET = abi.ABIType.from_string("(uint64,uint64,uint64)")
+
+@pytest.fixture
+def service():
+    return ContractService()
+
+def _store(tasks_by_address):
+    """Indexed state of one challenge whose active participants have these task counts."""
+    store = ChainStateStore()
+    counts = sorted(set(tasks_by_address.values()))
+    store.put(
+        box_name("elimination_trackers", CHALLENGE_ID),
+        ELIMINATION_TRACKER.encode([len(tasks_by_address), counts[0] if counts else 0])
+    )
+    for address, tasks in tasks_by_address.items():
+        store.put(
+            box_name("participants", CHALLENGE_ID, address),
+            PARTICIPANT.encode([address, 1000000, 1700000000, True, tasks, 0])
+        )
+    for index, tasks in enumerate(counts):
+        lower = counts[index - 1] if index > 0 else NO_BUCKET
+        higher = counts[index + 1] if index + 1 < len(counts) else NO_BUCKET
+        count = list(tasks_by_address.values()).count(tasks)
+        store.put(
+            box_name("completion_buckets", CHALLENGE_ID, tasks),
+            COMPLETION_BUCKET.encode([count, lower, higher])
+        )
+    return store
+
+def _buckets(plan):
+    prefix = b"completion_buckets" + CHALLENGE_ID.to_bytes(8, "big")
+    return sorted(int.from_bytes(name[len(prefix):], "big") for name in plan.boxes if name.startswith(prefix))
+
+def _plan(service, store, *calls):
+    planned = [PlannedCall(service.get_method(name), args, sender) for name, args, sender in calls]
+    return ResourcePlanner(store).plan(planned)
+
+def test_completion_links_new_bucket_and_unlinks_empty_one(service):
+    low, high, sender = (account.generate_account()[1] for _ in range(3))
+    store = _store({low: 1, high: 6})
+
+    # 1 -> 2: bucket 2 is linked between 1 and 6, then 1 empties and 2 becomes the lowest
+    plan = _plan(service, store, ("complete_task", [CHALLENGE_ID, 1, low, "proof"], sender))
+    assert _buckets(plan) == [1, 2, 6]
+
+def test_completion_into_existing_bucket_touches_only_both_buckets(service):
+    first, second, third, sender = (account.generate_account()[1] for _ in range(4))
+    store = _store({first: 1, second: 1, third: 2})
+
+    plan = _plan(service, store, ("complete_task", [CHALLENGE_ID, 1, first, "proof"], sender))
+    assert _buckets(plan) == [1, 2]
+
+def test_elimination_touches_lowest_bucket_and_next_one_only(service):
+    addresses = [account.generate_account()[1] for _ in range(4)]
+    store = _store({addresses[0]: 0, addresses[1]: 40, addresses[2]: 41, addresses[3]: 90})
+
+    plan = _plan(service, store, ("process_weekly_elimination", [CHALLENGE_ID, addresses[0]], addresses[3]))
+    assert _buckets(plan) == [0, 40]
+
+def test_group_plans_on_buckets_left_by_earlier_calls(service):
+    low, high, sender = (account.generate_account()[1] for _ in range(3))
+    store = _store({low: 0, high: 3})
+
+    # After the first completion bucket 1 is the lowest, so the second
+    # completion links bucket 2 between 1 and 3 and empties 1
+    plan = _plan(
+        service, store,
+        ("complete_task", [CHALLENGE_ID, 1, low, "proof"], sender),
+        ("complete_task", [CHALLENGE_ID, 1, low, "proof"], sender),
+    )
+    assert _buckets(plan) == [0, 1, 2, 3]
+
+def test_join_links_bucket_zero_below_lowest(service):
+    member, joiner = (account.generate_account()[1] for _ in range(2))
+    store = _store({member: 2})
+
+    plan = _plan(service, store, ("join_challenge", [CHALLENGE_ID], joiner))
+    assert _buckets(plan) == [0, 2]
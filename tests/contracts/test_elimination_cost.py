@@ -0,0 +1,287 @@
+"""
+Opcode cost regression test for ChallengePlatform.process_weekly_elimination.
+
+Elimination must cost the same number of opcodes at 10 and 30 participants,
+and the lowest task count it tracks must stay right as participants with
+different task counts are eliminated. Runs against an AlgoKit LocalNet (dev mode) and the TEAL written by
+contracts/build.py; skipped when either is unavailable.
+"""
+
+import base64
+import os
+from pathlib import Path
+
+import pytest
+from algosdk import abi, account, encoding, logic
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+)
+from algosdk.kmd import KMDClient
+from algosdk.transaction import (
+    ApplicationCreateTxn, OnComplete, PaymentTxn, StateSchema, wait_for_confirmation
+)
+from algosdk.v2client import algod
+from algosdk.v2client.models import SimulateRequest
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "http://localhost:4001")
+KMD_SERVER = os.getenv("KMD_SERVER", "http://localhost:4002")
+LOCALNET_TOKEN = "a" * 64
+
+ARTIFACTS_DIR = Path(__file__).parent.parent.parent / "contracts" / "artifacts"
+
+CREATE_CHALLENGE = abi.Method.from_signature("create_challenge(uint64,string,string,uint64,uint64,pay)void")
+JOIN_CHALLENGE = abi.Method.from_signature("join_challenge(uint64,pay)void")
+COMPLETE_TASK = abi.Method.from_signature("complete_task(uint64,uint64,address,string)void")
+PROCESS_WEEKLY_ELIMINATION = abi.Method.from_signature("process_weekly_elimination(uint64,address)void")
+OP_UP = abi.Method.from_signature("op_up()void")
+
+# Box references one transaction can carry
+MAX_TXN_REFS = 8
+
+# contracts/smart_contracts/challenge_platform/errors.py
+NOT_LOWEST_PERFORMER = "Another participant has fewer completed tasks"
+
+STAKE_AMOUNT = 100_000
+EIGHT_DAYS = 8 * 86400
+FIFTEEN_DAYS = 15 * 86400
+
+def _uint64(value):
+    return value.to_bytes(8, "big")
+
+def _address(address):
+    return encoding.decode_address(address)
+
+def _challenge_boxes(challenge_id, address):
+    """Boxes touched by create_challenge / join_challenge for one address."""
+    cid = _uint64(challenge_id)
+    return [
+        b"challenge_metadata" + cid,
+        b"challenge_states" + cid,
+        b"participants" + cid + _address(address),
+        b"participant_index" + cid,
+        b"participant_counts" + cid,
+        b"elimination_trackers" + cid,
+        b"completion_buckets" + cid + _uint64(0),
+        b"deposited" + _address(address),
+    ]
+
+@pytest.fixture(scope="module")
+def algod_client():
+    client = algod.AlgodClient(LOCALNET_TOKEN, ALGOD_SERVER)
+    try:
+        client.status()
+    except Exception:
+        pytest.skip(f"LocalNet algod not reachable at {ALGOD_SERVER}")
+    return client
+
+@pytest.fixture(scope="module")
+def dispenser():
+    kmd = KMDClient(LOCALNET_TOKEN, KMD_SERVER)
+    try:
+        wallet_id = next(
+            w["id"] for w in kmd.list_wallets() if w["name"] == "unencrypted-default-wallet"
+        )
+    except Exception:
+        pytest.skip(f"LocalNet kmd not reachable at {KMD_SERVER}")
+
+    handle = kmd.init_wallet_handle(wallet_id, "")
+    try:
+        address = kmd.list_keys(handle)[0]
+        private_key = kmd.export_key(handle, "", address)
+    finally:
+        kmd.release_wallet_handle(handle)
+    return address, private_key
+
+@pytest.fixture(scope="module")
+def app(algod_client, dispenser):
+    approval_path = ARTIFACTS_DIR / "challenge_platform_approval.teal"
+    clear_path = ARTIFACTS_DIR / "challenge_platform_clear.teal"
+    if not approval_path.exists():
+        pytest.skip("Contract artifacts missing, run contracts/build.py first")
+
+    approval = base64.b64decode(algod_client.compile(approval_path.read_text())["result"])
+    clear = base64.b64decode(algod_client.compile(clear_path.read_text())["result"])
+
+    address, private_key = dispenser
+    txn = ApplicationCreateTxn(
+        sender=address,
+        sp=algod_client.suggested_params(),
+        on_complete=OnComplete.NoOpOC,
+        approval_program=approval,
+        clear_program=clear,
+        global_schema=StateSchema(num_uints=8, num_byte_slices=8),
+        local_schema=StateSchema(num_uints=0, num_byte_slices=0),
+        extra_pages=3
+    )
+    txid = algod_client.send_transaction(txn.sign(private_key))
+    app_id = wait_for_confirmation(algod_client, txid, 4)["application-index"]
+
+    # Box MBR is paid from the app account
+    fund = PaymentTxn(address, algod_client.suggested_params(), logic.get_application_address(app_id), 50_000_000)
+    wait_for_confirmation(algod_client, algod_client.send_transaction(fund.sign(private_key)), 4)
+
+    return app_id
+
+def _new_account(algod_client, dispenser):
+    private_key, address = account.generate_account()
+    funder, funder_key = dispenser
+    txn = PaymentTxn(funder, algod_client.suggested_params(), address, 1_000_000)
+    wait_for_confirmation(algod_client, algod_client.send_transaction(txn.sign(funder_key)), 4)
+    return address, AccountTransactionSigner(private_key)
+
+def _staked_call(algod_client, app_id, method, challenge_id, address, signer, args):
+    sp = algod_client.suggested_params()
+    payment = TransactionWithSigner(
+        PaymentTxn(address, sp, logic.get_application_address(app_id), STAKE_AMOUNT), signer
+    )
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=method,
+        sender=address,
+        sp=sp,
+        signer=signer,
+        method_args=[*args, payment],
+        boxes=[(app_id, name) for name in _challenge_boxes(challenge_id, address)]
+    )
+    atc.execute(algod_client, 4)
+
+def _create_challenge(algod_client, dispenser, app_id, challenge_id, participant_count):
+    creator, creator_signer = _new_account(algod_client, dispenser)
+    _staked_call(
+        algod_client, app_id, CREATE_CHALLENGE, challenge_id, creator, creator_signer,
+        [challenge_id, f"Challenge {challenge_id}", "cost test", STAKE_AMOUNT, participant_count]
+    )
+
+    participants = [(creator, creator_signer)]
+    for _ in range(participant_count - 1):
+        address, signer = _new_account(algod_client, dispenser)
+        _staked_call(
+            algod_client, app_id, JOIN_CHALLENGE, challenge_id, address, signer,
+            [challenge_id]
+        )
+        participants.append((address, signer))
+    return participants
+
+def _reported_boxes(group):
+    """Boxes a simulated group used without referencing them."""
+    reports = [group.get("unnamed-resources-accessed", {})] + [
+        result.get("unnamed-resources-accessed", {}) for result in group["txn-results"]
+    ]
+    return [base64.b64decode(box["name"]) for report in reports for box in report.get("boxes", [])]
+
+def _send_call(algod_client, app_id, method, sender, signer, args):
+    """Simulate a call, then send it with the box references its simulation reported.
+
+    A completion can touch up to four buckets, so references past the eight
+    one call holds go on an op_up call in the same group.
+    """
+    def compose(call_signer, boxes):
+        sp = algod_client.suggested_params()
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            app_id=app_id, method=method, sender=sender, sp=sp, signer=call_signer,
+            method_args=args, boxes=[(app_id, name) for name in boxes[:MAX_TXN_REFS]]
+        )
+        if len(boxes) > MAX_TXN_REFS:
+            atc.add_method_call(
+                app_id=app_id, method=OP_UP, sender=sender, sp=sp, signer=call_signer,
+                boxes=[(app_id, name) for name in boxes[MAX_TXN_REFS:]]
+            )
+        return atc
+
+    group = compose(EmptySigner(), []).simulate(
+        algod_client,
+        SimulateRequest(txn_groups=[], allow_empty_signatures=True, allow_unnamed_resources=True)
+    ).simulate_response["txn-groups"][0]
+    assert "failure-message" not in group, group.get("failure-message")
+    compose(signer, _reported_boxes(group)).execute(algod_client, 4)
+
+def _complete_tasks(algod_client, app_id, challenge_id, address, signer, count):
+    for task_id in range(count):
+        _send_call(
+            algod_client, app_id, COMPLETE_TASK, address, signer,
+            [challenge_id, task_id, address, f"proof {task_id}"]
+        )
+
+def _elimination_call(app_id, challenge_id, lowest_performer, sender, sp, signer, boxes=()):
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id=app_id,
+        method=PROCESS_WEEKLY_ELIMINATION,
+        sender=sender,
+        sp=sp,
+        signer=signer,
+        method_args=[challenge_id, lowest_performer],
+        boxes=[(app_id, name) for name in boxes]
+    )
+    return atc
+
+def _simulate_elimination(algod_client, app_id, challenge_id, lowest_performer, sender):
+    atc = _elimination_call(
+        app_id, challenge_id, lowest_performer, sender, algod_client.suggested_params(), EmptySigner()
+    )
+    result = atc.simulate(
+        algod_client,
+        SimulateRequest(txn_groups=[], allow_empty_signatures=True, allow_unnamed_resources=True)
+    )
+    return result.simulate_response["txn-groups"][0]
+
+def _elimination_cost(algod_client, app_id, challenge_id, lowest_performer, sender):
+    group = _simulate_elimination(algod_client, app_id, challenge_id, lowest_performer, sender)
+    assert "failure-message" not in group, group.get("failure-message")
+    return group["app-budget-consumed"]
+
+def _eliminate(algod_client, app_id, challenge_id, lowest_performer, dispenser):
+    address, private_key = dispenser
+    _send_call(
+        algod_client, app_id, PROCESS_WEEKLY_ELIMINATION, address, AccountTransactionSigner(private_key),
+        [challenge_id, lowest_performer]
+    )
+
+def _elimination_tracker(algod_client, app_id, challenge_id):
+    """(active_count, min_tasks) read straight from the elimination_trackers box."""
+    box = algod_client.application_box_by_name(app_id, b"elimination_trackers" + _uint64(challenge_id))
+    return abi.ABIType.from_string("(uint64,uint64)").decode(base64.b64decode(box["value"]))
+
+def test_elimination_cost_is_constant_in_participants(algod_client, dispenser, app):
+    participants_10 = _create_challenge(algod_client, dispenser, app, 10, 10)
+    participants_30 = _create_challenge(algod_client, dispenser, app, 30, 30)
+
+    # Elimination is only allowed once a week has passed
+    algod_client.set_timestamp_offset(EIGHT_DAYS)
+    try:
+        # Nobody completed a task, so the last joiner is a lowest performer
+        cost_10 = _elimination_cost(algod_client, app, 10, participants_10[-1][0], dispenser[0])
+        cost_30 = _elimination_cost(algod_client, app, 30, participants_30[-1][0], dispenser[0])
+    finally:
+        algod_client.set_timestamp_offset(0)
+
+    assert cost_10 == cost_30
+
+def test_elimination_follows_mixed_task_counts(algod_client, dispenser, app):
+    # Task counts 2, 1 and 0: each count has its own bucket
+    participants = _create_challenge(algod_client, dispenser, app, 40, 3)
+    for (address, signer), count in zip(participants, (2, 1, 0)):
+        _complete_tasks(algod_client, app, 40, address, signer, count)
+    (most, _), (middle, _), (least, _) = participants
+
+    algod_client.set_timestamp_offset(EIGHT_DAYS)
+    try:
+        # Naming anyone but the participant with the fewest tasks is rejected
+        for named in (most, middle):
+            group = _simulate_elimination(algod_client, app, 40, named, dispenser[0])
+            assert NOT_LOWEST_PERFORMER in group.get("failure-message", "")
+
+        # The lowest bucket is now empty, so the next count up is the lowest
+        _eliminate(algod_client, app, 40, least, dispenser)
+        assert _elimination_tracker(algod_client, app, 40) == [2, 1]
+
+        algod_client.set_timestamp_offset(FIFTEEN_DAYS)
+        group = _simulate_elimination(algod_client, app, 40, most, dispenser[0])
+        assert NOT_LOWEST_PERFORMER in group.get("failure-message", "")
+
+        _eliminate(algod_client, app, 40, middle, dispenser)
+        assert _elimination_tracker(algod_client, app, 40) == [1, 2]
+    finally:
+        algod_client.set_timestamp_offset(0)
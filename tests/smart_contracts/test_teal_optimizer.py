@@ -0,0 +1,228 @@
+"""
+Peephole optimizer of the generated approval program (smart_contracts/teal_optimizer.py).
+
+Load deduplication and per-path costs are checked offline. The approval
+program of simple_challenge_contract.py is then assembled before and after
+optimizing on an AlgoKit LocalNet (dev mode), and the same calls are
+simulated and sent against both apps: results, logs and state changes must
+match. Those tests are skipped when LocalNet is unavailable.
+"""
+
+import base64
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from algosdk import abi, account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner, AtomicTransactionComposer, EmptySigner, TransactionWithSigner
+)
+from algosdk.kmd import KMDClient
+from algosdk.transaction import (
+    ApplicationCreateTxn, ApplicationOptInTxn, OnComplete, PaymentTxn, StateSchema, wait_for_confirmation
+)
+from algosdk.v2client import algod
+from algosdk.v2client.models import SimulateRequest
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from smart_contracts.simple_challenge_contract import (
+    METHODS, create_approval_program, create_clear_program, method_paths
+)
+from smart_contracts.teal_optimizer import (
+    assembled_size, dedup_loads, optimization_report, optimize, parse, program_size
+)
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "http://localhost:4001")
+KMD_SERVER = os.getenv("KMD_SERVER", "http://localhost:4002")
+LOCALNET_TOKEN = "a" * 64
+
+ABI_METHODS = {
+    signature.split("(")[0]: abi.Method.from_signature(signature) for signature, _ in METHODS
+}
+
+# Three identical load runs pay for a scratch slot, two do not
+REPEATED_LOAD = """
+    load 0
+    itob
+    len
+    pop
+"""
+
+def _program(*parts):
+    return "#pragma version 8\n" + "".join(parts) + "    int 1\n    return\n"
+
+def test_dedup_loads_caches_repeated_loads_in_a_block():
+    _, items = parse(_program(REPEATED_LOAD * 3))
+
+    deduped = dedup_loads(items)
+
+    assert deduped != items
+    assert [opcode for opcode, _ in deduped].count("itob") == 1
+
+def test_dedup_loads_does_not_cache_across_callsub():
+    # The subroutine stores to slot 0, so the load after it reads a new value
+    subroutine = """
+    retsub
+bump:
+    int 7
+    store 0
+    retsub
+"""
+    _, items = parse(_program(REPEATED_LOAD * 2, "    callsub bump\n", REPEATED_LOAD, subroutine))
+
+    assert dedup_loads(items) == items
+
+def test_optimized_program_costs_no_more_on_any_path():
+    source = create_approval_program()
+    optimized = optimize(source)
+
+    costs = optimization_report(source, optimized, method_paths())["costs"]
+    assert all(after <= before for before, after in costs.values()), costs
+    assert costs["create_challenge"][1] < costs["create_challenge"][0]
+    # No constant block runs on every call
+    assert not any(opcode.startswith(("intc", "bytec")) for opcode, _ in parse(optimized)[1])
+
+def test_clear_program_matches_approval_version():
+    # From version 6 on, an app cannot be created with differing versions
+    def version(teal):
+        return teal.strip().splitlines()[0]
+
+    assert version(create_clear_program()) == version(create_approval_program()) == "#pragma version 8"
+
+# ===== LOCALNET =====
+
+@pytest.fixture(scope="module")
+def algod_client():
+    client = algod.AlgodClient(LOCALNET_TOKEN, ALGOD_SERVER)
+    try:
+        client.status()
+    except Exception:
+        pytest.skip(f"LocalNet algod not reachable at {ALGOD_SERVER}")
+    return client
+
+@pytest.fixture(scope="module")
+def dispenser():
+    kmd = KMDClient(LOCALNET_TOKEN, KMD_SERVER)
+    try:
+        wallet_id = next(
+            w["id"] for w in kmd.list_wallets() if w["name"] == "unencrypted-default-wallet"
+        )
+    except Exception:
+        pytest.skip(f"LocalNet kmd not reachable at {KMD_SERVER}")
+
+    handle = kmd.init_wallet_handle(wallet_id, "")
+    try:
+        address = kmd.list_keys(handle)[0]
+        private_key = kmd.export_key(handle, "", address)
+    finally:
+        kmd.release_wallet_handle(handle)
+    return address, private_key
+
+def _compile(algod_client, teal):
+    return base64.b64decode(algod_client.compile(teal)["result"])
+
+def _create_app(algod_client, dispenser, approval_teal):
+    address, private_key = dispenser
+    txn = ApplicationCreateTxn(
+        sender=address,
+        sp=algod_client.suggested_params(),
+        on_complete=OnComplete.NoOpOC,
+        approval_program=_compile(algod_client, approval_teal),
+        clear_program=_compile(algod_client, create_clear_program()),
+        global_schema=StateSchema(num_uints=16, num_byte_slices=16),
+        local_schema=StateSchema(num_uints=4, num_byte_slices=0)
+    )
+    txid = algod_client.send_transaction(txn.sign(private_key))
+    return wait_for_confirmation(algod_client, txid, 4)["application-index"]
+
+def _new_account(algod_client, dispenser):
+    private_key, address = account.generate_account()
+    funder, funder_key = dispenser
+    txn = PaymentTxn(funder, algod_client.suggested_params(), address, 1_000_000)
+    wait_for_confirmation(algod_client, algod_client.send_transaction(txn.sign(funder_key)), 4)
+    return address, AccountTransactionSigner(private_key)
+
+def _compose(algod_client, app_id, sender, signer, method_name, args, opt_in=False):
+    atc = AtomicTransactionComposer()
+    if opt_in:
+        atc.add_transaction(TransactionWithSigner(
+            ApplicationOptInTxn(sender, algod_client.suggested_params(), app_id), signer
+        ))
+    atc.add_method_call(
+        app_id=app_id,
+        method=ABI_METHODS[method_name],
+        sender=sender,
+        sp=algod_client.suggested_params(),
+        signer=signer,
+        method_args=args
+    )
+    return atc
+
+def _outcome(group):
+    """What a simulated group did, without anything that depends on the program bytes."""
+    if "failure-message" in group:
+        # The message carries the failing pc, which moves when the program shrinks
+        return {"failed_at": group["failed-at"]}
+    return [
+        {
+            "logs": result["txn-result"].get("logs", []),
+            "global": sorted(result["txn-result"].get("global-state-delta", []), key=lambda d: d["key"]),
+            "local": [
+                sorted(delta["delta"], key=lambda d: d["key"])
+                for delta in result["txn-result"].get("local-state-delta", [])
+            ],
+        }
+        for result in group["txn-results"]
+    ]
+
+def _call(algod_client, app_id, sender, signer, method_name, args, opt_in=False):
+    """Simulate a call, send it if it passes, and return its outcome."""
+    probe = _compose(algod_client, app_id, sender, EmptySigner(), method_name, args, opt_in)
+    group = probe.simulate(
+        algod_client, SimulateRequest(txn_groups=[], allow_empty_signatures=True)
+    ).simulate_response["txn-groups"][0]
+    if "failure-message" not in group:
+        _compose(algod_client, app_id, sender, signer, method_name, args, opt_in).execute(algod_client, 4)
+    return _outcome(group)
+
+def test_optimization_report_measures_assembled_sizes(algod_client):
+    source = create_approval_program()
+    optimized = optimize(source)
+
+    report = optimization_report(source, optimized, method_paths(), algod_client)
+
+    assert report["assembled"]
+    assert report["size"] == (len(_compile(algod_client, source)), len(_compile(algod_client, optimized)))
+    # With every constant pushed, the estimate is the assembled size
+    assert program_size(optimized) == assembled_size(optimized, algod_client)
+
+def test_optimized_program_behaves_like_the_source(algod_client, dispenser):
+    source = create_approval_program()
+    apps = [
+        _create_app(algod_client, dispenser, source),
+        _create_app(algod_client, dispenser, optimize(source)),
+    ]
+    sender, signer = _new_account(algod_client, dispenser)
+
+    # Every method path, including a call that errs
+    calls = [
+        ("create_challenge", ["Run", "5k a day", 10, 1_700_000_000, 1_700_604_800], False),
+        ("join_challenge", [1, 100_000], True),
+        ("join_challenge", [2, 100_000], False),
+        ("complete_task", [1, 0], False),
+        ("process_elimination", [1], False),
+        ("distribute_pool", [1], False),
+        ("leave_challenge", [1], False),
+    ]
+    for method_name, args, opt_in in calls:
+        source_outcome, optimized_outcome = [
+            _call(algod_client, app_id, sender, signer, method_name, args, opt_in) for app_id in apps
+        ]
+        assert source_outcome == optimized_outcome, method_name
+
+    # create_challenge returns the new challenge id behind the ARC-4 return prefix
+    first = _call(algod_client, apps[1], sender, signer, "create_challenge", ["Walk", "", 5, 0, 0])
+    assert base64.b64decode(first[0]["logs"][-1]) == bytes.fromhex("151f7c75") + (2).to_bytes(8, "big")